@@ -0,0 +1,40 @@
+"""
+Time ``import board, busio`` in fresh interpreters, with the platform detection
+cache disabled and then with it warm.
+
+    python benchmarks/blinka_import.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+_IMPORT = "import board, busio"
+
+
+def import_time(runs, code=_IMPORT, **environ):
+    """Median wall time of ``runs`` interpreters running ``code``"""
+    env = dict(os.environ, **environ)
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    baseline = import_time(runs, BLINKA_PLATFORM_CACHE="0")
+    import_time(1)  # fill the cache
+    cached = import_time(runs)
+    empty = import_time(runs, "pass")
+    print("%-32s %8.1f ms" % ("interpreter start", 1000 * empty))
+    print("%-32s %8.1f ms" % ("import board, busio (no cache)", 1000 * baseline))
+    print("%-32s %8.1f ms" % ("import board, busio (cached)", 1000 * cached))
+
+
+if __name__ == "__main__":
+    main()
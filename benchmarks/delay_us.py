@@ -0,0 +1,57 @@
+"""
+Accuracy of microcontroller.delay_us against a plain time.sleep, for delays
+from 1 usec to 10 msecs:
+
+    python benchmarks/delay_us.py [repeats]
+
+Prints the median, 99th percentile and largest overshoot of each.
+"""
+
+import sys
+import time
+
+import microcontroller
+
+DELAYS_US = (1, 10, 50, 100, 500, 1000, 5000, 10000)
+
+
+def overshoots(delay_function, delay, repeats):
+    """Sorted overshoots in usecs of ``repeats`` calls of ``delay_function``"""
+    results = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        delay_function(delay)
+        results.append((time.perf_counter_ns() - start) / 1000 - delay)
+    results.sort()
+    return results
+
+
+def _sleep_us(delay):
+    time.sleep(delay / 1e6)
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    microcontroller.delay_us(1)  # calibrate
+
+    print("delay us   function     median us    p99 us    max us")
+    for delay in DELAYS_US:
+        for label, function in (
+            ("time.sleep", _sleep_us),
+            ("delay_us", microcontroller.delay_us),
+        ):
+            results = overshoots(function, delay, repeats)
+            print(
+                "%8d   %-10s %10.1f %9.1f %9.1f"
+                % (
+                    delay,
+                    label,
+                    results[len(results) // 2],
+                    results[len(results) * 99 // 100],
+                    results[-1],
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Press detection latency of keypad.Keys, scanning versus kernel edge events.
+Wire an output pin to an input pin, the output then plays the key:
+
+    python benchmarks/keypad_latency.py D17 D27 [presses]
+
+The first pin is driven, the second one is scanned by Keys.
+"""
+
+import statistics
+import sys
+import time
+
+import board
+import digitalio
+import keypad
+
+
+def measure(key, output, presses, edge_events):
+    """Latencies in seconds from driving the pin low until the press event"""
+    keys = keypad.Keys(
+        (key,), value_when_pressed=False, pull=True, edge_events=edge_events
+    )
+    latencies = []
+    try:
+        time.sleep(0.1)
+        keys.events.clear()
+        for _ in range(presses):
+            start = time.perf_counter()
+            output.value = False
+            while not keys.events:
+                pass
+            latencies.append(time.perf_counter() - start)
+            keys.events.clear()
+            output.value = True
+            time.sleep(0.05)  # let it settle and report the release
+            keys.events.clear()
+    finally:
+        keys.deinit()
+    return latencies
+
+
+def main():
+    output_pin = getattr(board, sys.argv[1])
+    key_pin = getattr(board, sys.argv[2])
+    presses = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    output = digitalio.DigitalInOut(output_pin)
+    output.switch_to_output(value=True)
+
+    for label, edge_events in (("scanning", False), ("edge events", True)):
+        latencies = measure(key_pin, output, presses, edge_events)
+        print(
+            "%-12s median %8.3f ms  max %8.3f ms"
+            % (
+                label,
+                1000 * statistics.median(latencies),
+                1000 * max(latencies),
+            )
+        )
+    output.deinit()
+
+
+if __name__ == "__main__":
+    main()
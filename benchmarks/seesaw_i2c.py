@@ -0,0 +1,70 @@
+"""
+Seesaw I2C transactions per second through whatever ``busio.I2C`` Blinka picks
+for this host (e.g. set ``BLINKA_MCP2221=1`` to go through an MCP2221).
+
+    python benchmarks/seesaw_i2c.py [address ...]
+
+Defaults to the first NeoTrellis address, 0x2E.
+"""
+
+import sys
+import time
+
+import board
+import busio
+from adafruit_seesaw.seesaw import Seesaw
+
+_KEYPAD_BASE = 0x10
+_KEYPAD_COUNT = 0x04
+_NEOPIXEL_BASE = 0x0E
+_NEOPIXEL_BUF = 0x04
+
+
+def rate(label, func, seconds=2.0):
+    """Call func for the given time and print the calls per second"""
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        func()
+        count += 1
+    elapsed = time.perf_counter() - start
+    print("%-40s %8.1f /s  %7.3f ms" % (label, count / elapsed, 1000 * elapsed / count))
+
+
+def main():
+    addresses = [int(arg, 0) for arg in sys.argv[1:]] or [0x2E]
+    i2c = busio.I2C(board.SCL, board.SDA)
+    seesaws = [Seesaw(i2c, addr) for addr in addresses]
+    pixels = bytearray(24)
+    count = bytearray(1)
+
+    for seesaw in seesaws:
+        addr = seesaw.i2c_device.device_address
+        rate(
+            "0x%02x write (24 byte pixel chunk)" % addr,
+            lambda ss=seesaw: ss.write(_NEOPIXEL_BASE, _NEOPIXEL_BUF, pixels),
+        )
+        rate(
+            "0x%02x read (keypad count, no delay)" % addr,
+            lambda ss=seesaw: ss.read(_KEYPAD_BASE, _KEYPAD_COUNT, count, delay=0),
+        )
+
+    if hasattr(i2c, "batch"):
+        writes = [
+            (addr, bytes((_NEOPIXEL_BASE, _NEOPIXEL_BUF)) + pixels, None)
+            for addr in addresses
+        ]
+
+        def batch():
+            while not i2c.try_lock():
+                pass
+            try:
+                i2c.batch(writes)
+            finally:
+                i2c.unlock()
+
+        rate("batch of %d pixel chunk writes" % len(writes), batch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Scan rate of keypad.ShiftRegisterKeys for 8, 32 and 64 key chains, clocked
+through GPIO and through SPI. Wire a 74HC165 chain (or nothing, the rate does
+not depend on what is read) to the pins:
+
+    python benchmarks/shift_register_keys.py CLOCK DATA LATCH [scans]
+
+The SPI runs use board.SPI() with LATCH; its SCK and MISO take the place of
+CLOCK and DATA.
+"""
+
+import sys
+import time
+
+import board
+import keypad
+
+
+def scan_rate(scans, **kwargs):
+    """Scans per second of a ShiftRegisterKeys made with ``kwargs``"""
+    # a long interval parks the scanning thread, the scans are run here
+    keys = keypad.ShiftRegisterKeys(
+        value_when_pressed=False, interval=3600, max_events=256, **kwargs
+    )
+    try:
+        scan = keys._keypad_shiftregisterkeys_scan  # pylint: disable=protected-access
+        scan()
+        start = time.perf_counter()
+        for _ in range(scans):
+            scan()
+        return scans / (time.perf_counter() - start)
+    finally:
+        keys.deinit()
+
+
+def main():
+    clock, data, latch = (getattr(board, name) for name in sys.argv[1:4])
+    scans = int(sys.argv[4]) if len(sys.argv) > 4 else 200
+    spi = board.SPI()
+
+    print("keys        gpio scans/s   spi scans/s")
+    for key_count in (8, 32, 64):
+        gpio = scan_rate(
+            scans, clock=clock, data=data, latch=latch, key_count=key_count
+        )
+        spi_rate = scan_rate(scans, spi=spi, latch=latch, key_count=key_count)
+        print("%4d %17.0f %13.0f" % (key_count, gpio, spi_rate))
+    spi.deinit()
+
+
+if __name__ == "__main__":
+    main()
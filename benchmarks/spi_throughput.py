@@ -0,0 +1,63 @@
+"""
+SPI throughput for LED strip and display sized writes, and for full duplex
+transfers, through busio.SPI on board.SPI():
+
+    python benchmarks/spi_throughput.py [baudrate] [seconds]
+
+Nothing needs to be connected; the default baudrate is 8 MHz.
+"""
+
+import sys
+import time
+
+import board
+
+PAYLOADS = (
+    ("DotStar strip, 60 LEDs", 4 + 60 * 4 + 4),
+    ("DotStar strip, 300 LEDs", 4 + 300 * 4 + 20),
+    ("240x240 RGB565 frame", 240 * 240 * 2),
+    ("320x480 RGB565 frame", 320 * 480 * 2),
+)
+
+
+def rate(operation, nbytes, seconds):
+    """Operations per second and megabytes per second of ``operation``"""
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        operation()
+        count += 1
+    elapsed = time.perf_counter() - start
+    return count / elapsed, count * nbytes / elapsed / 1e6
+
+
+def main():
+    baudrate = int(sys.argv[1]) if len(sys.argv) > 1 else 8000000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    spi = board.SPI()
+    while not spi.try_lock():
+        pass
+    spi.configure(baudrate=baudrate)
+    print("wire limit at %d Hz: %.2f MB/s\n" % (baudrate, baudrate / 8 / 1e6))
+    print("%-26s %-14s %10s %8s" % ("payload", "operation", "ops/s", "MB/s"))
+    try:
+        for label, nbytes in PAYLOADS:
+            buffer_out = bytearray(nbytes)
+            buffer_in = bytearray(nbytes)
+            for operation, function in (
+                ("write", lambda: spi.write(buffer_out)),
+                ("readinto", lambda: spi.readinto(buffer_in)),
+                ("write_readinto", lambda: spi.write_readinto(buffer_out, buffer_in)),
+            ):
+                per_second, megabytes = rate(function, nbytes, seconds)
+                print(
+                    "%-26s %-14s %10.1f %8.2f"
+                    % (label, operation, per_second, megabytes)
+                )
+    finally:
+        spi.unlock()
+        spi.deinit()
+
+
+if __name__ == "__main__":
+    main()
@@ -151,8 +151,15 @@ class I2CDevice:
     # pylint: enable-msg=too-many-arguments
 
     def __enter__(self) -> "I2CDevice":
+        tracer = getattr(self.i2c, "tracer", None)
+        if tracer is None:
+            while not self.i2c.try_lock():
+                time.sleep(0)
+            return self
+        start = time.perf_counter()
         while not self.i2c.try_lock():
             time.sleep(0)
+        tracer.record_lock_wait(self.device_address, start, time.perf_counter())
         return self
 
     def __exit__(
@@ -0,0 +1,233 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bus_device.i2c_scheduler` - Prioritized I2C transactions
+=====================================================================
+"""
+
+import time
+
+try:
+    from typing import List, Optional, Tuple
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+
+    # Used only for type annotations.
+    from busio import I2C
+except ImportError:
+    pass
+
+PRIORITY_HIGH = 0
+"""Input polling and anything else that should not wait"""
+PRIORITY_LOW = 1
+"""Bulk output such as LED data, run from `I2CScheduler.service`"""
+
+
+class _Job:
+    """Queued operations and where the scheduler got to with them."""
+
+    def __init__(self, operations, priority, key, submitted):
+        self.operations = operations
+        self.priority = priority
+        self.key = key
+        self.submitted = submitted
+        self.position = 0
+
+
+class I2CScheduler:
+    """
+    Shares one I2C bus between urgent transactions and bulk output.
+
+    The scheduler can be used wherever a `busio.I2C` is expected (e.g. by
+    `adafruit_bus_device.i2c_device.I2CDevice`); those transactions run right away
+    at high priority. Bulk work is queued with `submit` as lists of
+    ``(address, buffer_out, buffer_in)`` operations and runs from `service`,
+    ``chunk`` operations per bus lock, until the frame budget is used up. The bus
+    is released between chunks, so other users get it at chunk boundaries.
+
+    :param ~busio.I2C i2c: The I2C bus to schedule
+    :param float frame_budget: Bus time in seconds per `service` call, including
+      the time used by high priority transactions since the previous call
+    :param int chunk: Number of queued operations run per bus lock
+
+    Example:
+
+    .. code-block:: python
+
+        bus = I2CScheduler(busio.I2C(SCL, SDA), frame_budget=0.005)
+        trellis = MultiTrellis([[NeoTrellis(bus, addr=0x2E), ...], ...])
+
+        while True:
+            trellis.sync()  # key polls go out right away
+            trellis.show()  # LED data is queued
+            bus.service()  # and sent within the budget
+    """
+
+    def __init__(
+        self, i2c: I2C, *, frame_budget: float = 0.005, chunk: int = 4
+    ) -> None:
+        self.i2c = i2c
+        self.frame_budget = frame_budget
+        self.chunk = chunk
+        self._queues = ([], [])
+        self._lock_start = None
+        self._contended_since = None
+        self._frame_used = 0.0
+        self.reset_statistics()
+
+    def reset_statistics(self) -> None:
+        """Clear the counters reported by `statistics`"""
+        self._max_depth = 0
+        self._waits = [[0, 0.0, 0.0], [0, 0.0, 0.0]]  # count, total, max
+        self._bus_time = [0.0, 0.0]
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of queued jobs that did not finish yet"""
+        return len(self._queues[0]) + len(self._queues[1])
+
+    @property
+    def statistics(self) -> dict:
+        """Queue depth, wait times (from `submit` to the first operation on the bus)
+        and bus time in seconds, per priority"""
+        stats = {"queue_depth": self.queue_depth, "max_queue_depth": self._max_depth}
+        for priority, name in ((PRIORITY_HIGH, "high"), (PRIORITY_LOW, "low")):
+            count, total, longest = self._waits[priority]
+            stats[name] = {
+                "jobs": count,
+                "wait_avg": total / count if count else 0.0,
+                "wait_max": longest,
+                "bus_time": self._bus_time[priority],
+            }
+        return stats
+
+    def submit(
+        self,
+        operations: List[
+            Tuple[int, Optional[ReadableBuffer], Optional[WriteableBuffer]]
+        ],
+        priority: int = PRIORITY_LOW,
+        key: object = None,
+    ) -> None:
+        """Queue ``(address, buffer_out, buffer_in)`` operations.
+
+        If ``key`` is given and a job with the same key is still waiting, its
+        operations are replaced instead, so a redraw that has not gone out yet
+        is superseded by the newer one.
+        """
+        queue = self._queues[priority]
+        if key is not None:
+            for job in queue:
+                if job.key == key and job.position == 0:
+                    job.operations = operations
+                    return
+        queue.append(_Job(operations, priority, key, time.monotonic()))
+        self._max_depth = max(self._max_depth, self.queue_depth)
+
+    def service(self) -> bool:
+        """Run queued operations, high priority first, until the frame budget is
+        used up. At least one chunk runs per call, so queued work is never starved.
+        Returns True when the queues are empty."""
+        start = time.monotonic()
+        budget = self.frame_budget - self._frame_used
+        ran = False
+        for queue in self._queues:
+            while queue and (not ran or time.monotonic() - start < budget):
+                ran = True
+                job = queue[0]
+                if job.position == 0:
+                    self._record_wait(job.priority, time.monotonic() - job.submitted)
+                chunk = job.operations[job.position : job.position + self.chunk]
+                while not self.i2c.try_lock():
+                    time.sleep(0)
+                chunk_start = time.monotonic()
+                try:
+                    self._run(chunk)
+                finally:
+                    self.i2c.unlock()
+                    self._bus_time[job.priority] += time.monotonic() - chunk_start
+                job.position += len(chunk)
+                if job.position >= len(job.operations):
+                    queue.pop(0)
+        self._frame_used = 0.0
+        return not self.queue_depth
+
+    def _record_wait(self, priority, wait):
+        waits = self._waits[priority]
+        waits[0] += 1
+        waits[1] += wait
+        waits[2] = max(waits[2], wait)
+
+    def _run(self, operations):
+        if hasattr(self.i2c, "batch"):
+            self.i2c.batch(operations)
+            return
+        for address, buffer_out, buffer_in in operations:
+            if buffer_in is None:
+                self.i2c.writeto(address, buffer_out)
+            elif buffer_out is None:
+                self.i2c.readfrom_into(address, buffer_in)
+            else:
+                self.i2c.writeto_then_readfrom(address, buffer_out, buffer_in)
+
+    # busio.I2C interface, used for high priority transactions
+
+    @property
+    def tracer(self):
+        """The ``tracer`` of the scheduled bus, see `busio.I2C`"""
+        return getattr(self.i2c, "tracer", None)
+
+    @tracer.setter
+    def tracer(self, tracer) -> None:
+        self.i2c.tracer = tracer
+
+    def try_lock(self) -> bool:
+        """Lock the bus for a high priority transaction"""
+        now = time.monotonic()
+        if not self.i2c.try_lock():
+            if self._contended_since is None:
+                self._contended_since = now
+            return False
+        if self._contended_since is None:
+            self._record_wait(PRIORITY_HIGH, 0.0)
+        else:
+            self._record_wait(PRIORITY_HIGH, now - self._contended_since)
+            self._contended_since = None
+        self._lock_start = now
+        return True
+
+    def unlock(self) -> None:
+        """Release the bus and account the time it was held"""
+        if self._lock_start is not None:
+            used = time.monotonic() - self._lock_start
+            self._lock_start = None
+            self._frame_used += used
+            self._bus_time[PRIORITY_HIGH] += used
+        self.i2c.unlock()
+
+    def scan(self) -> List[int]:
+        """Scan the bus for devices"""
+        return self.i2c.scan()
+
+    def writeto(self, address: int, buffer: ReadableBuffer, **kwargs) -> None:
+        """Write to a device, see `busio.I2C.writeto`"""
+        self.i2c.writeto(address, buffer, **kwargs)
+
+    def readfrom_into(self, address: int, buffer: WriteableBuffer, **kwargs) -> None:
+        """Read from a device, see `busio.I2C.readfrom_into`"""
+        self.i2c.readfrom_into(address, buffer, **kwargs)
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        buffer_out: ReadableBuffer,
+        buffer_in: WriteableBuffer,
+        **kwargs
+    ) -> None:
+        """Write to and read from a device, see `busio.I2C.writeto_then_readfrom`"""
+        self.i2c.writeto_then_readfrom(address, buffer_out, buffer_in, **kwargs)
+
+    def batch(self, operations) -> None:
+        """Run operations right away, see `busio.I2C.batch`"""
+        self._run(operations)
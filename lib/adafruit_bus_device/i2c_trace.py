@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bus_device.i2c_trace` - I2C transaction counters and trace
+=====================================================================
+"""
+
+try:
+    from typing import Dict, Iterator, List, Optional, Tuple
+except ImportError:
+    pass
+
+try:
+    from threading import local as _local
+except ImportError:
+
+    class _local:  # pylint: disable=invalid-name,too-few-public-methods
+        """Without threads a plain namespace holds the label"""
+
+HISTOGRAM_BUCKETS = 24
+"""Bucket ``i`` of a latency histogram counts transactions that took less than
+``2 ** i`` microseconds (and at least ``2 ** (i - 1)``); the last bucket counts
+everything longer."""
+
+
+def _stats_key(item):
+    """Sort statistics by address, with batches across devices first"""
+    (address, operation), _ = item
+    return (-1 if address is None else address, operation)
+
+
+class _Label:
+    """Context manager returned by `I2CTracer.label`"""
+
+    def __init__(self, tracer, name):
+        self._tracer = tracer
+        self._name = name
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = self._tracer.current_label
+        self._tracer.current_label = self._name
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._tracer.current_label = self._previous
+        return False
+
+
+class I2CTracer:
+    """
+    Counts I2C transactions per device address and operation, keeps a latency
+    histogram for each, and records the last ``trace_length`` transactions.
+
+    Tracing is opt-in: assign the tracer to the ``tracer`` attribute of a Blinka
+    `busio.I2C` (or of an `I2CScheduler` wrapping one). Every ``"write"``,
+    ``"read"`` and ``"write_then_readinto"`` on the bus is then recorded, and
+    `I2CDevice` adds the time spent waiting for the bus lock as ``"lock"``.
+    A `busio.I2C.batch` run as one combined transaction is recorded once, as
+    ``"batch"``, under `None` instead of an address if it spans several devices.
+    Totals are also kept per `label`, to tell which part of a program the bus
+    time goes to. Labels are kept per thread.
+
+    :param int trace_length: Number of transactions kept by `trace`
+
+    Example:
+
+    .. code-block:: python
+
+        i2c = busio.I2C(SCL, SDA)
+        i2c.tracer = tracer = I2CTracer()
+
+        with tracer.label("sync"):
+            trellis.sync()
+        with tracer.label("redraw"):
+            trellis.show()
+        print(tracer.summary())
+    """
+
+    def __init__(self, trace_length: int = 64) -> None:
+        self.trace_length = trace_length
+        self._local = _local()
+        self.reset()
+
+    @property
+    def current_label(self) -> Optional[str]:
+        """The label of the innermost `label` block of the calling thread"""
+        return getattr(self._local, "label", None)
+
+    @current_label.setter
+    def current_label(self, name: Optional[str]) -> None:
+        self._local.label = name
+
+    def reset(self) -> None:
+        """Clear all counters, histograms and the trace"""
+        self._stats = {}
+        self._labels = {}
+        self._trace = [None] * self.trace_length
+        self._next = 0
+
+    def label(self, name: str) -> _Label:
+        """Attribute the transactions in a ``with`` block to ``name``"""
+        return _Label(self, name)
+
+    def record(
+        self,
+        address: Optional[int],
+        operation: str,
+        nbytes: int,
+        start: float,
+        end: float,
+    ) -> None:
+        """Record one transaction. ``start`` and ``end`` are `time.perf_counter`
+        values."""
+        duration = end - start
+        key = (address, operation)
+        stats = self._stats.get(key)
+        if stats is None:
+            # count, bytes, total time, longest, histogram
+            stats = self._stats[key] = [0, 0, 0.0, 0.0, [0] * HISTOGRAM_BUCKETS]
+        stats[0] += 1
+        stats[1] += nbytes
+        stats[2] += duration
+        if duration > stats[3]:
+            stats[3] = duration
+        bucket = int(duration * 1000000).bit_length()
+        stats[4][min(bucket, HISTOGRAM_BUCKETS - 1)] += 1
+
+        label = self.current_label
+        totals = self._labels.get(label)
+        if totals is None:
+            totals = self._labels[label] = [0, 0, 0.0]
+        totals[0] += 1
+        totals[1] += nbytes
+        totals[2] += duration
+
+        if self.trace_length:
+            entry = (start, address, operation, nbytes, duration, label)
+            self._trace[self._next] = entry
+            self._next = (self._next + 1) % self.trace_length
+
+    def record_lock_wait(self, address: int, start: float, end: float) -> None:
+        """Record the time a device waited for the bus lock"""
+        self.record(address, "lock", 0, start, end)
+
+    @property
+    def statistics(self) -> Dict[Optional[int], Dict[str, dict]]:
+        """Count, bytes, total and longest time in seconds and the latency histogram
+        per address and operation"""
+        result = {}
+        for (address, operation), stats in self._stats.items():
+            count, nbytes, total, longest, histogram = stats
+            result.setdefault(address, {})[operation] = {
+                "count": count,
+                "bytes": nbytes,
+                "time": total,
+                "max": longest,
+                "histogram": list(histogram),
+            }
+        return result
+
+    @property
+    def labels(self) -> Dict[Optional[str], dict]:
+        """Count, bytes and total time in seconds per label; `None` holds the
+        transactions made outside of any `label` block"""
+        return {
+            label: {"count": count, "bytes": nbytes, "time": total}
+            for label, (count, nbytes, total) in self._labels.items()
+        }
+
+    @property
+    def trace(
+        self,
+    ) -> List[Tuple[float, Optional[int], str, int, float, Optional[str]]]:
+        """The last transactions, oldest first, as ``(start, address, operation,
+        bytes, duration, label)`` tuples"""
+        return [
+            entry
+            for entry in self._trace[self._next :] + self._trace[: self._next]
+            if entry is not None
+        ]
+
+    def _summary_lines(self) -> Iterator[str]:
+        yield "addr  operation            count     bytes   total ms  max ms"
+        for (address, operation), stats in sorted(self._stats.items(), key=_stats_key):
+            count, nbytes, total, longest, _ = stats
+            yield "%-4s  %-19s %6d %9d %10.2f %7.2f" % (
+                "-" if address is None else "0x%02x" % address,
+                operation,
+                count,
+                nbytes,
+                total * 1000,
+                longest * 1000,
+            )
+        yield ""
+        yield "label                count     bytes   total ms"
+        for label, (count, nbytes, total) in self._labels.items():
+            yield "%-19s %6d %9d %10.2f" % (label, count, nbytes, total * 1000)
+
+    def summary(self) -> str:
+        """The counters and label totals as a table"""
+        return "\n".join(self._summary_lines())
@@ -180,6 +180,22 @@ class Keyboard:
         # get_last_received_report() returns None when nothing was received
         return self._keyboard_device.get_last_received_report() or b"\x00"
 
+    def on_led_change(self, callback) -> None:
+        """Call ``callback(led_status)`` whenever the host changes the keyboard LEDs.
+        ``led_status`` is the LED bitmap as an `int`.
+
+        Only available when the device supports ``add_report_listener()`` (Blinka on Linux).
+        The report is then read in the background, so ``led_status`` and ``led_on()``
+        no longer touch the device.
+
+        Example::
+
+            kbd.on_led_change(
+                lambda leds: print(bool(leds & Keyboard.LED_CAPS_LOCK))
+            )
+        """
+        self._keyboard_device.add_report_listener(lambda report: callback(report[0]))
+
     def led_on(self, led_code: int) -> bool:
         """Returns whether an LED is on based on the led code
 
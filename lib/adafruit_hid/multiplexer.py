@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.multiplexer.Multiplexer`
+====================================================
+
+Queue HID reports from `Keyboard`, `Mouse` and `ConsumerControl` and send them
+from one place, so the code that presses keys never waits on the USB device.
+"""
+
+from __future__ import annotations
+
+from . import find_device
+
+try:
+    from typing import Sequence, List, Optional, Tuple
+    import usb_hid
+except ImportError:
+    pass
+
+# Order in which pending reports are written by service().
+_PRIORITY = (
+    (0x01, 0x06),  # keyboard
+    (0x0C, 0x01),  # consumer control
+    (0x01, 0x02),  # mouse
+)
+_MOUSE = (0x01, 0x02)
+
+
+class _QueuedDevice:
+    """Stands in for a HID device: ``send_report()`` only queues the report."""
+
+    def __init__(self, device: usb_hid.Device) -> None:
+        self.device = device
+        self.usage_page = device.usage_page
+        self.usage = device.usage
+        self.pending: List[Tuple[bytearray, Optional[int]]] = []
+        self._merge_deltas = (device.usage_page, device.usage) == _MOUSE
+
+    def send_report(self, report: bytearray, report_id: int = None) -> None:
+        """Queue a copy of the report with its report id. Mouse movement with
+        unchanged buttons is added to the pending report, repeating the pending
+        keyboard or consumer control state is a no-op."""
+        pending = self.pending
+        if pending and pending[-1][1] == report_id:
+            last = pending[-1][0]
+            if self._merge_deltas:
+                # mouse reports are relative, equal ones still have to add up
+                if last[0] == report[0] and self._merge(last, report):
+                    return
+            elif last == report:
+                return
+        pending.append((bytearray(report), report_id))
+
+    @staticmethod
+    def _merge(last: bytearray, report: bytearray) -> bool:
+        """Add the x, y and wheel deltas of report to last, if they still fit."""
+        merged = []
+        for i in range(1, 4):
+            value = _signed(last[i]) + _signed(report[i])
+            if not -127 <= value <= 127:
+                return False
+            merged.append(value & 0xFF)
+        last[1:4] = bytes(merged)
+        return True
+
+    def get_last_received_report(self, report_id: int = None) -> bytes:
+        """Received reports are not queued, read them from the real device."""
+        return self.device.get_last_received_report(report_id)
+
+    def add_report_listener(self, callback=None) -> None:
+        """Received reports are not queued, listen on the real device."""
+        self.device.add_report_listener(callback)
+
+    def remove_report_listener(self) -> None:
+        """Stop listening on the real device."""
+        self.device.remove_report_listener()
+
+
+def _signed(value: int) -> int:
+    return value - 256 if value > 127 else value
+
+
+class Multiplexer:
+    """Collect HID reports from several devices and write them with `service()`.
+
+    Pass `devices` instead of ``usb_hid.devices`` to `Keyboard`, `Mouse` and
+    `ConsumerControl`. Their reports are then only queued, and `service()`, called
+    once per main loop iteration, writes them: keyboard first, then consumer control,
+    then mouse. Pending mouse reports with the same buttons are merged into one.
+
+    Example::
+
+        import usb_hid
+        from adafruit_hid.keyboard import Keyboard
+        from adafruit_hid.mouse import Mouse
+        from adafruit_hid.multiplexer import Multiplexer
+
+        hid = Multiplexer(usb_hid.devices)
+        kbd = Keyboard(hid.devices)
+        mouse = Mouse(hid.devices)
+
+        while True:
+            ...  # callbacks use kbd and mouse as usual
+            hid.service()
+    """
+
+    def __init__(self, devices: Sequence[usb_hid.Device]) -> None:
+        if hasattr(devices, "send_report"):
+            devices = [devices]  # type: ignore
+        self.devices = []
+        for usage_page, usage in _PRIORITY:
+            try:
+                device = find_device(devices, usage_page=usage_page, usage=usage)
+            except ValueError:
+                continue
+            queued = _QueuedDevice(device)
+            self.devices.append(queued)
+
+    @property
+    def pending(self) -> int:
+        """Number of reports waiting for `service()`."""
+        return sum(len(queued.pending) for queued in self.devices)
+
+    def service(self) -> int:
+        """Write all pending reports in priority order. Returns the number written."""
+        written = 0
+        for queued in self.devices:
+            pending = queued.pending
+            while pending:
+                report, report_id = pending[0]
+                queued.device.send_report(report, report_id)
+                pending.pop(0)
+                written += 1
+        return written
@@ -36,8 +36,20 @@ from time import sleep
 from micropython import const
 from adafruit_seesaw.keypad import KeyEvent
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
 _NEO_TRELLIS_NUM_KEYS = const(16)
 
+_KEYPAD_BASE = const(0x10)
+_KEYPAD_COUNT = const(0x04)
+_KEYPAD_FIFO = const(0x10)
+
+# same as the default delay of Seesaw.read()
+_READ_DELAY = 0.008
+
 
 def _key(xval):
     return int(int(xval / 4) * 8 + (xval % 4))
@@ -48,12 +60,43 @@ def _seesaw_key(xval):
 
 
 class MultiTrellis:
-    """Driver for multiple connected Adafruit NeoTrellis boards."""
+    """Driver for multiple connected Adafruit NeoTrellis boards.
 
-    def __init__(self, neotrellis_array):
+    The boards may be spread over several I2C buses. Their traffic then
+    overlaps: on CPython each bus is serviced from its own worker thread, on
+    CircuitPython the key reads of all buses are interleaved so they share
+    the waits for the seesaw. Set ``threads`` to False to always interleave."""
+
+    def __init__(self, neotrellis_array, *, threads=True):
         self._trelli = neotrellis_array
         self._rows = len(neotrellis_array)
         self._cols = len(neotrellis_array[0])
+        # [(bus, [(row, col, trellis), ...]), ...], trellis boards with a data
+        # ready pin are serviced one by one
+        self._batches = []
+        self._unbatched = []
+        for _n in range(self._rows):
+            for _m in range(self._cols):
+                _t = self._trelli[_n][_m]
+                bus = _t.i2c_device.i2c
+                if _t._drdy is not None:
+                    self._unbatched.append((_n, _m, _t))
+                    continue
+                for batch_bus, tiles in self._batches:
+                    if batch_bus is bus:
+                        tiles.append((_n, _m, _t))
+                        break
+                else:
+                    self._batches.append((bus, [(_n, _m, _t)]))
+        self._executor = None
+        if threads and ThreadPoolExecutor is not None and len(self._batches) > 1:
+            self._executor = ThreadPoolExecutor(max_workers=len(self._batches))
+
+    def deinit(self):
+        """Stop the bus worker threads"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def activate_key(self, x, y, edge, enable=True):
         """Activate or deactivate a key on the trellis. x and y are the index
@@ -81,30 +124,124 @@ class MultiTrellis:
 
     def sync(self):
         """Read all trellis boards in the matrix and call any callbacks"""
-        for _n in range(self._rows):
-            for _m in range(self._cols):
+        if self._executor is not None:
+            results = self._executor.map(
+                lambda batch: self._read_events([batch]), self._batches
+            )
+            events = [event for result in results for event in result]
+        else:
+            events = self._read_events(self._batches)
+        for _n, _m, _t, buf in events:
+            self._dispatch(_n, _m, _t, buf)
 
-                _t = self._trelli[_n][_m]
-                available = _t.count
-                sleep(0.0005)
-                if available > 0:
-                    available = available + 2
-                    buf = _t.read_keypad(available)
-                    for raw in buf:
-                        evt = KeyEvent(_seesaw_key((raw >> 2) & 0x3F), raw & 0x3)
-                        if (
-                            evt.number < _NEO_TRELLIS_NUM_KEYS
-                            and _t.callbacks[evt.number] is not None
-                        ):
-                            y = int(evt.number / 4) + _n * 4
-                            x = int(evt.number % 4) + _m * 4
-                            _t.callbacks[evt.number](x, y, evt.edge)
+        for _n, _m, _t in self._unbatched:
+            available = _t.count
+            sleep(0.0005)
+            if available > 0:
+                available = available + 2
+                self._dispatch(_n, _m, _t, _t.read_keypad(available))
+
+    @staticmethod
+    def _dispatch(_n, _m, _t, buf):
+        for raw in buf:
+            evt = KeyEvent(_seesaw_key((raw >> 2) & 0x3F), raw & 0x3)
+            if (
+                evt.number < _NEO_TRELLIS_NUM_KEYS
+                and _t.callbacks[evt.number] is not None
+            ):
+                y = int(evt.number / 4) + _n * 4
+                x = int(evt.number % 4) + _m * 4
+                _t.callbacks[evt.number](x, y, evt.edge)
+
+    def _read_events(self, batches):
+        """Read the keypad FIFOs of the tiles on the given buses. Returns
+        ``(row, col, trellis, buffer)`` for each tile with events."""
+        counts = [[bytearray(1) for _ in tiles] for _, tiles in batches]
+        self._batch_read(
+            [(bus, tiles, bufs) for (bus, tiles), bufs in zip(batches, counts)],
+            _KEYPAD_COUNT,
+        )
+        sleep(0.0005)
+        reads = []
+        events = []
+        for (bus, tiles), bus_counts in zip(batches, counts):
+            pending = []
+            bufs = []
+            for (_n, _m, _t), count in zip(tiles, bus_counts):
+                if count[0] > 0:
+                    buf = bytearray(count[0] + 2)
+                    pending.append((_n, _m, _t))
+                    bufs.append(buf)
+                    events.append((_n, _m, _t, buf))
+            if pending:
+                reads.append((bus, pending, bufs))
+        if reads:
+            self._batch_read(reads, _KEYPAD_FIFO)
+        return events
+
+    def _batch_read(self, reads, reg):
+        """Select the keypad register on all tiles of all ``(bus, tiles, bufs)``
+        reads, wait once, then read them all"""
+        select = bytes((_KEYPAD_BASE, reg))
+        for bus, tiles, _ in reads:
+            self._batch(
+                bus,
+                [(_t.i2c_device.device_address, select, None) for _, _, _t in tiles],
+            )
+        sleep(_READ_DELAY)
+        for bus, tiles, bufs in reads:
+            self._batch(
+                bus,
+                [
+                    (_t.i2c_device.device_address, None, buf)
+                    for (_, _, _t), buf in zip(tiles, bufs)
+                ],
+            )
+
+    @staticmethod
+    def _batch(bus, operations):
+        while not bus.try_lock():
+            sleep(0)
+        try:
+            if hasattr(bus, "batch"):
+                bus.batch(operations)
+                return
+            # e.g. busio.I2C on CircuitPython, one transaction at a time
+            for address, buffer_out, buffer_in in operations:
+                if buffer_in is None:
+                    bus.writeto(address, buffer_out)
+                elif buffer_out is None:
+                    bus.readfrom_into(address, buffer_in)
+                else:
+                    bus.writeto_then_readfrom(address, buffer_out, buffer_in)
+        finally:
+            bus.unlock()
 
     def show(self):
         """Show the colors on the NeoPixels"""
-        for _n in range(self._rows):
-            for _m in range(self._cols):
-                self._trelli[_n][_m].show()
+        writes = []
+        for bus, tiles in self._batches:
+            operations = []
+            for _, _, _t in tiles:
+                _t.pixels.batch = operations
+                try:
+                    _t.show()
+                finally:
+                    _t.pixels.batch = None
+            if hasattr(bus, "submit"):
+                # an I2CScheduler sends it from service(), replacing a
+                # previous frame that did not go out yet
+                bus.submit(operations, key=self)
+            elif self._executor is not None:
+                writes.append(self._executor.submit(self._batch, bus, operations))
+            else:
+                self._batch(bus, operations)
+
+        for write in writes:
+            write.result()
+
+        for _, _, _t in self._unbatched:
+            _t.show()
 
     @property
     def brightness(self):
@@ -95,6 +95,9 @@ class NeoPixel(PixelBuf):
         cmd = struct.pack(">H", n * self.bpp)
         self._seesaw.write(_NEOPIXEL_BASE, _NEOPIXEL_BUF_LENGTH, cmd)
         self.output_buffer = bytearray(_OUTPUT_BUFFER_SIZE)
+        # When set to a list, show() appends the I2C writes to it as
+        # (address, buffer, None) operations instead of sending them.
+        self.batch = None
 
     def _transmit(self, buffer: bytearray) -> None:
         """Update the pixels even if auto_write is False"""
@@ -103,9 +106,18 @@ class NeoPixel(PixelBuf):
         for i in range(0, len(buffer), step):
             self.output_buffer[0:2] = struct.pack(">H", i)
             self.output_buffer[2:] = buffer[i : i + step]
-            self._seesaw.write(_NEOPIXEL_BASE, _NEOPIXEL_BUF, self.output_buffer)
-
-        self._seesaw.write(_NEOPIXEL_BASE, _NEOPIXEL_SHOW)
+            self._write(_NEOPIXEL_BUF, self.output_buffer)
+
+        self._write(_NEOPIXEL_SHOW)
+
+    def _write(self, reg, buf=None):
+        if self.batch is None:
+            self._seesaw.write(_NEOPIXEL_BASE, reg, buf)
+            return
+        full_buffer = bytearray([_NEOPIXEL_BASE, reg])
+        if buf is not None:
+            full_buffer += buf
+        self.batch.append((self._seesaw.i2c_device.device_address, full_buffer, None))
 
     def deinit(self):
         pass
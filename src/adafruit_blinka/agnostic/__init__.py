@@ -17,11 +17,17 @@ import adafruit_platformdetect
 # detector directly elsewhere, just in case additional indirection is necessary
 # at some later point:
 
+implementation = sys.implementation.name
+
 detector = adafruit_platformdetect.Detector()
+if implementation == "cpython" and sys.platform == "linux":
+    from adafruit_blinka.agnostic import platform_cache
+
+    if not platform_cache.restore(detector):
+        platform_cache.store(detector)
 chip_id = detector.chip.id
 board_id = detector.board.id
 
-implementation = sys.implementation.name
 if implementation == "micropython":
     from utime import sleep
 elif implementation in ("circuitpython", "cpython"):
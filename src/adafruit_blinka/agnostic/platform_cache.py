@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+Remembers the detected chip and board ids across processes.
+
+Detecting the platform reads /proc/cpuinfo, the device tree and more, each time
+Blinka is imported. The result is stored in a small JSON file, keyed on a
+fingerprint that is cheap to compute (the device tree model and compatible
+strings, the DMI board name, the kernel release and the versions of Blinka and
+PlatformDetect), and reused while the fingerprint matches.
+
+The cache lives in ``$XDG_CACHE_HOME/adafruit-blinka/platform.json`` (or
+``~/.cache/...``). Set ``BLINKA_PLATFORM_CACHE`` to another path to move it, or
+to ``0`` to disable it. It is not used while any other ``BLINKA_*`` variable is
+set, as those select USB adapters whose presence can change without the
+fingerprint changing.
+"""
+import json
+import os
+
+try:
+    from importlib.metadata import PackageNotFoundError, version
+except ImportError:  # before Python 3.8
+    PackageNotFoundError = ImportError
+    version = None
+
+_FINGERPRINT_FILES = (
+    "/proc/device-tree/model",
+    "/proc/device-tree/compatible",
+    "/sys/devices/virtual/dmi/id/board_name",
+)
+
+# upgrading either can add or change chip and board ids
+_FINGERPRINT_DISTRIBUTIONS = ("Adafruit-Blinka", "Adafruit-PlatformDetect")
+
+
+def cache_path():
+    """Path of the cache file, or None if caching is disabled"""
+    path = os.environ.get("BLINKA_PLATFORM_CACHE")
+    if path == "0":
+        return None
+    for name in os.environ:
+        if name.startswith("BLINKA_") and name != "BLINKA_PLATFORM_CACHE":
+            return None
+    if path:
+        return path
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "adafruit-blinka", "platform.json")
+
+
+def fingerprint():
+    """Values that change when the cached ids may no longer be right"""
+    values = list(os.uname()[2:])  # release, version, machine
+    for path in _FINGERPRINT_FILES:
+        try:
+            with open(path, "rb") as file:
+                values.append(file.read().decode("utf-8", "replace"))
+        except OSError:
+            values.append(None)
+    for distribution in _FINGERPRINT_DISTRIBUTIONS:
+        try:
+            values.append(version(distribution) if version else None)
+        except PackageNotFoundError:
+            values.append(None)
+    return values
+
+
+def restore(detector):
+    """Set the chip and board ids of ``detector`` from the cache. Returns True
+    if they were set."""
+    path = cache_path()
+    if path is None:
+        return False
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            cached = json.load(file)
+    except (OSError, ValueError):
+        return False
+    if cached.get("fingerprint") != fingerprint():
+        return False
+    chip_id = cached.get("chip_id")
+    board_id = cached.get("board_id")
+    if not chip_id or not board_id:
+        return False
+    # pylint: disable=protected-access
+    detector.chip._chip_id = chip_id
+    detector.board._board_id = board_id
+    return True
+
+
+def store(detector):
+    """Write the chip and board ids of ``detector`` to the cache"""
+    path = cache_path()
+    if path is None or not detector.chip.id or not detector.board.id:
+        return
+    cached = {
+        "fingerprint": fingerprint(),
+        "chip_id": detector.chip.id,
+        "board_id": detector.board.id,
+    }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = "%s.%d" % (path, os.getpid())
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(cached, file)
+        os.replace(temporary, path)
+    except OSError:
+        pass
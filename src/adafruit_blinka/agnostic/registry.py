@@ -0,0 +1,280 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+Maps platform detection ids to the Blinka modules defining their pins, so
+`board` and `microcontroller` find theirs with one dictionary lookup.
+"""
+
+import adafruit_platformdetect.constants.boards as ap_board
+from adafruit_platformdetect.constants import chips as ap_chip
+
+# Board constant name -> module in adafruit_blinka.board
+_BOARD_MODULES = {
+    "FEATHER_HUZZAH": "feather_huzzah",
+    "NODEMCU": "nodemcu",
+    "PYBOARD": "pyboard",
+    "RASPBERRY_PI_PICO": "raspberrypi.pico",
+    "RASPBERRY_PI_4B": "raspberrypi.raspi_4b",
+    "RASPBERRY_PI_CM4": "raspberrypi.raspi_4b",
+    "RASPBERRY_PI_400": "raspberrypi.raspi_4b",
+    "RASPBERRY_PI_B_REV1": "raspberrypi.raspi_1b_rev1",
+    "RASPBERRY_PI_A": "raspberrypi.raspi_1b_rev2",
+    "RASPBERRY_PI_B_REV2": "raspberrypi.raspi_1b_rev2",
+    "BEAGLEBONE": "beagleboard.beaglebone_black",
+    "BEAGLEBONE_BLACK": "beagleboard.beaglebone_black",
+    "BEAGLEBONE_GREEN": "beagleboard.beaglebone_black",
+    "BEAGLEBONE_GREEN_GATEWAY": "beagleboard.beaglebone_black",
+    "BEAGLEBONE_BLACK_INDUSTRIAL": "beagleboard.beaglebone_black",
+    "BEAGLEBONE_GREEN_WIRELESS": "beagleboard.beaglebone_black",
+    "BEAGLEBONE_BLACK_WIRELESS": "beagleboard.beaglebone_black",
+    "BEAGLEBONE_POCKETBEAGLE": "beagleboard.beaglebone_pocketbeagle",
+    "BEAGLEBONE_AI": "beagleboard.beaglebone_ai",
+    "BEAGLEV_STARLIGHT": "beagleboard.beaglev_starlight",
+    "ORANGE_PI_PC": "orangepi.orangepipc",
+    "ORANGE_PI_R1": "orangepi.orangepir1",
+    "ORANGE_PI_ZERO": "orangepi.orangepizero",
+    "ORANGE_PI_ONE": "orangepi.orangepipc",
+    "ORANGE_PI_PC_PLUS": "orangepi.orangepipc",
+    "ORANGE_PI_LITE": "orangepi.orangepipc",
+    "ORANGE_PI_PLUS_2E": "orangepi.orangepipc",
+    "ORANGE_PI_2": "orangepi.orangepipc",
+    "ORANGE_PI_ZERO_PLUS_2H5": "orangepi.orangepizeroplus2h5",
+    "ORANGE_PI_ZERO_PLUS": "orangepi.orangepizeroplus",
+    "ORANGE_PI_ZERO_2": "orangepi.orangepizero2",
+    "ORANGE_PI_3": "orangepi.orangepi3",
+    "ORANGE_PI_4": "orangepi.orangepi4",
+    "ORANGE_PI_4_LTS": "orangepi.orangepi4",
+    "ORANGE_PI_5": "orangepi.orangepi5",
+    "BANANA_PI_M2_ZERO": "bananapi.bpim2zero",
+    "BANANA_PI_M2_PLUS": "bananapi.bpim2plus",
+    "BANANA_PI_M5": "bananapi.bpim5",
+    "GIANT_BOARD": "giantboard",
+    "JETSON_TX1": "nvidia.jetson_tx1",
+    "JETSON_TX2": "nvidia.jetson_tx2",
+    "JETSON_TX2_NX": "nvidia.jetson_tx2_nx",
+    "JETSON_XAVIER": "nvidia.jetson_xavier",
+    "JETSON_NANO": "nvidia.jetson_nano",
+    "JETSON_NX": "nvidia.jetson_nx",
+    "JETSON_AGX_ORIN": "nvidia.jetson_orin",
+    "CLARA_AGX_XAVIER": "nvidia.clara_agx_xavier",
+    "CORAL_EDGE_TPU_DEV": "coral_dev_board",
+    "CORAL_EDGE_TPU_DEV_MINI": "coral_dev_board_mini",
+    "ODROID_C2": "hardkernel.odroidc2",
+    "ODROID_C4": "hardkernel.odroidc4",
+    "ODROID_N2": "hardkernel.odroidn2",
+    "ODROID_M1": "hardkernel.odroidm1",
+    "KHADAS_VIM3": "khadas.khadasvim3",
+    "ODROID_XU4": "hardkernel.odroidxu4",
+    "DRAGONBOARD_410C": "dragonboard_410c",
+    "FTDI_FT232H": "ftdi_ft232h",
+    "FTDI_FT2232H": "ftdi_ft2232h",
+    "BINHO_NOVA": "binho_nova",
+    "MICROCHIP_MCP2221": "microchip_mcp2221",
+    "GREATFET_ONE": "greatfet_one",
+    "SIFIVE_UNLEASHED": "hifive_unleashed",
+    "PINE64": "pine64",
+    "PINEH64": "pineH64",
+    "SOPINE": "soPine",
+    "CLOCKWORK_CPI3": "clockworkcpi3",
+    "ONION_OMEGA2": "onion.omega2",
+    "RADXA_CM3": "radxa.radxacm3",
+    "ROCK_PI_3A": "radxa.rockpi3a",
+    "RADXA_ZERO": "radxa.radxazero",
+    "ROCK_PI_S": "radxa.rockpis",
+    "ROCK_PI_4": "radxa.rockpi4",
+    "ROCK_PI_5": "radxa.rock5",
+    "ROCK_PI_E": "radxa.rockpie",
+    "UDOO_X86": "udoo_x86ultra",
+    "ODYSSEY_X86J41X5": "x86j41x5",
+    "STM32MP157C_DK2": "stm32.stm32mp157c_dk2",
+    "OSD32MP1_RED": "stm32.osd32mp1_red",
+    "OSD32MP1_BRK": "stm32.osd32mp1_brk",
+    "LUBANCAT_IMX6ULL": "lubancat.lubancat_imx6ull",
+    "LUBANCAT_STM32MP157": "lubancat.lubancat_stm32mp157",
+    "LUBANCAT_ZERO": "lubancat.lubancat_zero",
+    "LUBANCAT1": "lubancat.lubancat1",
+    "LUBANCAT2": "lubancat.lubancat2",
+    "NANOPI_NEO_AIR": "nanopi.neoair",
+    "NANOPI_DUO2": "nanopi.duo2",
+    "NANOPI_NEO": "nanopi.neo",
+    "PICO_U2IF": "pico_u2if",
+    "FEATHER_U2IF": "feather_u2if",
+    "QTPY_U2IF": "qtpy_u2if",
+    "ITSYBITSY_U2IF": "itsybitsy_u2if",
+    "MACROPAD_U2IF": "macropad_u2if",
+    "QT2040_TRINKEY_U2IF": "qt2040_trinkey_u2if",
+    "LICHEE_RV": "lichee_rv",
+    "SIEMENS_SIMATIC_IOT2050_ADV": "siemens.siemens_iot2050",
+    "SIEMENS_SIMATIC_IOT2050_BASIC": "siemens.siemens_iot2050",
+    "AML_S905X_CC": "librecomputer.aml_s905x_cc_v1",
+    "GENERIC_LINUX_PC": "generic_linux_pc",
+}
+
+# Checked in order when the board id is not in BOARDS: (Board property, module)
+BOARD_GROUPS = (
+    ("any_raspberry_pi_40_pin", "raspberrypi.raspi_40pin"),
+    ("any_raspberry_pi_cm", "raspberrypi.raspi_cm"),
+)
+
+# Chip constant name -> package in adafruit_blinka.microcontroller
+_CHIP_PACKAGES = {
+    "ESP8266": "esp8266",
+    "STM32F405": "stm32.stm32f405",
+    "RP2040": "rp2040",
+    "DRA74X": "dra74x",
+    "AM33XX": "am335x",
+    "AM65XX": "am65xx",
+    "JH71x0": "starfive.JH71x0",
+    "SUN8I": "allwinner.h3",
+    "H3": "allwinner.h3",
+    "H5": "allwinner.h5",
+    "H6": "allwinner.h6",
+    "H616": "allwinner.h616",
+    "SAMA5": "sama5",
+    "T210": "tegra.t210",
+    "T186": "tegra.t186",
+    "T194": "tegra.t194",
+    "T234": "tegra.t234",
+    "S905": "amlogic.s905",
+    "S905X": "amlogic.s905x",
+    "S905X3": "amlogic.s905x3",
+    "S905Y2": "amlogic.s905y2",
+    "S922X": "amlogic.s922x",
+    "A311D": "amlogic.a311d",
+    "EXYNOS5422": "samsung.exynos5422",
+    "APQ8016": "snapdragon.apq8016",
+    "IMX8MX": "nxp_imx8m",
+    "IMX6ULL": "nxp_imx6ull",
+    "HFU540": "hfu540",
+    "FT232H": "ftdi_mpsse.ft232h",
+    "FT2232H": "ftdi_mpsse.ft2232h",
+    "BINHO": "nova",
+    "LPC4330": "nxp_lpc4330",
+    "MCP2221": "mcp2221",
+    "A64": "allwinner.a64",
+    "A33": "allwinner.a33",
+    "RK3308": "rockchip.rk3308",
+    "RK3399": "rockchip.rk3399",
+    "RK3588": "rockchip.rk3588",
+    "RK3328": "rockchip.rk3328",
+    "RK3566": "rockchip.rk3566",
+    "RK3568": "rockchip.rk3568",
+    "MIPS24KC": "atheros.ar9331",
+    "MIPS24KEC": "mips24kec",
+    "PENTIUM_N3710": "pentium.n3710",
+    "ATOM_J4105": "pentium.j4105",
+    "STM32MP157": "stm32.stm32mp157",
+    "MT8167": "mt8167",
+    "RP2040_U2IF": "rp2040_u2if",
+    "D1_RISCV": "allwinner.D1",
+}
+
+
+def _by_id(constants, modules):
+    """Key ``modules`` by the ids the constants of their names stand for. Names
+    the installed adafruit-platformdetect does not define are left out."""
+    return {
+        getattr(constants, name): module
+        for name, module in modules.items()
+        if hasattr(constants, name)
+    }
+
+
+# Board id -> module in adafruit_blinka.board
+BOARDS = _by_id(ap_board, _BOARD_MODULES)
+
+# Chip id -> package in adafruit_blinka.microcontroller
+CHIPS = _by_id(ap_chip, _CHIP_PACKAGES)
+
+# BCM2XXX boards using the bcm2711 package instead of bcm283x
+BCM2711_BOARDS = (
+    ap_board.RASPBERRY_PI_4B,
+    ap_board.RASPBERRY_PI_400,
+    ap_board.RASPBERRY_PI_CM4,
+)
+
+
+def board_module(board_id, board):
+    """Name of the pin module of a board, or None if it is not supported.
+    ``board`` is the `adafruit_platformdetect.board.Board`, used for ids that
+    belong to a group of boards."""
+    module = BOARDS.get(board_id)
+    if module is None:
+        for group, group_module in BOARD_GROUPS:
+            if getattr(board, group):
+                module = group_module
+                break
+        else:
+            return None
+    return "adafruit_blinka.board." + module
+
+
+def chip_package(chip_id, board_id):
+    """Name of the package of a chip, or None if it is not supported"""
+    if chip_id == ap_chip.BCM2XXX:
+        package = "bcm2711" if board_id in BCM2711_BOARDS else "bcm283x"
+    else:
+        package = CHIPS.get(chip_id)
+        if package is None:
+            return None
+    return "adafruit_blinka.microcontroller." + package
+
+
+class LazyNamespace:
+    """Provides the public names of another module to a module, importing it the
+    first time one of them is used. Install it with::
+
+        __getattr__, __dir__ = LazyNamespace(globals(), "module.name").functions()
+
+    Once imported, the names are copied into the module, so later uses do not
+    go through ``__getattr__`` again. Names the module defines itself take
+    precedence. ``extend`` is called with the dictionary of imported names and
+    may add to it.
+    """
+
+    def __init__(self, namespace, module_name, extend=None):
+        self._namespace = namespace
+        self._module_name = module_name
+        self._extend = extend
+        self._names = None
+
+    def load(self):
+        """Import the module, if not done yet, and return its public names"""
+        if self._names is None:
+            names = {}
+            if self._module_name is not None:
+                module = __import__(self._module_name, None, None, ["*"])
+                public = getattr(module, "__all__", None)
+                if public is None:
+                    public = [name for name in dir(module) if name[0] != "_"]
+                for name in public:
+                    names[name] = getattr(module, name)
+            if self._extend is not None:
+                self._extend(names)
+            for name, value in names.items():
+                self._namespace.setdefault(name, value)
+            self._names = names
+        return self._names
+
+    def getattr(self, name):
+        """Module ``__getattr__``"""
+        if name == "__all__":
+            return sorted(self.load())
+        if name[:2] == "__":
+            raise AttributeError(name)
+        try:
+            return self.load()[name]
+        except KeyError:
+            raise AttributeError(
+                "module %r has no attribute %r" % (self._namespace["__name__"], name)
+            ) from None
+
+    def dir(self):
+        """Module ``__dir__``"""
+        self.load()
+        return sorted(self._namespace)
+
+    def functions(self):
+        """The ``__getattr__`` and ``__dir__`` functions of the module"""
+        return self.getattr, self.dir
@@ -4,6 +4,7 @@
 """BCM283x NeoPixel Driver Class"""
 import time
 import atexit
+import ctypes
 import _rpi_ws281x as ws
 
 # LED configuration.
@@ -16,93 +17,142 @@ LED_BRIGHTNESS = 255  # We manage the brightness in the neopixel library
 LED_INVERT = 0  # We don't support inverted logic
 LED_STRIP = None  # We manage the color order within the neopixel library
 
-# a 'static' object that we will use to manage our PWM DMA channel
-# we only support one LED strip per raspi
-_led_strip = None
-_buf = None
-
+# GPIOs driven by the second PWM channel, all others use the first one
+PWM1_GPIOS = (13, 19, 41, 45)
 
-def neopixel_write(gpio, buf):
-    """NeoPixel Writing Function"""
-    global _led_strip  # we'll have one strip we init if its not at first
-    global _buf  # we save a reference to the buf, and if it changes we will cleanup and re-init.
-
-    if _led_strip is None or buf is not _buf:
-        # This is safe to call since it doesn't do anything if _led_strip is None
-        neopixel_cleanup()
-
-        # Create a ws2811_t structure from the LED configuration.
-        # Note that this structure will be created on the heap so you
-        # need to be careful that you delete its memory by calling
-        # delete_ws2811_t when it's not needed.
-        _led_strip = ws.new_ws2811_t()
-        _buf = buf
-
-        # Initialize all channels to off
-        for channum in range(2):
-            channel = ws.ws2811_channel_get(_led_strip, channum)
+# a 'static' object that we will use to manage our PWM DMA channel, with up to
+# one strip on each of the two channels
+_led_strip = None
+# channel number -> (gpio number, pixel count, bytes per pixel) it was set up for
+_channels = {}
+# channel number -> (bytearray, its address) holding the pixels as ws2811_led_t
+_staging = {}
+
+
+def _channel_number(gpio_number):
+    return 1 if gpio_number in PWM1_GPIOS else 0
+
+
+def _init(channels):
+    """Set up the ws2811 context for ``channels``, see `_channels`"""
+    global _led_strip, _channels
+
+    # keep the last frame of the channels that stay as they are
+    kept = {
+        channum: _staging[channum]
+        for channum, setup in _channels.items()
+        if channels.get(channum) == setup
+    }
+    # This is safe to call since it doesn't do anything if _led_strip is None
+    neopixel_cleanup()
+
+    # Create a ws2811_t structure from the LED configuration.
+    # Note that this structure will be created on the heap so you
+    # need to be careful that you delete its memory by calling
+    # delete_ws2811_t when it's not needed.
+    led_strip = ws.new_ws2811_t()
+
+    for channum in range(2):
+        channel = ws.ws2811_channel_get(led_strip, channum)
+        if channum not in channels:
+            # Initialize unused channels to off
             ws.ws2811_channel_t_count_set(channel, 0)
             ws.ws2811_channel_t_gpionum_set(channel, 0)
             ws.ws2811_channel_t_invert_set(channel, 0)
             ws.ws2811_channel_t_brightness_set(channel, 0)
+            continue
 
-        channel = ws.ws2811_channel_get(_led_strip, LED_CHANNEL)
-
-        # Initialize the channel in use
-        count = 0
-        if len(buf) % 3 == 0:
-            # most common, divisible by 3 is likely RGB
-            LED_STRIP = ws.WS2811_STRIP_RGB
-            count = len(buf) // 3
-        elif len(buf) % 4 == 0:
-            LED_STRIP = ws.SK6812_STRIP_RGBW
-            count = len(buf) // 4
-        else:
-            raise RuntimeError("We only support 3 or 4 bytes-per-pixel")
-
-        ws.ws2811_channel_t_count_set(
-            channel, count
-        )  # we manage 4 vs 3 bytes in the library
-        ws.ws2811_channel_t_gpionum_set(channel, gpio._pin.id)
+        gpio_number, count, bpp = channels[channum]
+        # we manage 4 vs 3 bytes in the library
+        ws.ws2811_channel_t_count_set(channel, count)
+        ws.ws2811_channel_t_gpionum_set(channel, gpio_number)
         ws.ws2811_channel_t_invert_set(channel, LED_INVERT)
         ws.ws2811_channel_t_brightness_set(channel, LED_BRIGHTNESS)
-        ws.ws2811_channel_t_strip_type_set(channel, LED_STRIP)
-
-        # Initialize the controller
-        ws.ws2811_t_freq_set(_led_strip, LED_FREQ_HZ)
-        ws.ws2811_t_dmanum_set(_led_strip, LED_DMA_NUM)
-
-        resp = ws.ws2811_init(_led_strip)
-        if resp != ws.WS2811_SUCCESS:
-            if resp == -5:
-                raise RuntimeError(
-                    "NeoPixel support requires running with sudo, please try again!"
-                )
-            message = ws.ws2811_get_return_t_str(resp)
+        ws.ws2811_channel_t_strip_type_set(
+            channel, ws.WS2811_STRIP_RGB if bpp == 3 else ws.SK6812_STRIP_RGBW
+        )
+
+    # Initialize the controller
+    ws.ws2811_t_freq_set(led_strip, LED_FREQ_HZ)
+    ws.ws2811_t_dmanum_set(led_strip, LED_DMA_NUM)
+
+    resp = ws.ws2811_init(led_strip)
+    if resp != ws.WS2811_SUCCESS:
+        ws.delete_ws2811_t(led_strip)
+        if resp == -5:
             raise RuntimeError(
-                "ws2811_init failed with code {0} ({1})".format(resp, message)
+                "NeoPixel support requires running with sudo, please try again!"
             )
-        atexit.register(neopixel_cleanup)
+        message = ws.ws2811_get_return_t_str(resp)
+        raise RuntimeError(
+            "ws2811_init failed with code {0} ({1})".format(resp, message)
+        )
+    _led_strip = led_strip
+    _channels = channels
 
-    channel = ws.ws2811_channel_get(_led_strip, LED_CHANNEL)
-    if gpio._pin.id != ws.ws2811_channel_t_gpionum_get(channel):
-        raise RuntimeError("Raspberry Pi neopixel support is for one strip only!")
+    for channum, (_, count, _) in channels.items():
+        if channum in kept:
+            _staging[channum] = kept[channum]
+            _copy_leds(ws.ws2811_channel_get(led_strip, channum), channum)
+        else:
+            staging = bytearray(4 * count)
+            _staging[channum] = (staging, ctypes.c_char.from_buffer(staging))
 
-    if ws.ws2811_channel_t_strip_type_get(channel) == ws.WS2811_STRIP_RGB:
-        bpp = 3
+
+def _leds_address(channel):
+    """Address of the ws2811_led_t array of ``channel``, or None if the binding
+    does not expose it"""
+    try:
+        return int(ws.ws2811_channel_t_leds_get(channel))
+    except (AttributeError, TypeError):
+        return None
+
+
+def _copy_leds(channel, channum):
+    """Copy the staged pixels of ``channum`` into the DMA-backed LEDs"""
+    staging, staging_address = _staging[channum]
+    leds = _leds_address(channel)
+    if leds is not None:
+        ctypes.memmove(leds, ctypes.addressof(staging_address), len(staging))
     else:
+        for i, pixel in enumerate(memoryview(staging).cast("I")):
+            ws.ws2811_led_set(channel, i, pixel)
+
+
+def neopixel_write(gpio, buf):
+    """NeoPixel Writing Function
+
+    The ws2811 context is kept while the pin, the pixel count and the bytes per
+    pixel of each PWM channel stay the same, whichever buffer object is written.
+    A strip on the other PWM channel (GPIO 13 or 19) is added to the context.
+    """
+    if len(buf) % 3 == 0:
+        # most common, divisible by 3 is likely RGB
+        bpp = 3
+    elif len(buf) % 4 == 0:
         bpp = 4
-    # assign all colors!
-    for i in range(len(buf) // bpp):
-        r = buf[bpp * i]
-        g = buf[bpp * i + 1]
-        b = buf[bpp * i + 2]
-        if bpp == 3:
-            pixel = (r << 16) | (g << 8) | b
-        else:
-            w = buf[bpp * i + 3]
-            pixel = (w << 24) | (r << 16) | (g << 8) | b
-        ws.ws2811_led_set(channel, i, pixel)
+    else:
+        raise RuntimeError("We only support 3 or 4 bytes-per-pixel")
+    gpio_number = gpio._pin.id
+    channum = _channel_number(gpio_number)
+    setup = (gpio_number, len(buf) // bpp, bpp)
+
+    if _led_strip is None or _channels.get(channum) != setup:
+        channels = dict(_channels)
+        channels[channum] = setup  # replaces another strip on the same channel
+        _init(channels)
+
+    channel = ws.ws2811_channel_get(_led_strip, channum)
+    staging = _staging[channum][0]
+    if not isinstance(buf, (bytes, bytearray)):
+        buf = bytes(buf)
+    # assign all colors! as 0xWWRRGGBB words, little endian
+    staging[0::4] = buf[2::bpp]
+    staging[1::4] = buf[1::bpp]
+    staging[2::4] = buf[0::bpp]
+    if bpp == 4:
+        staging[3::4] = buf[3::4]
+    _copy_leds(channel, channum)
 
     resp = ws.ws2811_render(_led_strip)
     if resp != ws.WS2811_SUCCESS:
@@ -115,7 +165,7 @@ def neopixel_write(gpio, buf):
 
 def neopixel_cleanup():
     """Cleanup when we're done"""
-    global _led_strip
+    global _led_strip, _channels
 
     if _led_strip is not None:
         # Ensure ws2811_fini is called before the program quits.
@@ -124,3 +174,8 @@ def neopixel_cleanup():
         # strictly necessary at the end of the program execution here, but is good practice.
         ws.delete_ws2811_t(_led_strip)
         _led_strip = None
+    _channels = {}
+    _staging.clear()
+
+
+atexit.register(neopixel_cleanup)
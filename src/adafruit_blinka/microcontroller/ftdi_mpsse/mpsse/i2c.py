@@ -8,6 +8,29 @@ from adafruit_blinka.microcontroller.ftdi_mpsse.mpsse.url import (
     get_ft2232h_url,
 )
 
+# pyftdi I2cController internals the burst transfers are built from
+_BURST_ATTRIBUTES = (
+    "_ack",
+    "_ck_delay",
+    "_clk_input_data_input",
+    "_clk_lo_data_hi",
+    "_clk_lo_data_input",
+    "_clk_lo_data_lo",
+    "_fake_tristate",
+    "_i2c_read_data_bytes",
+    "_i2c_write_data",
+    "_idle",
+    "_immediate",
+    "_lock",
+    "_nack",
+    "_read_bit",
+    "_read_byte",
+    "_rx_size",
+    "_start",
+    "_stop",
+    "_write_byte",
+)
+
 
 class I2C:
     """Custom I2C Class for FTDI MPSSE"""
@@ -29,29 +52,35 @@ class I2C:
         # pylint: enable=import-outside-toplevel
 
         self._i2c = I2cController()
+        self._ports = {}
         if i2c_id is None:
             self._i2c.configure(get_ft232h_url(), frequency=frequency)
         else:
             self._i2c.configure(get_ft2232h_url(i2c_id), frequency=frequency)
         Pin.mpsse_gpio = self._i2c.get_gpio()
 
+    def _port(self, address):
+        port = self._ports.get(address)
+        if port is None:
+            port = self._ports[address] = self._i2c.get_port(address)
+        return port
+
     def scan(self):
         """Perform an I2C Device Scan"""
-        return [addr for addr in range(0x79) if self._i2c.poll(addr)]
+        # one address-only write per address, all in a single burst
+        acked = self._burst([[(addr, b"", False)] for addr in range(0x79)])
+        return [addr for addr, ack in zip(range(0x79), acked) if ack]
 
     def writeto(self, address, buffer, *, start=0, end=None, stop=True):
         """Write data from the buffer to an address"""
         end = end if end else len(buffer)
-        port = self._i2c.get_port(address)
-        port.write(buffer[start:end], relax=stop)
+        self._port(address).write(memoryview(buffer)[start:end], relax=stop)
 
     def readfrom_into(self, address, buffer, *, start=0, end=None, stop=True):
         """Read data from an address and into the buffer"""
         end = end if end else len(buffer)
-        port = self._i2c.get_port(address)
-        result = port.read(len(buffer[start:end]), relax=stop)
-        for i, b in enumerate(result):
-            buffer[start + i] = b
+        result = self._port(address).read(end - start, relax=stop)
+        memoryview(buffer)[start:end] = result
 
     # pylint: disable=unused-argument
     def writeto_then_readfrom(
@@ -71,11 +100,129 @@ class I2C:
         """
         out_end = out_end if out_end else len(buffer_out)
         in_end = in_end if in_end else len(buffer_in)
-        port = self._i2c.get_port(address)
-        result = port.exchange(
-            buffer_out[out_start:out_end], in_end - in_start, relax=True
+        result = self._port(address).exchange(
+            memoryview(buffer_out)[out_start:out_end], in_end - in_start, relax=True
         )
-        for i, b in enumerate(result):
-            buffer_in[in_start + i] = b
+        memoryview(buffer_in)[in_start:in_end] = result
 
     # pylint: enable=unused-argument
+
+    def transfer(self, messages):
+        """Run a list of ``(address, buffer, read)`` messages as one combined
+        transaction, clocked out from a single MPSSE command buffer."""
+        if not all(self._burst([messages])):
+            raise OSError("NACK from slave")
+
+    # pylint: disable=protected-access,too-many-locals
+    def _burst(self, transactions):
+        """Encode lists of ``(address, buffer, read)`` messages into MPSSE commands
+        and send them at once. Messages of a transaction are separated by repeated
+        starts, transactions by a stop. Acknowledges are only checked afterwards,
+        so a NACK does not stop the burst. Returns whether each transaction was
+        acknowledged throughout."""
+        ctrl = self._i2c
+        if not all(hasattr(ctrl, name) for name in _BURST_ATTRIBUTES):
+            # the command fragments are pyftdi internals, as of pyftdi 0.57
+            return [self._transaction(messages) for messages in transactions]
+        if ctrl._fake_tristate:
+            ack_check = ctrl._clk_lo_data_input + ctrl._read_bit
+            write_byte = ctrl._clk_lo_data_hi + ctrl._write_byte
+            read_byte = (
+                ctrl._clk_lo_data_input + ctrl._read_byte + ctrl._clk_lo_data_hi
+            )
+            read_not_last = (
+                read_byte + ctrl._ack + ctrl._clk_lo_data_lo * ctrl._ck_delay
+            )
+            read_last = read_byte + ctrl._nack + ctrl._clk_lo_data_hi * ctrl._ck_delay
+            stop = ctrl._stop + ctrl._clk_input_data_input
+        else:
+            ack_check = ctrl._clk_lo_data_hi + ctrl._read_bit
+            write_byte = ctrl._write_byte
+            read_not_last = (
+                ctrl._read_byte + ctrl._ack + ctrl._clk_lo_data_hi * ctrl._ck_delay
+            )
+            read_last = (
+                ctrl._read_byte + ctrl._nack + ctrl._clk_lo_data_hi * ctrl._ck_delay
+            )
+            stop = ctrl._stop
+        start = ctrl._idle * ctrl._ck_delay + ctrl._start
+        # the replies have to fit in the FTDI RX FIFO, or the MPSSE stalls
+        rx_limit = ctrl._rx_size - 2
+
+        acked = []
+        cmd = bytearray()
+        # per reply byte: None for an acknowledge bit, else (buffer, index)
+        replies = []
+        owners = []
+
+        def reply(index, fragment, item):
+            cmd.extend(fragment)
+            replies.append(item)
+            owners.append(index)
+            if len(replies) == rx_limit:
+                # a transaction longer than the FIFO goes out in parts, the
+                # master holds the clock low in between
+                self._send_burst(cmd, replies, owners, acked)
+
+        for index, messages in enumerate(transactions):
+            acked.append(True)
+            views = [memoryview(buffer).cast("B") for _, buffer, _ in messages]
+            # keep transactions in one part when they fit
+            if replies and len(replies) + sum(1 + len(v) for v in views) > rx_limit:
+                self._send_burst(cmd, replies, owners, acked)
+            for (address, _, read), view in zip(messages, views):
+                cmd.extend(start)
+                address_byte = (address << 1) | (1 if read else 0)
+                reply(index, write_byte + (address_byte,) + ack_check, None)
+                if read:
+                    last = len(view) - 1
+                    for i in range(len(view)):
+                        fragment = read_last if i == last else read_not_last
+                        reply(index, fragment, (view, i))
+                else:
+                    for byte in view:
+                        reply(index, write_byte + (byte,) + ack_check, None)
+            cmd.extend(stop)
+        if replies:
+            self._send_burst(cmd, replies, owners, acked)
+        return acked
+
+    def _transaction(self, messages):
+        """Run one transaction through the public I2cPort API instead of a burst,
+        returns whether it was acknowledged throughout."""
+        # pylint: disable=import-outside-toplevel
+        from pyftdi.i2c import I2cNackError
+
+        # pylint: enable=import-outside-toplevel
+        last = len(messages) - 1
+        try:
+            for i, (address, buffer, read) in enumerate(messages):
+                if read:
+                    view = memoryview(buffer).cast("B")
+                    view[:] = self._port(address).read(len(view), relax=i == last)
+                else:
+                    self._port(address).write(buffer, relax=i == last)
+        except I2cNackError:
+            return False
+        return True
+
+    def _send_burst(self, cmd, replies, owners, acked):
+        ctrl = self._i2c
+        cmd.extend(ctrl._immediate)
+        with ctrl._lock:
+            ctrl._i2c_write_data(cmd)
+            data = ctrl._i2c_read_data_bytes(len(replies), 4)
+        if len(data) != len(replies):
+            raise OSError("No answer from FTDI")
+        for reply, owner, value in zip(replies, owners, data):
+            if reply is None:
+                if value & 0x01:
+                    acked[owner] = False
+            else:
+                view, i = reply
+                view[i] = value
+        cmd.clear()
+        replies.clear()
+        owners.clear()
+
+    # pylint: enable=protected-access,too-many-locals
@@ -1,8 +1,48 @@
 # SPDX-FileCopyrightText: 2021 Melissa LeBlanc-Williams for Adafruit Industries
 #
 # SPDX-License-Identifier: MIT
-"""Generic Linux I2C class using PureIO's smbus class"""
-from Adafruit_PureIO import smbus
+"""Generic Linux I2C class using the I2C_RDWR ioctl of /dev/i2c-N"""
+import ctypes
+import fcntl
+import os
+
+# From linux/i2c-dev.h and linux/i2c.h
+I2C_RDWR = 0x0707
+I2C_M_RD = 0x0001
+I2C_RDWR_IOCTL_MAX_MSGS = 42
+I2C_MSG_MAX_LEN = 0xFFFF  # i2c_msg.len is a __u16
+
+
+class _I2CMsg(ctypes.Structure):
+    """struct i2c_msg"""
+
+    _fields_ = [
+        ("addr", ctypes.c_uint16),
+        ("flags", ctypes.c_uint16),
+        ("len", ctypes.c_uint16),
+        ("buf", ctypes.c_void_p),
+    ]
+
+
+class _I2CRdwrIoctlData(ctypes.Structure):
+    """struct i2c_rdwr_ioctl_data"""
+
+    _fields_ = [
+        ("msgs", ctypes.POINTER(_I2CMsg)),
+        ("nmsgs", ctypes.c_uint32),
+    ]
+
+
+def _c_buffer(buffer, start=0, end=None):
+    """Returns a ctypes array sharing memory with buffer[start:end]. Only read-only
+    buffers (e.g. bytes) are copied, as the kernel is not allowed to write to them."""
+    view = memoryview(buffer)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    view = view[start:end]
+    if view.readonly:
+        return (ctypes.c_char * len(view)).from_buffer_copy(view)
+    return (ctypes.c_char * len(view)).from_buffer(view)
 
 
 class I2C:
@@ -12,7 +52,7 @@ class I2C:
     SLAVE = 1
     _baudrate = None
     _mode = None
-    _i2c_bus = None
+    _fd = None
 
     # pylint: disable=unused-argument
     def __init__(self, bus_num, mode=MASTER, baudrate=None):
@@ -24,7 +64,7 @@ class I2C:
         #    print("I2C frequency is not settable in python, ignoring!")
 
         try:
-            self._i2c_bus = smbus.SMBus(bus_num)
+            self._fd = os.open("/dev/i2c-%d" % bus_num, os.O_RDWR)
         except FileNotFoundError:
             raise RuntimeError(
                 "I2C Bus #%d not found, check if enabled in config!" % bus_num
@@ -32,13 +72,44 @@ class I2C:
 
     # pylint: enable=unused-argument
 
+    def __del__(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def transfer(self, messages):
+        """Run a list of ``(address, buffer, read)`` messages as one combined
+        transaction, i.e. with repeated starts in between and a single stop at the end.
+        Messages with ``read`` set are read directly into ``buffer``, which must
+        be writable. More than 42 messages are split into several transactions."""
+        for _, buffer, _ in messages:
+            if memoryview(buffer).nbytes > I2C_MSG_MAX_LEN:
+                raise ValueError(
+                    "I2C messages can be at most %d bytes long" % I2C_MSG_MAX_LEN
+                )
+        for first in range(0, len(messages), I2C_RDWR_IOCTL_MAX_MSGS):
+            chunk = messages[first : first + I2C_RDWR_IOCTL_MAX_MSGS]
+            msgs = (_I2CMsg * len(chunk))()
+            # keep the ctypes views alive until the ioctl returned
+            buffers = []
+            for msg, (address, buffer, read) in zip(msgs, chunk):
+                c_buffer = _c_buffer(buffer)
+                buffers.append(c_buffer)
+                msg.addr = address
+                msg.flags = I2C_M_RD if read else 0
+                msg.len = len(c_buffer)
+                msg.buf = ctypes.addressof(c_buffer)
+            data = _I2CRdwrIoctlData(msgs=msgs, nmsgs=len(chunk))
+            fcntl.ioctl(self._fd, I2C_RDWR, data)
+
     def scan(self):
         """Try to read a byte from each address, if you get an OSError
         it means the device isnt there"""
         found = []
+        result = bytearray(1)
         for addr in range(0, 0x80):
             try:
-                self._i2c_bus.read_byte(addr)
+                self.transfer([(addr, result, True)])
             except OSError:
                 continue
             found.append(addr)
@@ -47,18 +118,11 @@ class I2C:
     # pylint: disable=unused-argument
     def writeto(self, address, buffer, *, start=0, end=None, stop=True):
         """Write data from the buffer to an address"""
-        if end is None:
-            end = len(buffer)
-        self._i2c_bus.write_bytes(address, buffer[start:end])
+        self.transfer([(address, memoryview(buffer)[start:end], False)])
 
     def readfrom_into(self, address, buffer, *, start=0, end=None, stop=True):
         """Read data from an address and into the buffer"""
-        if end is None:
-            end = len(buffer)
-
-        readin = self._i2c_bus.read_bytes(address, end - start)
-        for i in range(end - start):
-            buffer[i + start] = readin[i]
+        self.transfer([(address, memoryview(buffer)[start:end], True)])
 
     # pylint: enable=unused-argument
 
@@ -77,18 +141,12 @@ class I2C:
         """Write data from buffer_out to an address and then
         read data from an address and into buffer_in
         """
-        if out_end is None:
-            out_end = len(buffer_out)
-        if in_end is None:
-            in_end = len(buffer_in)
+        out_view = memoryview(buffer_out)[out_start:out_end]
+        in_view = memoryview(buffer_in)[in_start:in_end]
         if stop:
             # To generate a stop in linux, do in two transactions
-            self.writeto(address, buffer_out, start=out_start, end=out_end, stop=True)
-            self.readfrom_into(address, buffer_in, start=in_start, end=in_end)
+            self.transfer([(address, out_view, False)])
+            self.transfer([(address, in_view, True)])
         else:
-            # To generate without a stop, do in one block transaction
-            readin = self._i2c_bus.read_i2c_block_data(
-                address, buffer_out[out_start:out_end], in_end - in_start
-            )
-            for i in range(in_end - in_start):
-                buffer_in[i + in_start] = readin[i]
+            # To generate without a stop, do in one combined transaction
+            self.transfer([(address, out_view, False), (address, in_view, True)])
@@ -10,6 +10,22 @@ except ImportError:
         "https://github.com/adafruit/Raspberry-Pi-Installer-Scripts/blob/master/libgpiod.sh"
     ) from ImportError
 
+
+def _open_chip(pin_id):
+    """Open the chip of a pin id, returns the chip and the line number"""
+    if isinstance(pin_id, tuple):
+        if hasattr(gpiod, "Chip"):
+            chip = gpiod.Chip(str(pin_id[0]), gpiod.Chip.OPEN_BY_NUMBER)
+        else:
+            chip = gpiod.chip(str(pin_id[0]), gpiod.chip.OPEN_BY_NUMBER)
+        return chip, int(pin_id[1])
+    if hasattr(gpiod, "Chip"):
+        chip = gpiod.Chip("gpiochip0", gpiod.Chip.OPEN_BY_NAME)
+    else:
+        chip = gpiod.chip("gpiochip0", gpiod.chip.OPEN_BY_NAME)
+    return chip, int(pin_id)
+
+
 # pylint: disable=too-many-branches,too-many-statements
 class Pin:
     """Pins dont exist in CPython so...lets make our own!"""
@@ -29,18 +45,7 @@ class Pin:
 
     def __init__(self, pin_id):
         self.id = pin_id
-        if isinstance(pin_id, tuple):
-            self._num = int(pin_id[1])
-            if hasattr(gpiod, "Chip"):
-                self._chip = gpiod.Chip(str(pin_id[0]), gpiod.Chip.OPEN_BY_NUMBER)
-            else:
-                self._chip = gpiod.chip(str(pin_id[0]), gpiod.chip.OPEN_BY_NUMBER)
-        else:
-            self._num = int(pin_id)
-            if hasattr(gpiod, "Chip"):
-                self._chip = gpiod.Chip("gpiochip0", gpiod.Chip.OPEN_BY_NAME)
-            else:
-                self._chip = gpiod.chip("gpiochip0", gpiod.chip.OPEN_BY_NAME)
+        self._chip, self._num = _open_chip(pin_id)
         self._line = None
 
     def __repr__(self):
@@ -141,3 +146,150 @@ class Pin:
             self._line.set_value(val)
             return None
         raise RuntimeError("Invalid value for pin")
+
+
+# pylint: enable=too-many-branches,too-many-statements
+
+
+class Port:
+    """Several pins, given by their ids, requested together as one line bulk per
+    GPIO chip, so reading or writing all of them takes one ioctl per chip. Values
+    are integer bitmasks, bit ``i`` being ``pin_ids[i]``."""
+
+    IN = Pin.IN
+    OUT = Pin.OUT
+    PULL_NONE = Pin.PULL_NONE
+    PULL_UP = Pin.PULL_UP
+    PULL_DOWN = Pin.PULL_DOWN
+
+    # flag names of the C (gpiod.Chip) and C++ (gpiod.chip) bindings
+    _PULL_FLAGS = {
+        PULL_UP: ("LINE_REQ_FLAG_BIAS_PULL_UP", "FLAG_BIAS_PULL_UP"),
+        PULL_DOWN: ("LINE_REQ_FLAG_BIAS_PULL_DOWN", "FLAG_BIAS_PULL_DOWN"),
+        PULL_NONE: ("LINE_REQ_FLAG_BIAS_DISABLE", "FLAG_BIAS_DISABLE"),
+    }
+
+    def __init__(self, pin_ids):
+        self.pin_ids = pin_ids
+        # [(chip, bulk, [bit, ...])]
+        self._bulks = []
+        chips = {}
+        for bit, pin_id in enumerate(pin_ids):
+            chip_id = pin_id[0] if isinstance(pin_id, tuple) else None
+            if chip_id not in chips:
+                chip, _ = _open_chip(pin_id)
+                chips[chip_id] = (chip, [], [])
+            chip, offsets, bits = chips[chip_id]
+            offsets.append(int(pin_id[1] if isinstance(pin_id, tuple) else pin_id))
+            bits.append(bit)
+        for chip, offsets, bits in chips.values():
+            self._bulks.append((chip, chip.get_lines(offsets), bits))
+        self._requested = False
+        # event fd -> (line, bit), while requested for edge events
+        self._event_lines = {}
+
+    def init(self, mode=IN, pull=None):
+        """Request all lines as inputs, with the given pull, or as outputs"""
+        if mode not in (self.IN, self.OUT):
+            raise RuntimeError("Invalid mode for port")
+        if pull is not None and mode == self.OUT:
+            raise RuntimeError("Cannot set pull resistor on output")
+        self.release()
+        self._event_lines = {}
+        for _, bulk, _ in self._bulks:
+            if hasattr(gpiod, "LINE_REQ_DIR_IN"):
+                bulk.request(
+                    consumer=Pin._CONSUMER,  # pylint: disable=protected-access
+                    type=(
+                        gpiod.LINE_REQ_DIR_IN
+                        if mode == self.IN
+                        else gpiod.LINE_REQ_DIR_OUT
+                    ),
+                    flags=self._pull_flags(pull, gpiod),
+                )
+            else:
+                config = gpiod.line_request()
+                config.consumer = Pin._CONSUMER  # pylint: disable=protected-access
+                config.request_type = (
+                    gpiod.line_request.DIRECTION_INPUT
+                    if mode == self.IN
+                    else gpiod.line_request.DIRECTION_OUTPUT
+                )
+                config.flags = self._pull_flags(pull, gpiod.line_request)
+                bulk.request(config)
+        self._requested = True
+
+    def init_events(self, pull=None):
+        """Request all lines as inputs reporting both edges, see `read_event`.
+        Only supported by the C bindings (``gpiod.Chip``)."""
+        if not hasattr(gpiod, "LINE_REQ_EV_BOTH_EDGES"):
+            raise NotImplementedError(
+                "Edge events need the libgpiod C Python bindings (gpiod.Chip)"
+            )
+        self.release()
+        self._event_lines = {}
+        for _, bulk, bits in self._bulks:
+            bulk.request(
+                consumer=Pin._CONSUMER,  # pylint: disable=protected-access
+                type=gpiod.LINE_REQ_EV_BOTH_EDGES,
+                flags=self._pull_flags(pull, gpiod),
+            )
+            for line, bit in zip(bulk.to_list(), bits):
+                self._event_lines[line.event_get_fd()] = (line, bit)
+        self._requested = True
+
+    def event_fds(self):
+        """File descriptors that become readable when a line has an edge event"""
+        return list(self._event_lines)
+
+    def read_event(self, fd):
+        """Read one edge event of the line with the given event fd. Returns the
+        bit of the line, its new value and the kernel timestamp in seconds."""
+        line, bit = self._event_lines[fd]
+        event = line.event_read()
+        return (
+            bit,
+            event.type == gpiod.LineEvent.RISING_EDGE,
+            event.sec + event.nsec / 1000000000,
+        )
+
+    def _pull_flags(self, pull, namespace):
+        if pull is None:
+            return 0
+        if pull not in self._PULL_FLAGS:
+            raise RuntimeError("Invalid pull for port")
+        for name in self._PULL_FLAGS[pull]:
+            if hasattr(namespace, name):
+                return getattr(namespace, name)
+        if pull == self.PULL_NONE:
+            return 0
+        raise NotImplementedError(
+            "Internal pulls not supported in this version of libgpiod, "
+            "use physical resistors instead!"
+        )
+
+    def value(self, val=None):
+        """Return the values of all pins as a bitmask, or set them from one"""
+        if val is None:
+            mask = 0
+            for _, bulk, bits in self._bulks:
+                for bit, line_value in zip(bits, bulk.get_values()):
+                    if line_value:
+                        mask |= 1 << bit
+            return mask
+        for _, bulk, bits in self._bulks:
+            bulk.set_values([(val >> bit) & 1 for bit in bits])
+        return None
+
+    def release(self):
+        """Release the lines"""
+        if self._requested:
+            for _, bulk, _ in self._bulks:
+                bulk.release()
+            self._requested = False
+            self._event_lines = {}
+
+    def deinit(self):
+        """Release the lines, the port cannot be used afterwards"""
+        self.release()
+        self._bulks = []
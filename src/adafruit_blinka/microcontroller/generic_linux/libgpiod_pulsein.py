@@ -0,0 +1,225 @@
+# SPDX-FileCopyrightText: 2021 Melissa LeBlanc-Williams for Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""Custom PulseIn Class to read PWM signals, shared by the chips that ship a
+``libgpiod_pulsein`` helper binary next to their ``PulseIn`` module"""
+import time
+import subprocess
+import os
+import atexit
+import random
+import struct
+from array import array
+import sysv_ipc
+
+DEBUG = False
+queues = []
+procs = []
+
+# Number of pulse requests sent to the helper before reading the replies, the
+# message queue must have room for all of them
+_BATCH = 64
+
+# The message queues live outside of python space, and must be formally cleaned!
+def final():
+    """In case the program is cancelled or quit, we need to clean up the PulseIn
+    helper process and also the message queue, this is called at exit to do so"""
+    if DEBUG:
+        print("Cleaning up message queues", queues)
+        print("Cleaning up processes", procs)
+    for q in queues:
+        q.remove()
+    for proc in procs:
+        proc.terminate()
+
+
+atexit.register(final)
+
+# pylint: disable=c-extension-no-member
+class PulseIn:
+    """PulseIn Class to read PWM signals
+
+    Pulses are moved from the helper process to a local ring buffer in batches,
+    and the sequence methods work on that buffer. Subclasses set ``_helper_dir``
+    to the directory that holds their build of the helper.
+    """
+
+    _helper_dir = None
+
+    def __init__(self, pin, maxlen=2, idle_state=False):
+        """Create a PulseIn object associated with the given pin.
+        The object acts as a read-only sequence of pulse lengths with
+        a given max length. When it is active, new pulse lengths are
+        added to the end of the list. When there is no more room
+        (len() == maxlen) the oldest pulse length is removed to make room."""
+        self._pin = pin
+        self._maxlen = maxlen
+        self._idle_state = idle_state
+        self._pulses = array("L", [0]) * maxlen
+        self._first = 0
+        self._count = 0
+        self._queue_key = random.randint(1, 9999)
+        try:
+            self._mq = sysv_ipc.MessageQueue(None, flags=sysv_ipc.IPC_CREX)
+            if DEBUG:
+                print("Message Queue Key: ", self._mq.key)
+            queues.append(self._mq)
+        except sysv_ipc.ExistentialError:
+            raise RuntimeError(
+                "Message queue creation failed"
+            ) from sysv_ipc.ExistentialError
+
+        # Check if OS is 64-bit
+        if struct.calcsize("P") * 8 == 64:  # pylint: disable=no-member
+            libgpiod_filename = "libgpiod_pulsein64"
+        else:
+            libgpiod_filename = "libgpiod_pulsein"
+
+        cmd = [
+            os.path.join(self._helper_dir, libgpiod_filename),
+            "--pulses",
+            str(maxlen),
+            "--queue",
+            str(self._mq.key),
+        ]
+        if idle_state:
+            cmd.append("-i")
+        cmd.append("gpiochip0")
+        cmd.append(str(pin))
+        if DEBUG:
+            print(cmd)
+
+        self._process = subprocess.Popen(cmd)  # pylint: disable=consider-using-with
+        procs.append(self._process)
+
+        # wait for it to start up
+        if DEBUG:
+            print("Waiting for startup success message from subprocess")
+        message = self._wait_receive_msg(timeout=0.25)
+        if message[0] != b"!":
+            raise RuntimeError("Could not establish message queue with subprocess")
+        self._paused = False
+
+    # pylint: disable=redefined-builtin
+    def _wait_receive_msg(self, timeout=0, type=2):
+        """Internal helper that will wait for new messages of a given type,
+        and throw an exception on timeout. Only the startup message is waited
+        for with a timeout, the replies to requests block in the kernel."""
+        if timeout > 0:
+            stamp = time.monotonic()
+            while (time.monotonic() - stamp) < timeout:
+                try:
+                    message = self._mq.receive(block=False, type=type)
+                    return message
+                except sysv_ipc.BusyError:
+                    time.sleep(0.001)  # wait a bit then retry!
+            # uh-oh timed out
+            raise RuntimeError(
+                "Timed out waiting for PulseIn message. Make sure libgpiod is installed."
+            )
+        message = self._mq.receive(block=True, type=type)
+        return message
+
+    # pylint: enable=redefined-builtin
+
+    def _fetch(self):
+        """Move the pulses captured by the helper to the local buffer"""
+        self._mq.send("l", True, type=1)
+        waiting = int(self._wait_receive_msg()[0])
+        while waiting > 0:
+            batch = min(waiting, _BATCH)
+            # send the requests at once, then collect the replies in order
+            for _ in range(batch):
+                self._mq.send("^", True, type=1)
+            for _ in range(batch):
+                pulse = int(self._wait_receive_msg()[0])
+                if pulse != -1:
+                    self._append(pulse)
+            waiting -= batch
+
+    def _append(self, pulse):
+        if self._count == self._maxlen:
+            # full, drop the oldest pulse like the helper does
+            self._first = (self._first + 1) % self._maxlen
+            self._count -= 1
+        self._pulses[(self._first + self._count) % self._maxlen] = pulse
+        self._count += 1
+
+    def deinit(self):
+        """Deinitialises the PulseIn and releases any hardware and software
+        resources for reuse."""
+        # Clean up after ourselves
+        self._process.terminate()
+        procs.remove(self._process)
+        self._mq.remove()
+        queues.remove(self._mq)
+
+    def __enter__(self):
+        """No-op used by Context Managers."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        """Automatically deinitializes the hardware when exiting a context."""
+        self.deinit()
+
+    def resume(self, trigger_duration=0):
+        """Resumes pulse capture after an optional trigger pulse."""
+        if trigger_duration != 0:
+            self._mq.send("t%d" % trigger_duration, True, type=1)
+        else:
+            self._mq.send("r", True, type=1)
+        self._paused = False
+
+    def pause(self):
+        """Pause pulse capture"""
+        self._mq.send("p", True, type=1)
+        self._paused = True
+
+    @property
+    def paused(self):
+        """True when pulse capture is paused as a result of pause() or
+        an error during capture such as a signal that is too fast."""
+        return self._paused
+
+    @property
+    def maxlen(self):
+        """The maximum length of the PulseIn. When len() is equal to maxlen,
+        it is unclear which pulses are active and which are idle."""
+        return self._maxlen
+
+    def clear(self):
+        """Clears all captured pulses"""
+        self._mq.send("c", True, type=1)
+        self._first = 0
+        self._count = 0
+
+    def popleft(self):
+        """Removes and returns the oldest read pulse."""
+        if not self._count:
+            self._fetch()
+            if not self._count:
+                raise IndexError("pop from empty list")
+        pulse = self._pulses[self._first]
+        self._first = (self._first + 1) % self._maxlen
+        self._count -= 1
+        return pulse
+
+    def __len__(self):
+        """Returns the current pulse length"""
+        self._fetch()
+        return self._count
+
+    # pylint: disable=redefined-builtin
+    def __getitem__(self, index, type=None):
+        """Returns the value at the given index or values in slice."""
+        # negative indexes count from the newest pulse, and once the buffer is
+        # full new pulses push out the oldest, so both need the helper's pulses
+        if index < 0 or index >= self._count or self._count == self._maxlen:
+            self._fetch()
+            if not -self._count <= index < self._count:
+                raise IndexError("list index out of range")
+        if index < 0:
+            index += self._count
+        return self._pulses[(self._first + index) % self._maxlen]
+
+    # pylint: enable=redefined-builtin
@@ -2,12 +2,66 @@
 #
 # SPDX-License-Identifier: MIT
 """Generic Linux SPI class using PureIO's SPI class"""
+import ctypes
+import struct
+from fcntl import ioctl
 from Adafruit_PureIO import spi
 from adafruit_blinka.agnostic import detector
 
+# Largest transfer spidev accepts, a module parameter
+_BUFSIZ_PATH = "/sys/module/spidev/parameters/bufsiz"
+
+
+def _spidev_bufsiz(default):
+    try:
+        with open(_BUFSIZ_PATH, "r", encoding="utf-8") as bufsiz:
+            return int(bufsiz.read())
+    except (OSError, ValueError):
+        return default
+
+
+def _byte_view(buf, start, end):
+    """A memoryview of the bytes of the items ``buf[start:end]``, without copying"""
+    view = memoryview(buf)[start:end]
+    if view.format != "B":
+        view = view.cast("B")
+    return view
+
+
+def _out_view(buf, start, end):
+    """The bytes of ``buf[start:end]`` to send, copied if ``buf`` is not a buffer
+    (a list of ints)"""
+    try:
+        return _byte_view(buf, start, end)
+    except TypeError:
+        return memoryview(bytes(buf[start:end]))
+
+
+def _in_view(buf, start, end):
+    """A byte memoryview to receive ``buf[start:end]`` in, and whether it has to
+    be copied into ``buf`` afterwards, as ``buf`` is not a buffer (a list)"""
+    try:
+        view = _byte_view(buf, start, end)
+    except TypeError:
+        return memoryview(bytearray(len(buf[start:end]))), True
+    if view.readonly:
+        raise TypeError("cannot read into a read-only buffer")
+    return view, False
+
+
+def _copy_back(buf, start, view):
+    """Store the received bytes into the items of ``buf`` from ``start`` on"""
+    for i, value in enumerate(view):
+        buf[start + i] = value
+
 
 class SPI:
-    """SPI Class"""
+    """SPI Class
+
+    Settings are only sent to the kernel when they change, and transfers go
+    straight from and into the caller's buffers in chunks of the spidev
+    buffer size, without building lists.
+    """
 
     MSB = 0
     LSB = 1
@@ -27,6 +81,12 @@ class SPI:
         self.mosi_pin = None
         self.miso_pin = None
         self.chip = None
+        self._applied = None  # (baudrate, mode, bits) last set on the device
+        self._chunk_size = _spidev_bufsiz(self._spi.chunk_size)
+        # staging for read-only output and for the value written while reading
+        self._scratch = bytearray(self._chunk_size)
+        self._fill = bytearray(self._chunk_size)
+        self._fill_value = 0
 
     # pylint: disable=too-many-arguments,unused-argument
     def init(
@@ -71,20 +131,60 @@ class SPI:
         """Return the current baudrate"""
         return self.baudrate
 
+    def _apply_settings(self):
+        """Set the speed, mode and word size on the device if they changed"""
+        settings = (self.baudrate, self.mode, self.bits)
+        if settings != self._applied:
+            self._spi.max_speed_hz = self.baudrate
+            self._spi.mode = self.mode
+            self._spi.bits_per_word = self.bits
+            self._applied = settings
+
+    def _transfer(self, view_out, view_in):
+        """Clock out ``view_out`` and read into ``view_in``, byte memoryviews of
+        the same length (``view_in`` may be None), a spidev buffer at a time"""
+        length = len(view_out)
+        for offset in range(0, length, self._chunk_size):
+            size = min(self._chunk_size, length - offset)
+            chunk = view_out[offset : offset + size]
+            if chunk.readonly:
+                scratch = memoryview(self._scratch)[:size]
+                scratch[:] = chunk
+                chunk = scratch
+            # the ctypes objects export the buffers while the kernel uses them
+            tx_buf = ctypes.c_char.from_buffer(chunk)
+            rx_buf = None
+            rx_address = 0
+            if view_in is not None:
+                rx_buf = ctypes.c_char.from_buffer(view_in[offset : offset + size])
+                rx_address = ctypes.addressof(rx_buf)
+            transfer = struct.pack(
+                spi.SPI._IOC_TRANSFER_FORMAT,  # pylint: disable=protected-access
+                ctypes.addressof(tx_buf),
+                rx_address,
+                size,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+            )
+            ioctl(
+                self._spi.handle,
+                spi.SPI._IOC_MESSAGE,  # pylint: disable=protected-access
+                transfer,
+            )
+
     def write(self, buf, start=0, end=None):
         """Write data from the buffer to SPI"""
         if not buf:
             return
-        if end is None:
-            end = len(buf)
         try:
-            # self._spi.open(self._port, 0)
             self.set_no_cs()
-            self._spi.max_speed_hz = self.baudrate
-            self._spi.mode = self.mode
-            self._spi.bits_per_word = self.bits
-            self._spi.writebytes(buf[start:end])
-            # self._spi.close()
+            self._apply_settings()
+            self._transfer(_out_view(buf, start, end), None)
         except FileNotFoundError:
             print("Could not open SPI device - check if SPI is enabled in kernel!")
             raise
@@ -93,18 +193,17 @@ class SPI:
         """Read data from SPI and into the buffer"""
         if not buf:
             return
-        if end is None:
-            end = len(buf)
+        view_in, copy_back = _in_view(buf, start, end)
+        if write_value != self._fill_value:
+            self._fill[:] = bytes([write_value]) * self._chunk_size
+            self._fill_value = write_value
         try:
-            # self._spi.open(self._port, 0)
-            # self.set_no_cs()
-            self._spi.max_speed_hz = self.baudrate
-            self._spi.mode = self.mode
-            self._spi.bits_per_word = self.bits
-            data = self._spi.transfer([write_value] * (end - start))
-            for i in range(end - start):  # 'readinto' the given buffer
-                buf[start + i] = data[i]
-            # self._spi.close()
+            self._apply_settings()
+            for offset in range(0, len(view_in), self._chunk_size):
+                chunk_in = view_in[offset : offset + self._chunk_size]
+                self._transfer(memoryview(self._fill)[: len(chunk_in)], chunk_in)
+            if copy_back:
+                _copy_back(buf, start, view_in)
         except FileNotFoundError:
             print("Could not open SPI device - check if SPI is enabled in kernel!")
             raise
@@ -118,22 +217,15 @@ class SPI:
         """
         if not buffer_out or not buffer_in:
             return
-        if out_end is None:
-            out_end = len(buffer_out)
-        if in_end is None:
-            in_end = len(buffer_in)
-        if out_end - out_start != in_end - in_start:
+        view_out = _out_view(buffer_out, out_start, out_end)
+        view_in, copy_back = _in_view(buffer_in, in_start, in_end)
+        if len(view_out) != len(view_in):
             raise RuntimeError("Buffer slices must be of equal length.")
         try:
-            # self._spi.open(self._port, 0)
-            # self.set_no_cs()
-            self._spi.max_speed_hz = self.baudrate
-            self._spi.mode = self.mode
-            self._spi.bits_per_word = self.bits
-            data = self._spi.transfer(list(buffer_out[out_start : out_end + 1]))
-            for i in range((in_end - in_start)):
-                buffer_in[i + in_start] = data[i]
-            # self._spi.close()
+            self._apply_settings()
+            self._transfer(view_out, view_in)
+            if copy_back:
+                _copy_back(buffer_in, in_start, view_in)
         except FileNotFoundError:
             print("Could not open SPI device - check if SPI is enabled in kernel!")
             raise
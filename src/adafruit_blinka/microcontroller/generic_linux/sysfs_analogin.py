@@ -11,6 +11,10 @@ See `CircuitPython:analogio` in CircuitPython for more details.
 """
 
 import os
+import re
+import sys
+import warnings
+from array import array
 from adafruit_blinka import ContextManaged
 
 try:
@@ -19,16 +23,34 @@ except ImportError:
     raise RuntimeError("No Analog Inputs defined for this board") from ImportError
 
 
+# e.g. "le:u12/16>>4", see Documentation/ABI/testing/sysfs-bus-iio
+_SCAN_TYPE = re.compile(r"([bl]e):([su])(\d+)/(\d+)(?:X\d+)?>>(\d+)")
+
+
+def _write_attr(path, value):
+    # with the newline an empty value is still written, which clears the attribute
+    with open(path, "w", encoding="utf-8") as attr:
+        attr.write(value + "\n")
+
+
+def _read_attr(path):
+    with open(path, "r", encoding="utf-8") as attr:
+        return attr.read().strip()
+
+
 class AnalogIn(ContextManaged):
     """Analog Input Class"""
 
     # Sysfs paths
     _sysfs_path = "/sys/bus/iio/devices/"
     _device_path = "iio:device{}"
+    _dev_path = "/dev/iio:device{}"
+    _hrtimer_path = "/sys/kernel/config/iio/triggers/hrtimer/"
 
     # Channel paths
     _channel_path = "in_voltage{}_raw"
     _scale_path = "in_voltage_scale"
+    _scan_element_path = "scan_elements/in_voltage{}_{}"
 
     def __init__(self, adc_id):
         """Instantiate an AnalogIn object and verify the sysfs IIO
@@ -49,6 +71,8 @@ class AnalogIn(ContextManaged):
         self.id = adc_id
         self._device = None
         self._channel = None
+        self._device_dir = None
+        self._value_fd = None
         self._open(adc_id)
 
     def __enter__(self):
@@ -72,18 +96,18 @@ class AnalogIn(ContextManaged):
             raise ValueError(
                 "AnalogIn device does not exist, check that the required modules are loaded."
             )
+        self._device_dir = device_path
 
     @property
     def value(self):
         """Read the ADC and return the value as an integer"""
-        path = os.path.join(
-            self._sysfs_path,
-            self._device_path.format(self._device),
-            self._channel_path.format(self._channel),
-        )
-
-        with open(path, "r", encoding="utf-8") as analog_in:
-            return int(analog_in.read().strip())
+        if self._value_fd is None:
+            path = os.path.join(
+                self._device_dir, self._channel_path.format(self._channel)
+            )
+            self._value_fd = os.open(path, os.O_RDONLY)
+        # every read from the start of the attribute takes a new sample
+        return int(os.pread(self._value_fd, 16, 0))
 
     # pylint: disable=no-self-use
     @value.setter
@@ -93,6 +117,188 @@ class AnalogIn(ContextManaged):
 
     # pylint: enable=no-self-use
 
+    def capture(self, block_size=256, *, sample_rate=None, trigger=None, buffer=None):
+        """Stream samples through the IIO buffer of the ADC, for rates that reading
+        `value` cannot keep up with.
+
+        Enables this channel (only) as a scan element and the buffer of the IIO
+        device, and yields blocks of ``block_size`` samples read from
+        ``/dev/iio:deviceN``, as right aligned raw values like `value` returns. The
+        same buffer is filled again for the next block, copy a block to keep it.
+        Closing the generator (or leaving the ``for`` loop) disables the buffer
+        and restores the scan elements and the trigger. `value` cannot be read
+        while a capture runs on most ADCs.
+
+        Args:
+            block_size (int): Number of samples per block
+            sample_rate (float): Samples per second, written to the
+                ``sampling_frequency`` of the device or of the trigger
+            trigger (str): Name of the IIO trigger to use. By default the current
+                trigger of the device is kept; if it has none, an hrtimer trigger is
+                created through configfs.
+            buffer (array): Array to read the samples into, ``array('H')`` for ADCs
+                with 16 bit storage, ``array('I')`` for 32 bit (``'h'`` and ``'i'``
+                for signed samples). Created if not given.
+
+        Yields:
+            memoryview: The next ``block_size`` samples
+
+        Raises:
+            ValueError: if the device has no buffer, or no trigger can be found.
+
+        Example::
+
+            for block in AnalogIn(board.A0).capture(64, sample_rate=4000):
+                pedal = sum(block) // len(block)
+        """
+        self._is_deinited()
+        device_dir = self._device_dir
+        if not os.path.isdir(os.path.join(device_dir, "buffer")):
+            raise ValueError("AnalogIn device has no IIO buffer")
+
+        endian, sign, bits, storage, shift = _SCAN_TYPE.match(
+            _read_attr(self._scan_element("type"))
+        ).groups()
+        bits, storage, shift = int(bits), int(storage), int(shift)
+        typecode = {16: "H", 32: "I"}.get(storage)
+        if typecode is None or array(typecode).itemsize * 8 != storage:
+            raise ValueError("Unsupported sample size: %d bits" % storage)
+        if sign == "s":
+            typecode = typecode.lower()
+        if buffer is None:
+            buffer = array(typecode, bytes(block_size * storage // 8))
+        elif buffer.typecode != typecode or len(buffer) < block_size:
+            raise ValueError(
+                "buffer must be an array('%s') of block_size items" % typecode
+            )
+        swap = (endian == "le") != (sys.byteorder == "little")
+        mask = (1 << bits) - 1
+        sign_bit = 1 << (bits - 1) if sign == "s" else 0
+        raw = buffer
+        if sign_bit:
+            # shift and mask the unsigned bits, then extend the sign
+            raw = memoryview(buffer).cast("B").cast(typecode.upper())
+
+        restore = []  # (path, value) to write back when done
+        fd = None
+        try:
+            self._select_channel(restore)
+            self._select_trigger(trigger, sample_rate, restore)
+            self._write_restoring(
+                os.path.join(device_dir, "buffer", "length"), 4 * block_size, restore
+            )
+            watermark = os.path.join(device_dir, "buffer", "watermark")
+            if os.path.exists(watermark):
+                self._write_restoring(watermark, block_size, restore)
+            self._write_restoring(
+                os.path.join(device_dir, "buffer", "enable"), 1, restore
+            )
+            fd = os.open(self._dev_path.format(self._device), os.O_RDONLY)
+
+            view = memoryview(buffer).cast("B")[: block_size * storage // 8]
+            samples = memoryview(buffer)[:block_size]
+            if swap:
+                # byteswap() swaps a whole array, the buffer may be longer
+                swapped = array(typecode, bytes(len(view)))
+                swapped_view = memoryview(swapped).cast("B")
+            while True:
+                filled = 0
+                while filled < len(view):
+                    filled += os.readv(fd, [view[filled:]])
+                if swap:
+                    swapped_view[:] = view
+                    swapped.byteswap()
+                    view[:] = swapped_view
+                if shift or bits < storage:
+                    for i in range(block_size):
+                        sample = (raw[i] >> shift) & mask
+                        buffer[i] = (sample ^ sign_bit) - sign_bit
+                yield samples
+        finally:
+            if fd is not None:
+                os.close(fd)
+            for path, value in reversed(restore):
+                try:
+                    if value is None:
+                        os.rmdir(path)
+                    else:
+                        _write_attr(path, value)
+                except OSError as error:
+                    warnings.warn(
+                        "could not restore {}: {}".format(path, error), RuntimeWarning
+                    )
+
+    def _is_deinited(self):
+        if self._device is None:
+            raise ValueError(
+                "Object has been deinitialize and can no longer "
+                "be used. Create a new object."
+            )
+
+    def _scan_element(self, attr):
+        return os.path.join(
+            self._device_dir, self._scan_element_path.format(self._channel, attr)
+        )
+
+    @staticmethod
+    def _write_restoring(path, value, restore):
+        """Write ``value`` to the attribute at ``path``, remembering the old value"""
+        previous = _read_attr(path)
+        if previous != str(value):
+            restore.append((path, previous))
+            _write_attr(path, str(value))
+
+    def _select_channel(self, restore):
+        """Enable the scan element of this channel and disable the others, so the
+        buffer holds nothing but its samples"""
+        scan_elements = os.path.join(self._device_dir, "scan_elements")
+        ours = os.path.basename(self._scan_element("en"))
+        for name in sorted(os.listdir(scan_elements)):
+            if name.endswith("_en") and name != ours:
+                self._write_restoring(os.path.join(scan_elements, name), 0, restore)
+        self._write_restoring(self._scan_element("en"), 1, restore)
+
+    def _select_trigger(self, trigger, sample_rate, restore):
+        """Set up the trigger that starts the conversions, and the sample rate"""
+        device_dir = self._device_dir
+        current_trigger = os.path.join(device_dir, "trigger", "current_trigger")
+        has_trigger = os.path.exists(current_trigger)
+        if trigger is None and has_trigger and not _read_attr(current_trigger):
+            if not os.path.isdir(self._hrtimer_path):
+                raise ValueError(
+                    "AnalogIn device needs an IIO trigger, pass one or load the "
+                    "iio-trig-hrtimer module"
+                )
+            trigger = "blinka-" + self._device_path.format(self._device)
+            path = os.path.join(self._hrtimer_path, trigger)
+            try:
+                os.mkdir(path)
+            except FileExistsError:
+                pass  # left behind by an interrupted capture, reuse it
+            restore.append((path, None))
+        if trigger is not None:
+            if not has_trigger:
+                raise ValueError("AnalogIn device does not use IIO triggers")
+            self._write_restoring(current_trigger, trigger, restore)
+
+        if sample_rate is None:
+            return
+        rate_attr = os.path.join(device_dir, "sampling_frequency")
+        if not os.path.exists(rate_attr) and has_trigger:
+            trigger = _read_attr(current_trigger)
+            for name in os.listdir(self._sysfs_path):
+                trigger_dir = os.path.join(self._sysfs_path, name)
+                if name.startswith("trigger") and (
+                    _read_attr(os.path.join(trigger_dir, "name")) == trigger
+                ):
+                    rate_attr = os.path.join(trigger_dir, "sampling_frequency")
+        if not os.path.exists(rate_attr):
+            raise ValueError("The sample rate of this AnalogIn device cannot be set")
+        self._write_restoring(rate_attr, sample_rate, restore)
+
     def deinit(self):
+        if self._value_fd is not None:
+            os.close(self._value_fd)
+            self._value_fd = None
         self._device = None
         self._channel = None
@@ -73,6 +73,8 @@ class Pin:
 
         self.id = pin_id
         self._fd = None
+        self._direction_fd = None
+        self._direction = None
         self._line = None
         self._path = None
 
@@ -86,14 +88,15 @@ class Pin:
         self._close()
 
     def init(self, mode=IN, pull=None):
-        """Initialize the Pin"""
+        """Initialize the Pin. The GPIO is exported and opened on the first call,
+        later calls only write the direction if it changed."""
         if mode is not None:
             if mode == self.IN:
                 self._mode = self.IN
-                self._open(self.IN)
+                self._setup(self.IN)
             elif mode == self.OUT:
                 self._mode = self.OUT
-                self._open(self.OUT)
+                self._setup(self.OUT)
             else:
                 raise RuntimeError("Invalid mode for pin: %s" % self.id)
 
@@ -124,6 +127,12 @@ class Pin:
             raise RuntimeError("Invalid value for pin")
         return self.HIGH if self._read() else self.LOW
 
+    def _setup(self, direction):
+        if self._fd is None:
+            self._open(direction)
+        elif direction != self._direction:
+            self._set_direction(direction)
+
     # pylint: disable=too-many-branches
     def _open(self, direction):
         if not isinstance(direction, str):
@@ -131,6 +140,7 @@ class Pin:
         if direction.lower() not in ["in", "out", "high", "low"]:
             raise ValueError('Invalid direction, can be: "in", "out", "high", "low".')
         gpio_path = "/sys/class/gpio/gpio{:d}".format(self.id)
+        direction_path = os.path.join(gpio_path, "direction")
 
         if not os.path.isdir(gpio_path):
             # Export the line
@@ -154,43 +164,42 @@ class Pin:
                     'Exporting GPIO: waiting for "{:s}" timed out'.format(gpio_path)
                 )
 
-            # Write direction, looping in case of EACCES errors due to delayed udev
+            # Open direction, looping in case of EACCES errors due to delayed udev
             # permission rule application after export
             for i in range(self.GPIO_OPEN_RETRIES):
                 try:
-                    with open(
-                        os.path.join(gpio_path, "direction"), "w", encoding="utf-8"
-                    ) as f_direction:
-                        f_direction.write(direction.lower() + "\n")
+                    self._direction_fd = os.open(direction_path, os.O_RDWR)
                     break
-                except IOError as e:
-                    if e.errno != errno.EACCES or (
-                        e.errno == errno.EACCES and i == self.GPIO_OPEN_RETRIES - 1
-                    ):
+                except OSError as e:
+                    if e.errno != errno.EACCES or i == self.GPIO_OPEN_RETRIES - 1:
                         raise GPIOError(
-                            e.errno, "Setting GPIO direction: " + e.strerror
-                        ) from IOError
+                            e.errno, "Opening GPIO direction: " + e.strerror
+                        ) from OSError
 
                 time.sleep(self.GPIO_OPEN_DELAY)
         else:
-            # Write direction
             try:
-                with open(
-                    os.path.join(gpio_path, "direction"), "w", encoding="utf-8"
-                ) as f_direction:
-                    f_direction.write(direction.lower() + "\n")
-            except IOError as e:
+                self._direction_fd = os.open(direction_path, os.O_RDWR)
+            except OSError as e:
                 raise GPIOError(
-                    e.errno, "Setting GPIO direction: " + e.strerror
-                ) from IOError
+                    e.errno, "Opening GPIO direction: " + e.strerror
+                ) from OSError
 
-        # Open value
+        self._path = gpio_path
         try:
-            self._fd = os.open(os.path.join(gpio_path, "value"), os.O_RDWR)
-        except OSError as e:
-            raise GPIOError(e.errno, "Opening GPIO: " + e.strerror) from OSError
+            self._set_direction(direction)
 
-        self._path = gpio_path
+            # Open value
+            try:
+                self._fd = os.open(os.path.join(gpio_path, "value"), os.O_RDWR)
+            except OSError as e:
+                raise GPIOError(e.errno, "Opening GPIO: " + e.strerror) from OSError
+        except Exception:
+            # _close() only runs for an opened value, don't leak the direction fd
+            os.close(self._direction_fd)
+            self._direction_fd = None
+            self._direction = None
+            raise
 
     # pylint: enable=too-many-branches
 
@@ -200,10 +209,14 @@ class Pin:
 
         try:
             os.close(self._fd)
+            if self._direction_fd is not None:
+                os.close(self._direction_fd)
         except OSError as e:
             raise GPIOError(e.errno, "Closing GPIO: " + e.strerror) from OSError
 
         self._fd = None
+        self._direction_fd = None
+        self._direction = None
 
         # Unexport the line
         try:
@@ -214,18 +227,12 @@ class Pin:
             raise GPIOError(e.errno, "Unexporting GPIO: " + e.strerror) from OSError
 
     def _read(self):
-        # Read value
+        # Read value, always from the start of the file
         try:
-            buf = os.read(self._fd, 2)
+            buf = os.pread(self._fd, 2, 0)
         except OSError as e:
             raise GPIOError(e.errno, "Reading GPIO: " + e.strerror) from OSError
 
-        # Rewind
-        try:
-            os.lseek(self._fd, 0, os.SEEK_SET)
-        except OSError as e:
-            raise GPIOError(e.errno, "Rewinding GPIO: " + e.strerror) from OSError
-
         if buf[0] == b"0"[0]:
             return False
         if buf[0] == b"1"[0]:
@@ -237,21 +244,12 @@ class Pin:
         if not isinstance(value, bool):
             raise TypeError("Invalid value type, should be bool.")
 
-        # Write value
+        # Write value, always at the start of the file
         try:
-            if value:
-                os.write(self._fd, b"1\n")
-            else:
-                os.write(self._fd, b"0\n")
+            os.pwrite(self._fd, b"1\n" if value else b"0\n", 0)
         except OSError as e:
             raise GPIOError(e.errno, "Writing GPIO: " + e.strerror) from OSError
 
-        # Rewind
-        try:
-            os.lseek(self._fd, 0, os.SEEK_SET)
-        except OSError as e:
-            raise GPIOError(e.errno, "Rewinding GPIO: " + e.strerror) from OSError
-
     @property
     def chip_name(self):
         """Return the Chip Name"""
@@ -292,18 +290,18 @@ class Pin:
     # Mutable properties
 
     def _get_direction(self):
+        if self._direction_fd is None:
+            raise GPIOError(None, "Getting GPIO direction: GPIO not open")
+
         # Read direction
         try:
-            with open(
-                os.path.join(self._path, "direction"), "r", encoding="utf-8"
-            ) as f_direction:
-                direction = f_direction.read()
-        except IOError as e:
+            direction = os.pread(self._direction_fd, 8, 0)
+        except OSError as e:
             raise GPIOError(
                 e.errno, "Getting GPIO direction: " + e.strerror
-            ) from IOError
+            ) from OSError
 
-        return direction.strip()
+        return direction.decode().strip()
 
     def _set_direction(self, direction):
         if not isinstance(direction, str):
@@ -311,16 +309,15 @@ class Pin:
         if direction.lower() not in ["in", "out", "high", "low"]:
             raise ValueError('Invalid direction, can be: "in", "out", "high", "low".')
 
-        # Write direction
+        # Write direction; "high" and "low" set an output with that value
+        direction = direction.lower()
         try:
-            with open(
-                os.path.join(self._path, "direction"), "w", encoding="utf-8"
-            ) as f_direction:
-                f_direction.write(direction.lower() + "\n")
-        except IOError as e:
+            os.pwrite(self._direction_fd, direction.encode() + b"\n", 0)
+        except OSError as e:
             raise GPIOError(
                 e.errno, "Setting GPIO direction: " + e.strerror
-            ) from IOError
+            ) from OSError
+        self._direction = self.OUT if direction in ("high", "low") else direction
 
     direction = property(_get_direction, _set_direction)
 
@@ -28,7 +28,13 @@ class PWMError(IOError):
 
 
 class PWMOut:
-    """Pulse Width Modulation Output Class"""
+    """Pulse Width Modulation Output Class
+
+    The duty_cycle file stays open while the PWM is in use, so a `duty_cycle`
+    update is a single write, and none if the value does not change. The period
+    and enable state are cached as well. This class is shared by the sysfs PWM
+    backends, which override the pin directory name and `_export`.
+    """
 
     # Number of retries to check for successful PWM export on open
     PWM_STAT_RETRIES = 10
@@ -42,7 +48,7 @@ class PWMOut:
     # Channel paths
     _export_path = "export"
     _unexport_path = "unexport"
-    _pin_path = "pwm{}"
+    _pin_path = "pwm{pin}"
 
     # Pin attribute paths
     _pin_period_path = "period"
@@ -73,6 +79,11 @@ class PWMOut:
         self._pwmpin = None
         self._channel = None
         self._period = 0
+        self._period_ns = 0
+        self._duty_cycle_ns = None
+        self._enabled = None
+        self._duty_cycle_fd = None
+        self._pin_dir = None
         self._open(pin, duty_cycle, frequency, variable_frequency)
 
     def __del__(self):
@@ -106,6 +117,36 @@ class PWMOut:
                 "PWM channel does not exist, check that the required modules are loaded."
             )
 
+        self._pin_dir = os.path.join(
+            channel_path,
+            self._pin_path.format(channel=self._channel, pin=self._pwmpin),
+        )
+        self._export(channel_path)
+
+        try:
+            self._duty_cycle_fd = os.open(
+                os.path.join(self._pin_dir, self._pin_duty_cycle_path), os.O_RDWR
+            )
+        except OSError as e:
+            raise PWMError(e.errno, "Opening PWM duty cycle: " + e.strerror) from e
+
+        # self._set_enabled(False) # This line causes a write error when trying to enable
+
+        # Look up the period, for fast duty cycle updates
+        self._period_ns = self._read_int_attr(self._pin_period_path, "period")
+        self._period = self._period_ns / 1e9
+
+        # self.duty_cycle = 0  # This line causes a write error when trying to enable
+
+        # set frequency
+        self.frequency = freq
+        # set duty
+        self.duty_cycle = duty
+
+        self._set_enabled(True)
+
+    def _export(self, channel_path):
+        """Export the pin, and wait until its attributes can be written"""
         try:
             with open(
                 os.path.join(channel_path, self._unexport_path), "w", encoding="utf-8"
@@ -127,9 +168,7 @@ class PWMOut:
         for i in range(PWMOut.PWM_STAT_RETRIES):
             try:
                 with open(
-                    os.path.join(
-                        channel_path, self._pin_path.format(self._pwmpin), "period"
-                    ),
+                    os.path.join(self._pin_dir, "period"),
                     "w",
                     encoding="utf-8",
                 ):
@@ -141,34 +180,30 @@ class PWMOut:
                     raise PWMError(e.errno, "Opening PWM period: " + e.strerror) from e
             sleep(PWMOut.PWM_STAT_DELAY)
 
-        # self._set_enabled(False) # This line causes a write error when trying to enable
-
-        # Look up the period, for fast duty cycle updates
-        self._period = self._get_period()
-
-        # self.duty_cycle = 0  # This line causes a write error when trying to enable
-
-        # set frequency
-        self.frequency = freq
-        # set duty
-        self.duty_cycle = duty
-
-        self._set_enabled(True)
+    def _unexport(self):
+        channel_path = os.path.join(
+            self._sysfs_path, self._channel_path.format(self._channel)
+        )
+        with open(
+            os.path.join(channel_path, self._unexport_path),
+            "w",
+            encoding="utf-8",
+        ) as f_unexport:
+            f_unexport.write("%d\n" % self._pwmpin)
+
+    def _close(self):
+        if self._duty_cycle_fd is not None:
+            os.close(self._duty_cycle_fd)
+            self._duty_cycle_fd = None
 
     def deinit(self):
         """Deinit the sysfs PWM."""
         if self._channel is not None:
-            self.duty_cycle = 0
+            if self._duty_cycle_fd is not None:
+                self.duty_cycle = 0
+            self._close()
             try:
-                channel_path = os.path.join(
-                    self._sysfs_path, self._channel_path.format(self._channel)
-                )
-                with open(
-                    os.path.join(channel_path, self._unexport_path),
-                    "w",
-                    encoding="utf-8",
-                ) as f_unexport:
-                    f_unexport.write("%d\n" % self._pwmpin)
+                self._unexport()
             except IOError as e:
                 raise PWMError(
                     e.errno, "Unexporting PWM pin: " + e.strerror
@@ -188,49 +223,29 @@ class PWMOut:
         # Make sure the pin is active
         self._is_deinited()
 
-        path = os.path.join(
-            self._sysfs_path,
-            self._channel_path.format(self._channel),
-            self._pin_path.format(self._pwmpin),
-            attr,
-        )
-
-        with open(path, "w", encoding="utf-8") as f_attr:
-            # print(value, path)
+        with open(os.path.join(self._pin_dir, attr), "w", encoding="utf-8") as f_attr:
             f_attr.write(value + "\n")
 
     def _read_pin_attr(self, attr):
         # Make sure the pin is active
         self._is_deinited()
 
-        path = os.path.join(
-            self._sysfs_path,
-            self._channel_path.format(self._channel),
-            self._pin_path.format(self._pwmpin),
-            attr,
-        )
-
-        with open(path, "r", encoding="utf-8") as f_attr:
+        with open(os.path.join(self._pin_dir, attr), "r", encoding="utf-8") as f_attr:
             return f_attr.read().strip()
 
-    # Mutable properties
-
-    def _get_period(self):
-        period_ns = self._read_pin_attr(self._pin_period_path)
+    def _read_int_attr(self, attr, name):
+        value = self._read_pin_attr(attr)
         try:
-            period_ns = int(period_ns)
+            return int(value)
         except ValueError:
-            raise PWMError(
-                None, 'Unknown period value: "%s"' % period_ns
-            ) from ValueError
+            raise PWMError(None, 'Unknown %s value: "%s"' % (name, value)) from None
 
-        # Convert period from nanoseconds to seconds
-        period = period_ns / 1e9
-
-        # Update our cached period
-        self._period = period
+    # Mutable properties
 
-        return period
+    def _get_period(self):
+        # Only changed through _set_period, no need to ask the kernel
+        self._is_deinited()
+        return self._period
 
     def _set_period(self, period):
         if not isinstance(period, (int, float)):
@@ -239,7 +254,9 @@ class PWMOut:
         # Convert period from seconds to integer nanoseconds
         period_ns = int(period * 1e9)
 
-        self._write_pin_attr(self._pin_period_path, "{}".format(period_ns))
+        if period_ns != self._period_ns:
+            self._write_pin_attr(self._pin_period_path, "{}".format(period_ns))
+            self._period_ns = period_ns
 
         # Update our cached period
         self._period = float(period)
@@ -256,19 +273,13 @@ class PWMOut:
     """
 
     def _get_duty_cycle(self):
-        duty_cycle_ns = self._read_pin_attr(self._pin_duty_cycle_path)
-        try:
-            duty_cycle_ns = int(duty_cycle_ns)
-        except ValueError:
-            raise PWMError(
-                None, 'Unknown duty cycle value: "%s"' % duty_cycle_ns
-            ) from ValueError
-
-        # Convert duty cycle from nanoseconds to seconds
-        duty_cycle = duty_cycle_ns / 1e9
+        if self._duty_cycle_ns is None:
+            self._duty_cycle_ns = self._read_int_attr(
+                self._pin_duty_cycle_path, "duty cycle"
+            )
 
         # Convert duty cycle to ratio from 0.0 to 1.0
-        duty_cycle = duty_cycle / self._period
+        duty_cycle = self._duty_cycle_ns / 1e9 / self._period
 
         # convert to 16-bit
         duty_cycle = int(duty_cycle * 65535)
@@ -283,13 +294,17 @@ class PWMOut:
         if not 0.0 <= duty_cycle <= 1.0:
             raise ValueError("Invalid duty cycle value, should be between 0.0 and 1.0.")
 
-        # Convert duty cycle from ratio to seconds
-        duty_cycle = duty_cycle * self._period
-
-        # Convert duty cycle from seconds to integer nanoseconds
-        duty_cycle_ns = int(duty_cycle * 1e9)
+        # Convert duty cycle from ratio to integer nanoseconds
+        duty_cycle_ns = int(duty_cycle * self._period * 1e9)
+        self._is_deinited()
+        if duty_cycle_ns == self._duty_cycle_ns:
+            return
 
-        self._write_pin_attr(self._pin_duty_cycle_path, "{}".format(duty_cycle_ns))
+        try:
+            os.pwrite(self._duty_cycle_fd, b"%d\n" % duty_cycle_ns, 0)
+        except OSError as e:
+            raise PWMError(e.errno, "Setting PWM duty cycle: " + e.strerror) from e
+        self._duty_cycle_ns = duty_cycle_ns
 
     duty_cycle = property(_get_duty_cycle, _set_duty_cycle)
     """Get or set the PWM's output duty cycle as a ratio from 0.0 to 1.0.
@@ -322,14 +337,18 @@ class PWMOut:
     """
 
     def _get_enabled(self):
+        if self._enabled is not None:
+            return self._enabled
+
         enabled = self._read_pin_attr(self._pin_enable_path)
 
         if enabled == "1":
-            return True
-        if enabled == "0":
-            return False
-
-        raise PWMError(None, 'Unknown enabled value: "%s"' % enabled)
+            self._enabled = True
+        elif enabled == "0":
+            self._enabled = False
+        else:
+            raise PWMError(None, 'Unknown enabled value: "%s"' % enabled)
+        return self._enabled
 
     def _set_enabled(self, value):
         """Get or set the PWM's output enabled state.
@@ -343,7 +362,9 @@ class PWMOut:
         if not isinstance(value, bool):
             raise TypeError("Invalid enabled type, should be string.")
 
-        self._write_pin_attr(self._pin_enable_path, "1" if value else "0")
+        if value != self._enabled:
+            self._write_pin_attr(self._pin_enable_path, "1" if value else "0")
+            self._enabled = value
 
     # String representation
 
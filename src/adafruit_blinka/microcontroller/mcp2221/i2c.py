@@ -50,4 +50,8 @@ class I2C:
             in_end=in_end,
         )
 
+    def transfer(self, messages):
+        """Run a list of ``(address, buffer, read)`` messages"""
+        self._mcp2221.i2c_transfer(messages)
+
     # pylint: enable=unused-argument
@@ -61,6 +61,12 @@ class MCP2221:
         if MCP2221_RESET_DELAY >= 0:
             self._reset()
         self._gp_config = [0x07] * 4  # "don't care" initial value
+        # True while the I2C engine is known to be idle after a stop, so the
+        # next transfer can skip its status request
+        self._i2c_ready = False
+        # True while the I2C engine holds a write without stop, which only the
+        # repeated start read that follows it may skip the status request for
+        self._i2c_restart_pending = False
         for pin in range(4):
             self.gp_set_mode(pin, self.GP_GPIO)  # set to GPIO mode
             self.gpio_set_direction(pin, 1)  # set to INPUT
@@ -79,7 +85,8 @@ class MCP2221:
         # remaing bytes = 64 byte report data
         # https://github.com/libusb/hidapi/blob/083223e77952e1ef57e6b77796536a3359c1b2a3/hidapi/hidapi.h#L185
         self._hid.write(b"\0" + report + b"\0" * (64 - len(report)))
-        time.sleep(MCP2221_HID_DELAY)
+        if MCP2221_HID_DELAY:
+            time.sleep(MCP2221_HID_DELAY)
         if response:
             # return is 64 byte response report
             return self._hid.read(64)
@@ -207,8 +214,10 @@ class MCP2221:
 
     # pylint: disable=too-many-arguments,too-many-branches
     def _i2c_write(self, cmd, address, buffer, start=0, end=None):
-        if self._i2c_state() != 0x00:
+        if not self._i2c_ready and self._i2c_state() != 0x00:
             self._i2c_cancel()
+        self._i2c_ready = False
+        self._i2c_restart_pending = False
 
         end = end if end else len(buffer)
         length = end - start
@@ -231,14 +240,14 @@ class MCP2221:
                     RESP_I2C_STOP_TOUT,
                 ):
                     raise RuntimeError("Unrecoverable I2C state failure")
+                # still busy with the previous chunk
                 retries += 1
                 if retries >= MCP2221_RETRY_MAX:
                     raise RuntimeError("I2C write error, max retries reached.")
                 time.sleep(0.001)
                 continue  # try again
-            # yay chunk sent!
-            while self._i2c_state() == RESP_I2C_PARTIALDATA:
-                time.sleep(0.001)
+            # yay chunk sent! the next chunk is rejected while this one is
+            # still going out, so there is no need to ask for the state here
             if not buffer:
                 break
             start += chunk
@@ -262,14 +271,25 @@ class MCP2221:
                 RESP_I2C_STOP_TOUT,
             ):
                 raise RuntimeError("Unrecoverable I2C state failure")
+            # only wait while the chip reports that it is still busy
             time.sleep(0.001)
         else:
             raise RuntimeError("I2C write error: max retries reached.")
-        # whew success!
+        # whew success! a write without stop leaves the bus waiting for the restart
+        if cmd == 0x94:
+            self._i2c_restart_pending = True
+        else:
+            self._i2c_ready = True
 
     def _i2c_read(self, cmd, address, buffer, start=0, end=None):
-        if self._i2c_state() not in (RESP_I2C_WRITINGNOSTOP, 0):
+        if (
+            not self._i2c_ready
+            and not (cmd == 0x93 and self._i2c_restart_pending)
+            and self._i2c_state() not in (RESP_I2C_WRITINGNOSTOP, 0)
+        ):
             self._i2c_cancel()
+        self._i2c_ready = False
+        self._i2c_restart_pending = False
 
         end = end if end else len(buffer)
         length = end - start
@@ -308,9 +328,9 @@ class MCP2221:
 
             # move data into buffer
             chunk = min(end - start, 60)
-            for i, k in enumerate(range(start, start + chunk)):
-                buffer[k] = resp[4 + i]
+            buffer[start : start + chunk] = bytes(resp[4 : 4 + chunk])
             start += chunk
+        self._i2c_ready = True
 
     # pylint: enable=too-many-arguments
 
@@ -353,6 +373,27 @@ class MCP2221:
         self._i2c_write(0x94, address, out_buffer, out_start, out_end)
         self._i2c_read(0x93, address, in_buffer, in_start, in_end)
 
+    def i2c_transfer(self, messages):
+        """Run a list of ``(address, buffer, read)`` messages. A write followed by a
+        read from the same address is done without a stop in between, like
+        `i2c_writeto_then_readfrom`, as the MCP2221 can't chain anything else."""
+        index = 0
+        while index < len(messages):
+            address, buffer, read = messages[index]
+            if read:
+                self._i2c_read(0x91, address, buffer)
+            elif (
+                index + 1 < len(messages)
+                and messages[index + 1][0] == address
+                and messages[index + 1][2]
+            ):
+                self._i2c_write(0x94, address, buffer)
+                index += 1
+                self._i2c_read(0x93, address, messages[index][1])
+            else:
+                self._i2c_write(0x90, address, buffer)
+            index += 1
+
     def i2c_scan(self, *, start=0, end=0x79):
         """Perform an I2C Device Scan"""
         found = []
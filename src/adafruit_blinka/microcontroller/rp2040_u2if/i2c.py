@@ -55,6 +55,11 @@ class I2C:
             in_end=in_end,
         )
 
+    def transfer(self, messages):
+        """Run a list of ``(address, buffer, read)`` messages"""
+        rp2040_u2if.i2c_set_port(self._index)
+        rp2040_u2if.i2c_transfer(messages)
+
     # pylint: enable=unused-argument
 
 
@@ -10,11 +10,9 @@ def neopixel_write(gpio, buf):
     """NeoPixel Writing Function"""
 
     # pad output buffer from 3 bpp to 4 bpp
-    buffer = []
-    for i in range(0, len(buf), 3):
-        buffer.append(0)
-        buffer.append(buf[i + 2])
-        buffer.append(buf[i + 1])
-        buffer.append(buf[i])
+    buffer = bytearray(len(buf) // 3 * 4)
+    buffer[1::4] = buf[2::3]
+    buffer[2::4] = buf[1::3]
+    buffer[3::4] = buf[0::3]
 
     rp2040_u2if.neopixel_write(gpio, buffer)
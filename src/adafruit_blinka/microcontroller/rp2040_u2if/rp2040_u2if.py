@@ -6,10 +6,21 @@
 
 import os
 import time
+from contextlib import contextmanager
 import hid
 
 # Use to set delay between reset and device reopen. if negative, don't reset at all
 RP2040_U2IF_RESET_DELAY = float(os.environ.get("RP2040_U2IF_RESET_DELAY", 1))
+# Number of deferred commands sent before their responses are collected
+RP2040_U2IF_MAX_PENDING = int(os.environ.get("RP2040_U2IF_MAX_PENDING", 8))
+# Largest I2C read that fits in one response report
+I2C_READ_CHUNK = 64 - 2
+# Allow longer I2C reads, done as several reads that each start and address the
+# device again. Only right for devices that keep counting up from where the
+# previous read stopped, most register based devices start over instead.
+RP2040_U2IF_I2C_SPLIT_READS = bool(
+    int(os.environ.get("RP2040_U2IF_I2C_SPLIT_READS", 0))
+)
 
 # pylint: disable=import-outside-toplevel,too-many-branches,too-many-statements
 # pylint: disable=too-many-arguments,too-many-function-args, too-many-public-methods
@@ -79,19 +90,86 @@ class RP2040_u2if:
         self._spi_index = None
         self._serial = None
         self._neopixel_initialized = False
+        self._neopixel_busy = False
         self._uart_rx_buffer = None
+        self._deferring = 0
+        # (command, error message or None, buffer to read into or None)
+        self._pending = []
 
-    def _hid_xfer(self, report, response=True):
-        """Perform HID Transfer"""
+    def _hid_write(self, report):
         # first byte is report ID, which =0
         # remaing bytes = 64 byte report data
         # https://github.com/libusb/hidapi/blob/083223e77952e1ef57e6b77796536a3359c1b2a3/hidapi/hidapi.h#L185
         self._hid.write(b"\0" + report + b"\0" * (64 - len(report)))
+
+    def _hid_xfer(self, report, response=True):
+        """Perform HID Transfer"""
+        if self._pending or self._neopixel_busy:
+            self._collect()
+        self._hid_write(report)
         if response:
             # return is 64 byte response report
             return self._hid.read(64)
         return None
 
+    def _command(self, report, error, buffer=None):
+        """Send a command, check its response and copy the data following the
+        status byte into buffer. Inside `deferred` only the command is sent."""
+        if self._deferring:
+            if len(self._pending) >= RP2040_U2IF_MAX_PENDING:
+                self._collect()
+            self._hid_write(report)
+            self._pending.append((report[0], error, buffer))
+            return
+        resp = self._hid_xfer(report, True)
+        if resp[1] != self.RESP_OK and error is not None:
+            raise RuntimeError(error)
+        if buffer is not None:
+            buffer[:] = bytes(resp[2 : 2 + len(buffer)])
+
+    def _collect(self):
+        """Read the responses of deferred commands and of a running NeoPixel write"""
+        error = None
+        while self._pending or self._neopixel_busy:
+            resp = self._hid.read(64)
+            if self._neopixel_busy and resp[0] == self.WS2812B_WRITE:
+                self._neopixel_busy = False
+                if resp[1] != self.RESP_OK:
+                    error = error or "Neopixel write (flush) error."
+                continue
+            if not self._pending:
+                continue
+            command, message, buffer = self._pending.pop(0)
+            if resp[0] != command:
+                # a report was lost or is extra, the responses left can't be
+                # matched to their commands any more
+                self._pending = []
+                raise RuntimeError(
+                    "Response to command 0x{:02x} while waiting for 0x{:02x}.".format(
+                        resp[0], command
+                    )
+                )
+            if resp[1] != self.RESP_OK:
+                # keep reading, so the following responses stay in sync
+                error = error or message
+            elif buffer is not None:
+                buffer[:] = bytes(resp[2 : 2 + len(buffer)])
+        if error is not None:
+            raise RuntimeError(error)
+
+    @contextmanager
+    def deferred(self):
+        """Send GPIO writes and I2C transfers without waiting for each response.
+        The responses are collected, and I2C reads copied into their buffers,
+        when the block ends or a command needs its response right away."""
+        self._deferring += 1
+        try:
+            yield
+        finally:
+            self._deferring -= 1
+            if not self._deferring:
+                self._collect()
+
     def _reset(self):
         self._hid_xfer(bytes([self.SYS_RESET]), False)
         self._hid.close()
@@ -140,14 +218,15 @@ class RP2040_u2if:
 
     def gpio_set_pin(self, pin_id, value):
         """Set Current GPIO Pin Value"""
-        self._hid_xfer(
+        self._command(
             bytes(
                 [
                     self.GPIO_SET_VALUE,
                     pin_id,
                     int(value),
                 ]
-            )
+            ),
+            None,
         )
 
     def gpio_get_pin(self, pin_id):
@@ -230,34 +309,42 @@ class RP2040_u2if:
         while (end - start) > 0:
             remain_bytes = end - start
             chunk = min(remain_bytes, 64 - 7)
-            resp = self._hid_xfer(
+            self._command(
                 bytes([write_cmd, address, stop_flag])
                 + remain_bytes.to_bytes(4, byteorder="little")
                 + buffer[start : (start + chunk)],
-                True,
+                "I2C write error",
             )
-            if resp[1] != self.RESP_OK:
-                raise RuntimeError("I2C write error")
             start += chunk
 
     def _i2c_read(self, address, buffer, start=0, end=None):
         """Read data from an address and into the buffer"""
-        # TODO: support chunkified reads
         if self._i2c_index is None:
             raise RuntimeError("I2C bus not initialized.")
 
         end = end if end else len(buffer)
 
         read_cmd = self.I2C0_READ if self._i2c_index == 0 else self.I2C1_READ
-        stop_flag = 0x01  # always stop
-        read_size = end - start
+        view = memoryview(buffer)[start:end]
+        read_size = len(view)
+        if read_size > I2C_READ_CHUNK and not RP2040_U2IF_I2C_SPLIT_READS:
+            raise ValueError(
+                "I2C reads are limited to %d bytes, set RP2040_U2IF_I2C_SPLIT_READS=1 "
+                "to split longer ones into separate reads" % I2C_READ_CHUNK
+            )
 
-        resp = self._hid_xfer(bytes([read_cmd, address, stop_flag, read_size]), True)
-        if resp[1] != self.RESP_OK:
-            raise RuntimeError("I2C write error")
-        # move into buffer
-        for i in range(read_size):
-            buffer[start + i] = resp[i + 2]
+        # the firmware can't continue a read, so longer ones are split into
+        # separate reads, each with a repeated start, and a stop after the last
+        offset = 0
+        while offset < read_size:
+            chunk = min(read_size - offset, I2C_READ_CHUNK)
+            stop_flag = 0x01 if offset + chunk == read_size else 0x00
+            self._command(
+                bytes([read_cmd, address, stop_flag, chunk]),
+                "I2C read error",
+                view[offset : offset + chunk],
+            )
+            offset += chunk
 
     def i2c_writeto(self, address, buffer, *, start=0, end=None):
         """Write data from the buffer to an address"""
@@ -284,6 +371,20 @@ class RP2040_u2if:
         self._i2c_write(address, out_buffer, out_start, out_end, False)
         self._i2c_read(address, in_buffer, in_start, in_end)
 
+    def i2c_transfer(self, messages):
+        """Run a list of ``(address, buffer, read)`` messages as deferred commands.
+        A write followed by a read from the same address gets no stop in between."""
+        with self.deferred():
+            for index, (address, buffer, read) in enumerate(messages):
+                if read:
+                    self._i2c_read(address, buffer)
+                    continue
+                following = messages[index + 1 : index + 2]
+                stop = not (
+                    following and following[0][0] == address and following[0][2]
+                )
+                self._i2c_write(address, buffer, stop=stop)
+
     def i2c_scan(self, *, start=0, end=0x79):
         """Perform an I2C Device Scan"""
         if self._i2c_index is None:
@@ -437,13 +538,10 @@ class RP2040_u2if:
         if len(buf) % 64 == 0:
             self._serial.write([0])
         self._serial.flush()
-        # polling loop to wait for write complete?
-        time.sleep(0.1)
-        resp = self._hid.read(64)
-        while resp[0] != self.WS2812B_WRITE:
-            resp = self._hid.read(64)
-        if resp[1] != self.RESP_OK:
-            raise RuntimeError("Neopixel write (flush) error.")
+        # the firmware answers with another WS2812B_WRITE response once the
+        # pixels are out. It is collected before the next command is sent,
+        # so the next frame can be prepared meanwhile.
+        self._neopixel_busy = True
 
     # ----------------------------------------------------------------
     # PWM
@@ -10,6 +10,8 @@ See `CircuitPython:busio` in CircuitPython for more details.
 * Author(s): cefn
 """
 
+import time
+
 try:
     import threading
 except ImportError:
@@ -29,8 +31,13 @@ class I2C(Lockable):
     """
     Busio I2C Class for CircuitPython Compatibility. Used
     for both MicroPython and Linux.
+
+    Set ``tracer`` to an ``adafruit_bus_device.i2c_trace.I2CTracer`` to record
+    every transaction.
     """
 
+    tracer = None
+
     def __init__(self, scl, sda, frequency=100000):
         self.init(scl, sda, frequency)
 
@@ -162,6 +169,10 @@ class I2C(Lockable):
                 end = len(buffer)
             buffer = memoryview(buffer)[start:end]
         stop = True  # remove for efficiency later
+        if self.tracer is not None:
+            return self._traced(
+                address, "read", len(buffer), self._i2c.readfrom_into, buffer, stop=stop
+            )
         return self._i2c.readfrom_into(address, buffer, stop=stop)
 
     def writeto(self, address, buffer, *, start=0, end=None, stop=True):
@@ -169,9 +180,11 @@ class I2C(Lockable):
         if isinstance(buffer, str):
             buffer = bytes([ord(x) for x in buffer])
         if start != 0 or end is not None:
-            if end is None:
-                return self._i2c.writeto(address, memoryview(buffer)[start:], stop=stop)
-            return self._i2c.writeto(address, memoryview(buffer)[start:end], stop=stop)
+            buffer = memoryview(buffer)[start:end]
+        if self.tracer is not None:
+            return self._traced(
+                address, "write", len(buffer), self._i2c.writeto, buffer, stop=stop
+            )
         return self._i2c.writeto(address, buffer, stop=stop)
 
     def writeto_then_readfrom(
@@ -189,6 +202,23 @@ class I2C(Lockable):
         """ "Write to a device at specified address from a buffer then read
         from a device at specified address into a buffer
         """
+        if self.tracer is not None:
+            nbytes = len(memoryview(buffer_out)[out_start:out_end]) + len(
+                memoryview(buffer_in)[in_start:in_end]
+            )
+            return self._traced(
+                address,
+                "write_then_readinto",
+                nbytes,
+                self._i2c.writeto_then_readfrom,
+                buffer_out,
+                buffer_in,
+                out_start=out_start,
+                out_end=out_end,
+                in_start=in_start,
+                in_end=in_end,
+                stop=stop,
+            )
         return self._i2c.writeto_then_readfrom(
             address,
             buffer_out,
@@ -200,6 +230,65 @@ class I2C(Lockable):
             stop=stop,
         )
 
+    def batch(self, operations):
+        """Run a list of ``(address, buffer_out, buffer_in)`` operations, possibly on
+        different devices, while holding the lock once. ``buffer_out`` is written and
+        then ``buffer_in`` is read; either may be `None`.
+
+        Backends that implement ``transfer()`` run the whole list as one combined
+        transaction (repeated starts, a single stop). Others run the operations
+        one after another.
+        """
+        if hasattr(self._i2c, "transfer"):
+            messages = []
+            for address, buffer_out, buffer_in in operations:
+                if buffer_out is not None:
+                    messages.append((address, buffer_out, False))
+                if buffer_in is not None:
+                    messages.append((address, buffer_in, True))
+            if self.tracer is None:
+                return self._i2c.transfer(messages)
+            start = time.perf_counter()
+            try:
+                return self._i2c.transfer(messages)
+            finally:
+                self._trace_batch(operations, start, time.perf_counter())
+        for address, buffer_out, buffer_in in operations:
+            if buffer_in is None:
+                self.writeto(address, buffer_out)
+            elif buffer_out is None:
+                self.readfrom_into(address, buffer_in)
+            else:
+                self.writeto_then_readfrom(address, buffer_out, buffer_in)
+        return None
+
+    def _traced(self, address, operation, nbytes, func, *args, **kwargs):
+        """Run a transaction and record it with the tracer"""
+        start = time.perf_counter()
+        try:
+            return func(address, *args, **kwargs)
+        finally:
+            self.tracer.record(address, operation, nbytes, start, time.perf_counter())
+
+    def _trace_batch(self, operations, start, end):
+        """Record a combined transaction as one ``"batch"`` sample, as the time of
+        its operations can't be told apart. The address is `None` if the batch
+        spans several devices."""
+        addresses = {address for address, _, _ in operations}
+        nbytes = sum(
+            len(buffer)
+            for _, buffer_out, buffer_in in operations
+            for buffer in (buffer_out, buffer_in)
+            if buffer is not None
+        )
+        self.tracer.record(
+            addresses.pop() if len(addresses) == 1 else None,
+            "batch",
+            nbytes,
+            start,
+            end,
+        )
+
 
 class SPI(Lockable):
     """
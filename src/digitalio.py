@@ -10,6 +10,8 @@ See `CircuitPython:digitalio` in CircuitPython for more details.
 * Author(s): cefn
 """
 
+import sys
+
 from adafruit_blinka.agnostic import board_id, detector
 
 # pylint: disable=ungrouped-imports,wrong-import-position
@@ -248,3 +250,146 @@ class DigitalInOut(ContextManaged):
             self._pin.init(mode=Pin.OPEN_DRAIN)
         elif mod is DriveMode.PUSH_PULL:
             self._pin.init(mode=Pin.OUT)
+
+
+class _PinPort:
+    """Port made of single pins, for backends without bulk access"""
+
+    def __init__(self, pins):
+        self._pins = pins
+
+    def init(self, mode, pull=None):
+        """Initialize all pins"""
+        for pin in self._pins:
+            pin.init(mode=mode, pull=pull)
+
+    def value(self, val=None):
+        """Return the values of all pins as a bitmask, or set them from one"""
+        if val is None:
+            mask = 0
+            for bit, pin in enumerate(self._pins):
+                if pin.value():
+                    mask |= 1 << bit
+            return mask
+        for bit, pin in enumerate(self._pins):
+            pin.value((val >> bit) & 1)
+        return None
+
+    def deinit(self):
+        """Release the pins"""
+        self._pins = []
+
+
+class DigitalInOutGroup(ContextManaged):
+    """Several digital pins used together, e.g. the columns of a key matrix. Their
+    values are read and written as one integer, bit ``i`` being ``pins[i]``.
+    Backends with bulk GPIO access (libgpiod) do that with one request per GPIO
+    chip instead of one per pin.
+
+    Only push-pull outputs are supported."""
+
+    def __init__(self, pins):
+        port = getattr(sys.modules[Pin.__module__], "Port", None)
+        if port is not None:
+            self._port = port([pin.id for pin in pins])
+        else:
+            self._port = _PinPort([Pin(pin.id) for pin in pins])
+        self._count = len(pins)
+        self.direction = Direction.INPUT
+
+    def __len__(self):
+        return self._count
+
+    def switch_to_output(self, value=0):
+        """Switch all pins to outputs, with the given bitmask as values"""
+        self.direction = Direction.OUTPUT
+        self.value = value
+
+    def switch_to_input(self, pull=None):
+        """Switch all pins to inputs"""
+        self.direction = Direction.INPUT
+        self.pull = pull
+
+    def deinit(self):
+        """Release the pins"""
+        self._port.deinit()
+
+    def enable_edge_events(self):
+        """Switch all pins to inputs, keeping the current pull, that report their
+        edges through `edge_fds` and `read_edge`. Returns False, changing nothing,
+        if the backend has no edge events."""
+        if not hasattr(self._port, "init_events"):
+            return False
+        pull = self.__pull if self.direction is Direction.INPUT else None
+        try:
+            self._port.init_events(pull=self._pin_pull(pull))
+        except NotImplementedError:
+            return False
+        self.__direction = Direction.INPUT
+        self.__pull = pull
+        return True
+
+    def edge_fds(self):
+        """File descriptors to poll for edge events"""
+        return self._port.event_fds()
+
+    def read_edge(self, fd):
+        """Read an edge event from one of the `edge_fds`. Returns the pin index,
+        its new value and the time of the edge in seconds."""
+        return self._port.read_event(fd)
+
+    @property
+    def direction(self):
+        """Get or Set the direction of all pins"""
+        return self.__direction
+
+    @direction.setter
+    def direction(self, value):
+        if value is Direction.OUTPUT:
+            self._port.init(mode=Pin.OUT)
+        elif value is Direction.INPUT:
+            self._port.init(mode=Pin.IN)
+            self.__pull = None
+        else:
+            raise AttributeError("Not a Direction")
+        self.__direction = value
+
+    @property
+    def value(self):
+        """The values of all pins as a bitmask"""
+        return self._port.value()
+
+    @value.setter
+    def value(self, val):
+        if self.direction is Direction.OUTPUT:
+            self._port.value(val)
+        else:
+            raise AttributeError("Not an output")
+
+    @property
+    def pull(self):
+        """The pull direction of all pins"""
+        if self.direction is Direction.INPUT:
+            return self.__pull
+        raise AttributeError("Not an input")
+
+    @pull.setter
+    def pull(self, pul):
+        if self.direction is not Direction.INPUT:
+            raise AttributeError("Not an input")
+        self._port.init(mode=Pin.IN, pull=self._pin_pull(pul))
+        self.__pull = pul
+
+    @staticmethod
+    def _pin_pull(pul):
+        if pul is Pull.UP:
+            return Pin.PULL_UP
+        if pul is Pull.DOWN:
+            if not hasattr(Pin, "PULL_DOWN"):
+                raise NotImplementedError(
+                    "{} unsupported on {}".format(Pull.DOWN, board_id)
+                )
+            return Pin.PULL_DOWN
+        if pul is None:
+            return None
+        raise AttributeError("Not a Pull")
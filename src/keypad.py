@@ -9,24 +9,44 @@ See `CircuitPython:keypad` in CircuitPython for more details.
 * Author(s): Melissa LeBlanc-Williams
 """
 
+import os
+import select
 import time
 import threading
-from collections import deque
+from array import array
 import digitalio
 
 
+_TICKS_PERIOD = 1 << 29
+_TICKS_MAX = _TICKS_PERIOD - 1
+
+
+def _ticks_ms(seconds=None):
+    """Milliseconds of ``seconds`` from `time.monotonic` (default: now), wrapping like
+    ``supervisor.ticks_ms()``"""
+    if seconds is None:
+        seconds = time.monotonic()
+    return int(seconds * 1000) & _TICKS_MAX
+
+
 class Event:
     """A key transition event."""
 
-    def __init__(self, key_number=0, pressed=True):
+    __slots__ = ("_key_number", "_pressed", "_timestamp")
+
+    def __init__(self, key_number=0, pressed=True, timestamp=None):
         """
         Create a key transition event, which reports a key-pressed or key-released transition.
 
         :param int key_number: the key number
         :param bool pressed: ``True`` if the key was pressed; ``False`` if it was released.
+        :param int timestamp: the time in milliseconds that the keypress occurred in the
+          ``supervisor.ticks_ms`` time system. If specified as None, the current value
+          of ``supervisor.ticks_ms`` is used.
         """
         self._key_number = key_number
         self._pressed = pressed
+        self._timestamp = _ticks_ms() if timestamp is None else timestamp
 
     @property
     def key_number(self):
@@ -49,6 +69,11 @@ class Event:
         """
         return not self._pressed
 
+    @property
+    def timestamp(self):
+        """The timestamp in milliseconds, comparable to ``supervisor.ticks_ms()``"""
+        return self._timestamp
+
     def __eq__(self, other):
         """
         Two `Event` objects are equal if their `key_number`
@@ -75,10 +100,23 @@ class _EventQueue:
     instance when it is created.
     """
 
+    # The events are kept in a preallocated ring, packed into one integer each as
+    # ``timestamp << 32 | key_number << 1 | pressed``. The scanning thread only
+    # moves ``_write`` and the caller only moves ``_read``; both count modulo twice
+    # the size, so a full ring can be told from an empty one without a lock.
+
     def __init__(self, max_events):
-        self._events = deque([], max_events)
+        self._size = max_events
+        self._entries = array("Q", [0]) * max_events
+        self._read = 0
+        self._write = 0
         self._overflowed = False
 
+    def _pop(self):
+        entry = self._entries[self._read % self._size]
+        self._read = (self._read + 1) % (2 * self._size)
+        return entry
+
     def get(self):
         """
         Return the next key transition event. Return ``None`` if no events are pending.
@@ -91,9 +129,10 @@ class _EventQueue:
         :return: the next queued key transition `Event`
         :rtype: Optional[Event]
         """
-        if not self._events:
+        if self._read == self._write:
             return None
-        return self._events.popleft()
+        entry = self._pop()
+        return Event((entry >> 1) & 0x7FFFFFFF, bool(entry & 1), entry >> 32)
 
     def get_into(self, event):
         """Store the next key transition event in the supplied event, if available,
@@ -109,12 +148,13 @@ class _EventQueue:
         :return ``True`` if an event was available and stored, ``False`` if not.
         :rtype: bool
         """
-        if not self._events:
+        if self._read == self._write:
             return False
-        next_event = self._events.popleft()
+        entry = self._pop()
         # pylint: disable=protected-access
-        event._key_number = next_event._key_number
-        event._pressed = next_event._pressed
+        event._key_number = (entry >> 1) & 0x7FFFFFFF
+        event._pressed = bool(entry & 1)
+        event._timestamp = entry >> 32
         # pylint: enable=protected-access
         return True
 
@@ -122,18 +162,18 @@ class _EventQueue:
         """
         Clear any queued key transition events. Also sets `overflowed` to ``False``.
         """
-        self._events.clear()
+        self._read = self._write
         self._overflowed = False
 
     def __bool__(self):
         """``True`` if `len()` is greater than zero.
         This is an easy way to check if the queue is empty.
         """
-        return len(self._events) > 0
+        return self._read != self._write
 
     def __len__(self):
         """Return the number of events currently in the queue. Used to implement ``len()``."""
-        return len(self._events)
+        return (self._write - self._read) % (2 * self._size)
 
     @property
     def overflowed(self):
@@ -143,23 +183,189 @@ class _EventQueue:
         """
         return self._overflowed
 
-    def keypad_eventqueue_record(self, key_number, current):
+    def keypad_eventqueue_record(self, key_number, current, timestamp=None):
         """Record a new event"""
-        if len(self._events) == self._events.maxlen:
+        if (self._write - self._read) % (2 * self._size) == self._size:
             self._overflowed = True
-        else:
-            self._events.append(Event(key_number, current))
+            return
+        if timestamp is None:
+            timestamp = _ticks_ms()
+        self._entries[self._write % self._size] = (
+            timestamp << 32 | key_number << 1 | bool(current)
+        )
+        self._write = (self._write + 1) % (2 * self._size)
+
+
+class _Debouncer:
+    """
+    Filters the raw bitmask of pressed keys read by a scanner, see the ``debounce``
+    argument of `Keys`, `KeyMatrix` and `ShiftRegisterKeys`.
+
+    A debouncer keeps the state of the keys of one scanner, so each scanner needs
+    its own instance. This base class passes every scan through unchanged, like
+    scanning without a debouncer.
+    """
+
+    def __init__(self):
+        self._state = 0
+
+    def reset(self):
+        """Forget the state, as if all keys were released"""
+        self._state = 0
+
+    def update(self, pressed, now):
+        """Return the debounced bitmask of pressed keys, given the ``pressed``
+        bitmask read by a scan at ``now`` (`time.monotonic` seconds)"""
+        self._state = pressed
+        return pressed
+
+
+class EagerDebouncer(_Debouncer):
+    """
+    Reports a change on the first scan that sees it, then ignores the key for
+    ``lockout`` seconds, while it bounces. Gives the lowest latency, but a single
+    glitch is reported as a press and a release.
+
+    `Keys` with ``edge_events`` always debounces like this, with the ``lockout`` of
+    the given `EagerDebouncer` or else ``interval``.
+
+    :param float lockout: Time in seconds after a change during which the key is
+      not looked at. The level is checked again once it has passed.
+    """
+
+    def __init__(self, lockout=0.02):
+        super().__init__()
+        self.lockout = lockout
+        self._locked = 0
+        self._until = {}  # key number -> end of its lockout
+
+    def reset(self):
+        super().reset()
+        self._locked = 0
+        self._until.clear()
+
+    def update(self, pressed, now):
+        if self._until:
+            for key_number, until in list(self._until.items()):
+                if until <= now:
+                    del self._until[key_number]
+                    self._locked &= ~(1 << key_number)
+        changed = (pressed ^ self._state) & ~self._locked
+        self._state ^= changed
+        while changed:
+            bit = changed & -changed
+            changed ^= bit
+            self._until[bit.bit_length() - 1] = now + self.lockout
+            self._locked |= bit
+        return self._state
+
+
+class IntegratorDebouncer(_Debouncer):
+    """
+    Counts up for each scan that reads a key pressed and down for each scan that
+    reads it released, between 0 and ``samples``. The key is reported pressed
+    when the count reaches ``samples`` and released when it gets back to 0, so
+    noise has to win the majority of ``samples`` scans to be reported. Use it with
+    a short ``interval``: a clean press is reported after ``samples`` scans.
+
+    :param int samples: Number of scans it takes a clean change to get through
+    """
+
+    def __init__(self, samples=4):
+        super().__init__()
+        self.samples = samples
+        self._moving = 0
+        self._counts = {}  # key number -> count, for the keys in between
+
+    def reset(self):
+        super().reset()
+        self._moving = 0
+        self._counts.clear()
+
+    def update(self, pressed, now):
+        moving = (pressed ^ self._state) | self._moving
+        while moving:
+            bit = moving & -moving
+            moving ^= bit
+            key_number = bit.bit_length() - 1
+            count = self._counts.get(
+                key_number, self.samples if self._state & bit else 0
+            )
+            if pressed & bit:
+                count = min(count + 1, self.samples)
+            else:
+                count = max(count - 1, 0)
+            if 0 < count < self.samples:
+                self._counts[key_number] = count
+                self._moving |= bit
+                continue
+            if count:
+                self._state |= bit
+            else:
+                self._state &= ~bit
+            self._counts.pop(key_number, None)
+            self._moving &= ~bit
+        return self._state
+
+
+class DeferredDebouncer(_Debouncer):
+    """
+    Reports a change once a key has read the same for ``settle`` seconds. Rejects
+    bounces and glitches shorter than ``settle``, at the cost of delaying every
+    event by at least that long.
+
+    :param float settle: Time in seconds the new level must hold
+    """
+
+    def __init__(self, settle=0.01):
+        super().__init__()
+        self.settle = settle
+        self._last = 0
+        self._since = {}  # key number -> time its current level was first read
+
+    def reset(self):
+        super().reset()
+        self._last = 0
+        self._since.clear()
+
+    def update(self, pressed, now):
+        moved = pressed ^ self._last
+        self._last = pressed
+        pending = pressed ^ self._state
+        if self._since:
+            for key_number in list(self._since):
+                if not (pending >> key_number) & 1:
+                    del self._since[key_number]  # went back before it settled
+        while pending:
+            bit = pending & -pending
+            pending ^= bit
+            key_number = bit.bit_length() - 1
+            if moved & bit or key_number not in self._since:
+                self._since[key_number] = now
+            if now - self._since[key_number] >= self.settle:
+                self._state ^= bit
+                del self._since[key_number]
+        return self._state
 
 
 class _KeysBase:
-    def __init__(self, interval, max_events, scanning_function):
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self, interval, max_events, scanning_function, loop=None, debounce=None
+    ):
         self._interval = interval
+        self._debounce = debounce
         self._last_scan = time.monotonic()
         self._events = _EventQueue(max_events)
         self._scanning_function = scanning_function
-        self._scan_thread = threading.Thread(target=self._scanning_loop, daemon=True)
+        self._stop = threading.Event()
+        self._scan_thread = threading.Thread(
+            target=loop or self._scanning_loop, daemon=True
+        )
         self._scan_thread.start()
 
+    # pylint: enable=too-many-arguments
+
     @property
     def events(self):
         """The EventQueue associated with this Keys object. (read-only)"""
@@ -167,9 +373,14 @@ class _KeysBase:
 
     def deinit(self):
         """Stop scanning"""
+        self._stop.set()
+        self._wake()
         if self._scan_thread.is_alive():
             self._scan_thread.join()
 
+    def _wake(self):
+        """Interrupt the scanning thread, if it is waiting for something else"""
+
     def __enter__(self):
         """No-op used by Context Managers."""
         return self
@@ -181,11 +392,38 @@ class _KeysBase:
         """
         self.deinit()
 
+    def _scanned(self, pressed):
+        """Debounce the ``pressed`` bitmask read by the scan that started at
+        ``_last_scan`` and queue the changes, timestamped with the scan"""
+        if self._debounce is not None:
+            pressed = self._debounce.update(pressed, self._last_scan)
+        self._record_changes(pressed, _ticks_ms(self._last_scan))
+
+    def _reset_state(self):
+        self._currently_pressed = self._previously_pressed = 0
+        if self._debounce is not None:
+            self._debounce.reset()
+
+    def _record_changes(self, current, timestamp=None):
+        """Queue an event for each key whose bit in the ``current`` bitmask of pressed
+        keys differs from the previous scan"""
+        # reset() may clear the state meanwhile, work with locals
+        previous = self._currently_pressed
+        self._previously_pressed = previous
+        self._currently_pressed = current
+        changed = current ^ previous
+        while changed:
+            bit = changed & -changed
+            self._events.keypad_eventqueue_record(
+                bit.bit_length() - 1, current & bit, timestamp
+            )
+            changed ^= bit
+
     def _scanning_loop(self):
-        while True:
+        while not self._stop.is_set():
             remaining_delay = self._interval - (time.monotonic() - self._last_scan)
-            if remaining_delay > 0:
-                time.sleep(remaining_delay)
+            if remaining_delay > 0 and self._stop.wait(remaining_delay):
+                break
             self._last_scan = time.monotonic()
             self._scanning_function()
 
@@ -193,8 +431,17 @@ class _KeysBase:
 class Keys(_KeysBase):
     """Manage a set of independent keys."""
 
+    # pylint: disable=too-many-arguments
     def __init__(
-        self, pins, *, value_when_pressed, pull=True, interval=0.02, max_events=64
+        self,
+        pins,
+        *,
+        value_when_pressed,
+        pull=True,
+        interval=0.02,
+        max_events=64,
+        edge_events=True,
+        debounce=None,
     ):
         """
         Create a `Keys` object that will scan keys attached to the given sequence of pins.
@@ -222,47 +469,136 @@ class Keys(_KeysBase):
           maximum number of key transition events that are saved.
           Must be >= 1.
           If a new event arrives when the queue is full, the oldest event is discarded.
+        :param bool edge_events: Wait for edges reported by the kernel instead of
+          scanning every ``interval``, where the GPIO backend supports it (libgpiod).
+          A key's first edge is reported right away, further edges within
+          ``interval`` of it are ignored as bounces, and its level is checked again
+          when ``interval`` has passed. Only used when ``debounce`` is ``None`` or an
+          `EagerDebouncer`, whose ``lockout`` then replaces ``interval``.
+        :param debounce: How the keys are debounced: an `EagerDebouncer`,
+          `IntegratorDebouncer` or `DeferredDebouncer` instance, or ``None`` to
+          report the level read by each scan.
         """
-        self._digitalinouts = []
-        for pin in pins:
-            dio = digitalio.DigitalInOut(pin)
-            if pull:
-                dio.pull = (
-                    digitalio.Pull.DOWN if value_when_pressed else digitalio.Pull.UP
-                )
-            self._digitalinouts.append(dio)
+        # all pins are read at once, see digitalio.DigitalInOutGroup
+        self._pins = digitalio.DigitalInOutGroup(pins)
+        if pull:
+            self._pins.pull = (
+                digitalio.Pull.DOWN if value_when_pressed else digitalio.Pull.UP
+            )
 
-        self._currently_pressed = [False] * len(pins)
-        self._previously_pressed = [False] * len(pins)
+        # bitmasks of the pressed keys, bit n is key number n
+        self._currently_pressed = 0
+        self._previously_pressed = 0
+        self._all_keys = (1 << len(pins)) - 1
         self._value_when_pressed = value_when_pressed
 
-        super().__init__(interval, max_events, self._keypad_keys_scan)
+        loop = None
+        self._wake_fds = None
+        self._lockout = interval
+        if (
+            edge_events
+            and (debounce is None or isinstance(debounce, EagerDebouncer))
+            and self._pins.enable_edge_events()
+        ):
+            self._wake_fds = os.pipe()
+            self._resync = True
+            if debounce is not None:
+                self._lockout = debounce.lockout
+            debounce = None  # the edge loop does the same
+            loop = self._edge_loop
+        super().__init__(interval, max_events, self._keypad_keys_scan, loop, debounce)
+
+    # pylint: enable=too-many-arguments
 
     def deinit(self):
         """Stop scanning and release the pins."""
         super().deinit()
-        for dio in self._digitalinouts:
-            dio.deinit()
+        self._pins.deinit()
+        if self._wake_fds is not None:
+            for fd in self._wake_fds:
+                os.close(fd)
+            self._wake_fds = None
 
     def reset(self):
         """Reset the internal state of the scanner to assume that all keys are now released.
         Any key that is already pressed at the time of this call will therefore immediately cause
         a new key-pressed event to occur.
         """
-        self._currently_pressed = self._previously_pressed = [False] * self.key_count
+        self._reset_state()
+        if self._wake_fds is not None:
+            self._resync = True
+            self._wake()
 
     @property
     def key_count(self):
         """The number of keys that are being scanned. (read-only)"""
-        return len(self._digitalinouts)
+        return len(self._pins)
+
+    def _wake(self):
+        if self._wake_fds is not None:
+            os.write(self._wake_fds[1], b"\0")
+
+    def _report(self, key_number, current, timestamp):
+        bit = 1 << key_number
+        if current:
+            self._record_changes(self._currently_pressed | bit, _ticks_ms(timestamp))
+        else:
+            self._record_changes(self._currently_pressed & ~bit, _ticks_ms(timestamp))
+
+    def _edge_loop(self):
+        """Wait for edge events instead of scanning. Debouncing uses the kernel
+        timestamps of the edges, which are CLOCK_MONOTONIC like time.monotonic()
+        on current kernels; other clocks are replaced by the time of reading."""
+        poller = select.poll()
+        for fd in self._pins.edge_fds():
+            poller.register(fd, select.POLLIN | select.POLLPRI)
+        wake_fd = self._wake_fds[0]
+        poller.register(wake_fd, select.POLLIN)
+        level = 0  # bitmask of the keys whose last edge was a press
+        # key number -> end of the debounce time of its last reported edge
+        settling = {}
+
+        while not self._stop.is_set():
+            if self._resync:
+                self._resync = False
+                level = self._pins.value
+                if not self._value_when_pressed:
+                    level = ~level & self._all_keys
+                self._record_changes(level, _ticks_ms())
+
+            timeout = None
+            if settling:
+                timeout = max(0, min(settling.values()) - time.monotonic()) * 1000
+            for fd, _ in poller.poll(timeout):
+                if fd == wake_fd:
+                    os.read(wake_fd, 64)
+                    continue
+                key_number, value, timestamp = self._pins.read_edge(fd)
+                if value == self._value_when_pressed:
+                    level |= 1 << key_number
+                else:
+                    level &= ~(1 << key_number)
+                if key_number in settling:
+                    continue  # bounce, the level is checked when settled
+                now = time.monotonic()
+                if abs(timestamp - now) > 1:
+                    timestamp = now
+                settling[key_number] = timestamp + self._lockout
+                self._report(key_number, (level >> key_number) & 1, timestamp)
+
+            now = time.monotonic()
+            for key_number, settled in list(settling.items()):
+                if settled <= now:
+                    del settling[key_number]
+                    if ((level ^ self._currently_pressed) >> key_number) & 1:
+                        settling[key_number] = now + self._lockout
+                        self._report(key_number, (level >> key_number) & 1, now)
 
     def _keypad_keys_scan(self):
-        for key_number, dio in enumerate(self._digitalinouts):
-            self._previously_pressed[key_number] = self._currently_pressed[key_number]
-            current = dio.value == self._value_when_pressed
-            self._currently_pressed[key_number] = current
-            if self._previously_pressed[key_number] != current:
-                self._events.keypad_eventqueue_record(key_number, current)
+        values = self._pins.value
+        if not self._value_when_pressed:
+            values = ~values & self._all_keys
+        self._scanned(values)
 
 
 class KeyMatrix(_KeysBase):
@@ -276,6 +612,7 @@ class KeyMatrix(_KeysBase):
         columns_to_anodes=True,
         interval=0.02,
         max_events=64,
+        debounce=None,
     ):
         """
         Create a `Keys` object that will scan the key matrix attached to the given row and
@@ -301,6 +638,9 @@ class KeyMatrix(_KeysBase):
           maximum number of key transition events that are saved.
           Must be >= 1.
           If a new event arrives when the queue is full, the oldest event is discarded.
+        :param debounce: How the keys are debounced: an `EagerDebouncer`,
+          `IntegratorDebouncer` or `DeferredDebouncer` instance, or ``None`` to
+          report the level read by each scan.
         """
         self._row_digitalinouts = []
         for row_pin in row_pins:
@@ -310,33 +650,34 @@ class KeyMatrix(_KeysBase):
             )
             self._row_digitalinouts.append(row_dio)
 
-        self._column_digitalinouts = []
-        for column_pin in column_pins:
-            col_dio = digitalio.DigitalInOut(column_pin)
-            col_dio.switch_to_input(
-                pull=(digitalio.Pull.UP if columns_to_anodes else digitalio.Pull.DOWN)
-            )
-            self._column_digitalinouts.append(col_dio)
-        self._currently_pressed = [False] * len(column_pins) * len(row_pins)
-        self._previously_pressed = [False] * len(column_pins) * len(row_pins)
+        # the columns are read at once, see digitalio.DigitalInOutGroup
+        self._columns = digitalio.DigitalInOutGroup(column_pins)
+        self._columns.switch_to_input(
+            pull=(digitalio.Pull.UP if columns_to_anodes else digitalio.Pull.DOWN)
+        )
+        # bitmasks of the pressed keys, bit n is key number n
+        self._currently_pressed = 0
+        self._previously_pressed = 0
+        self._all_columns = (1 << len(column_pins)) - 1
         self._columns_to_anodes = columns_to_anodes
 
-        super().__init__(interval, max_events, self._keypad_keymatrix_scan)
+        super().__init__(
+            interval, max_events, self._keypad_keymatrix_scan, debounce=debounce
+        )
 
     # pylint: enable=too-many-arguments
 
     @property
     def key_count(self):
         """The number of keys that are being scanned. (read-only)"""
-        return len(self._row_digitalinouts) * len(self._column_digitalinouts)
+        return len(self._row_digitalinouts) * len(self._columns)
 
     def deinit(self):
         """Stop scanning and release the pins."""
         super().deinit()
         for row_dio in self._row_digitalinouts:
             row_dio.deinit()
-        for col_dio in self._column_digitalinouts:
-            col_dio.deinit()
+        self._columns.deinit()
 
     def reset(self):
         """
@@ -344,26 +685,22 @@ class KeyMatrix(_KeysBase):
         Any key that is already pressed at the time of this call will therefore immediately cause
         a new key-pressed event to occur.
         """
-        self._previously_pressed = self._currently_pressed = [False] * self.key_count
+        self._reset_state()
 
     def _row_column_to_key_number(self, row, column):
-        return row * len(self._column_digitalinouts) + column
+        return row * len(self._columns) + column
 
     def _keypad_keymatrix_scan(self):
+        current = 0
         for row, row_dio in enumerate(self._row_digitalinouts):
             row_dio.switch_to_output(
                 value=(not self._columns_to_anodes),
                 drive_mode=digitalio.DriveMode.PUSH_PULL,
             )
-            for col, col_dio in enumerate(self._column_digitalinouts):
-                key_number = self._row_column_to_key_number(row, col)
-                self._previously_pressed[key_number] = self._currently_pressed[
-                    key_number
-                ]
-                current = col_dio.value != self._columns_to_anodes
-                self._currently_pressed[key_number] = current
-                if self._previously_pressed[key_number] != current:
-                    self._events.keypad_eventqueue_record(key_number, current)
+            columns = self._columns.value
+            if self._columns_to_anodes:
+                columns = ~columns & self._all_columns
+            current |= columns << self._row_column_to_key_number(row, 0)
             row_dio.value = self._columns_to_anodes
             row_dio.switch_to_input(
                 pull=(
@@ -372,22 +709,31 @@ class KeyMatrix(_KeysBase):
                     else digitalio.Pull.DOWN
                 )
             )
+        self._scanned(current)
+
+
+# bytes with their bit order reversed, the first bit shifted in is the MSB
+_REVERSED_BITS = bytes(int("{:08b}".format(byte)[::-1], 2) for byte in range(256))
 
 
 class ShiftRegisterKeys(_KeysBase):
     """Manage a set of keys attached to an incoming shift register."""
 
+    # pylint: disable=too-many-locals
     def __init__(
         self,
         *,
-        clock,
-        data,
+        clock=None,
+        data=None,
         latch,
         value_to_latch=True,
         key_count,
         value_when_pressed,
         interval=0.02,
         max_events=64,
+        debounce=None,
+        spi=None,
+        baudrate=1000000,
     ):
         """
         Create a `Keys` object that will scan keys attached to a parallel-in serial-out
@@ -402,7 +748,10 @@ class ShiftRegisterKeys(_KeysBase):
 
         :param microcontroller.Pin clock: The shift register clock pin.
           The shift register should clock on a low-to-high transition.
-        :param microcontroller.Pin data: the incoming shift register data pin
+        :param data: the incoming shift register data pin, or a sequence of data pins
+          of chains that share ``clock`` and ``latch``. The data pins are read at
+          once, see `digitalio.DigitalInOutGroup`.
+        :type data: microcontroller.Pin or Sequence[microcontroller.Pin]
         :param microcontroller.Pin latch:
           Pin used to latch parallel data going into the shift register.
         :param bool value_to_latch: Pin state to latch data being read.
@@ -411,7 +760,10 @@ class ShiftRegisterKeys(_KeysBase):
           The default is ``True``, which is how the 74HC165 operates. The CD4021 latch is
           the opposite. Once the data is latched, it will be shifted out by toggling the
           clock pin.
-        :param int key_count: number of data lines to clock in
+        :param key_count: number of data lines to clock in for each data pin, or a
+          sequence with the number for each data pin. The keys of the first data pin
+          are numbered first.
+        :type key_count: int or Sequence[int]
         :param bool value_when_pressed: ``True`` if the pin reads high when the key is pressed.
           ``False`` if the pin reads low (is grounded) when the key is pressed.
         :param float interval: Scan keys no more often than ``interval`` to allow for debouncing.
@@ -420,34 +772,71 @@ class ShiftRegisterKeys(_KeysBase):
           maximum number of key transition events that are saved.
           Must be >= 1.
           If a new event arrives when the queue is full, the oldest event is discarded.
+        :param debounce: How the keys are debounced: an `EagerDebouncer`,
+          `IntegratorDebouncer` or `DeferredDebouncer` instance, or ``None`` to
+          report the level read by each scan.
+        :param busio.SPI spi: Clock the chain in with one SPI transfer per scan
+          instead of toggling ``clock`` and reading ``data`` for every key. SCK and
+          MISO take the place of ``clock`` and ``data``, which must not be given.
+          The bus is locked for each scan, so it may be shared with other devices
+          that have their own chip select.
+        :param int baudrate: SPI clock rate in Hz, used with ``spi``
         """
-        clock_dio = digitalio.DigitalInOut(clock)
-        clock_dio.switch_to_output(
-            value=False, drive_mode=digitalio.DriveMode.PUSH_PULL
-        )
-        self._clock = clock_dio
+        self._spi = spi
+        self._clock = self._data = None
+        chains = len(data) if isinstance(data, (list, tuple)) else 1
+        if isinstance(key_count, int):
+            self._key_counts = (key_count,) * chains
+        else:
+            self._key_counts = tuple(key_count)
+        if len(self._key_counts) != chains:
+            raise ValueError("key_count must have one entry per data pin")
+        if spi is not None:
+            if clock is not None or data is not None:
+                raise ValueError("clock and data pins cannot be used with spi")
+            self._baudrate = baudrate
+            self._buffer = bytearray((self._key_counts[0] + 7) // 8)
+        else:
+            if clock is None or data is None:
+                raise ValueError("clock and data pins are required without spi")
+            clock_dio = digitalio.DigitalInOut(clock)
+            clock_dio.switch_to_output(
+                value=False, drive_mode=digitalio.DriveMode.PUSH_PULL
+            )
+            self._clock = clock_dio
 
-        data_dio = digitalio.DigitalInOut(data)
-        data_dio.switch_to_input()
-        self._data = data_dio
+            if not isinstance(data, (list, tuple)):
+                data = (data,)
+            self._data = digitalio.DigitalInOutGroup(data)
+            self._data.switch_to_input()
+        self._all_keys = (1 << sum(self._key_counts)) - 1
 
         latch_dio = digitalio.DigitalInOut(latch)
         latch_dio.switch_to_output(value=True, drive_mode=digitalio.DriveMode.PUSH_PULL)
         self._latch = latch_dio
         self._value_to_latch = value_to_latch
 
-        self._currently_pressed = [False] * key_count
-        self._previously_pressed = [False] * key_count
+        # bitmasks of the pressed keys, bit n is key number n
+        self._currently_pressed = 0
+        self._previously_pressed = 0
         self._value_when_pressed = value_when_pressed
-        self._key_count = key_count
+        self._key_count = sum(self._key_counts)
+
+        super().__init__(
+            interval,
+            max_events,
+            self._keypad_shiftregisterkeys_scan,
+            debounce=debounce,
+        )
 
-        super().__init__(interval, max_events, self._keypad_shiftregisterkeys_scan)
+    # pylint: enable=too-many-locals
 
     def deinit(self):
         """Stop scanning and release the pins."""
         super().deinit()
-        self._clock.deinit()
-        self._data.deinit()
+        if self._clock is not None:
+            self._clock.deinit()
+            self._data.deinit()
         self._latch.deinit()
 
     def reset(self):
@@ -456,7 +845,7 @@ class ShiftRegisterKeys(_KeysBase):
         Any key that is already pressed at the time of this call will therefore immediately cause
         a new key-pressed event to occur.
         """
-        self._currently_pressed = self._previously_pressed = [False] * self._key_count
+        self._reset_state()
 
     @property
     def key_count(self):
@@ -470,13 +859,47 @@ class ShiftRegisterKeys(_KeysBase):
 
     def _keypad_shiftregisterkeys_scan(self):
         self._latch.value = self._value_to_latch
-        for key_number in range(self._key_count):
+        if self._spi is not None:
+            values = self._shift_in_spi()
+        else:
+            values = self._shift_in_gpio()
+        self._latch.value = not self._value_to_latch
+
+        if not self._value_when_pressed:
+            values = ~values & self._all_keys
+        self._scanned(values)
+
+    def _shift_in_spi(self):
+        while not self._spi.try_lock():
+            pass
+        try:
+            self._spi.configure(baudrate=self._baudrate, polarity=0, phase=0)
+            self._spi.readinto(self._buffer)
+        finally:
+            self._spi.unlock()
+        # bit 7 of the first byte is key 0, reversing the bits of each byte and
+        # reading them little endian puts key n at bit n
+        values = int.from_bytes(self._buffer.translate(_REVERSED_BITS), "little")
+        return values & self._all_keys
+
+    def _shift_in_gpio(self):
+        if len(self._key_counts) == 1:
+            values = 0
+            for key_number in range(self._key_count):
+                self._clock.value = False
+                values |= (self._data.value & 1) << key_number
+                self._clock.value = True
+            return values
+
+        # one bit per chain each clock, spread out to the key numbers of the chains
+        values = 0
+        for bit in range(max(self._key_counts)):
             self._clock.value = False
-            self._previously_pressed[key_number] = self._currently_pressed[key_number]
-            current = self._data.value == self._value_when_pressed
-            self._currently_pressed[key_number] = current
+            data = self._data.value
             self._clock.value = True
-            if self._previously_pressed[key_number] != current:
-                self._events.keypad_eventqueue_record(key_number, current)
-
-        self._latch.value = not self._value_to_latch
+            first_key = 0
+            for chain, count in enumerate(self._key_counts):
+                if bit < count:
+                    values |= ((data >> chain) & 1) << (first_key + bit)
+                first_key += count
+        return values
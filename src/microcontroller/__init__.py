@@ -13,127 +13,57 @@ import time
 
 from adafruit_platformdetect.constants import chips as ap_chip
 from adafruit_blinka.agnostic import board_id, chip_id
-from microcontroller import pin  # pylint: disable=unused-import
-from microcontroller.pin import Pin  # pylint: disable=unused-import
+from adafruit_blinka.agnostic.registry import LazyNamespace, chip_package
+from microcontroller import pin
+
+
+_CALIBRATION_SLEEPS = 20
+_sleep_slack_ns = None  # how late time.sleep() returns, measured on first use
+
+
+def _calibrate_sleep():
+    """Measure how far short time.sleep() calls overshoot on this host"""
+    overshoots = []
+    for _ in range(_CALIBRATION_SLEEPS):
+        start = time.perf_counter_ns()
+        time.sleep(0.0001)
+        overshoots.append(time.perf_counter_ns() - start - 100000)
+    overshoots.sort()
+    # the 90th percentile, so the coarse sleep seldom runs past the deadline
+    return max(0, overshoots[_CALIBRATION_SLEEPS * 9 // 10])
 
 
 def delay_us(delay):
-    """Sleep for delay usecs."""
-    time.sleep(delay / 1e6)
-
-
-# We intentionally are patching into this namespace so skip the wildcard check.
-# pylint: disable=unused-wildcard-import,wildcard-import,ungrouped-imports
-
-if chip_id == ap_chip.ESP8266:
-    from adafruit_blinka.microcontroller.esp8266 import *
-elif chip_id == ap_chip.STM32F405:
-    from adafruit_blinka.microcontroller.stm32.stm32f405 import *
-elif chip_id == ap_chip.RP2040:
-    from adafruit_blinka.microcontroller.rp2040 import *
-elif chip_id == ap_chip.BCM2XXX:
-    if board_id in [
-        "RASPBERRY_PI_4B",
-        "RASPBERRY_PI_400",
-        "RASPBERRY_PI_CM4",
-    ]:
-        from adafruit_blinka.microcontroller.bcm2711 import *
-    else:
-        from adafruit_blinka.microcontroller.bcm283x import *
-elif chip_id == ap_chip.DRA74X:
-    from adafruit_blinka.microcontroller.dra74x import *
-elif chip_id == ap_chip.AM33XX:
-    from adafruit_blinka.microcontroller.am335x import *
-elif chip_id == ap_chip.AM65XX:
-    from adafruit_blinka.microcontroller.am65xx import *
-elif chip_id == ap_chip.JH71x0:
-    from adafruit_blinka.microcontroller.starfive.JH71x0 import *
-elif chip_id == ap_chip.SUN8I:
-    from adafruit_blinka.microcontroller.allwinner.h3 import *
-elif chip_id == ap_chip.H5:
-    from adafruit_blinka.microcontroller.allwinner.h5 import *
-elif chip_id == ap_chip.H6:
-    from adafruit_blinka.microcontroller.allwinner.h6 import *
-elif chip_id == ap_chip.H616:
-    from adafruit_blinka.microcontroller.allwinner.h616 import *
-elif chip_id == ap_chip.SAMA5:
-    from adafruit_blinka.microcontroller.sama5 import *
-elif chip_id == ap_chip.T210:
-    from adafruit_blinka.microcontroller.tegra.t210 import *
-elif chip_id == ap_chip.T186:
-    from adafruit_blinka.microcontroller.tegra.t186 import *
-elif chip_id == ap_chip.T194:
-    from adafruit_blinka.microcontroller.tegra.t194 import *
-elif chip_id == ap_chip.T234:
-    from adafruit_blinka.microcontroller.tegra.t234 import *
-elif chip_id == ap_chip.S905:
-    from adafruit_blinka.microcontroller.amlogic.s905 import *
-elif chip_id == ap_chip.S905X:
-    from adafruit_blinka.microcontroller.amlogic.s905x import *
-elif chip_id == ap_chip.S905X3:
-    from adafruit_blinka.microcontroller.amlogic.s905x3 import *
-elif chip_id == ap_chip.S905Y2:
-    from adafruit_blinka.microcontroller.amlogic.s905y2 import *
-elif chip_id == ap_chip.S922X:
-    from adafruit_blinka.microcontroller.amlogic.s922x import *
-elif chip_id == ap_chip.A311D:
-    from adafruit_blinka.microcontroller.amlogic.a311d import *
-elif chip_id == ap_chip.EXYNOS5422:
-    from adafruit_blinka.microcontroller.samsung.exynos5422 import *
-elif chip_id == ap_chip.APQ8016:
-    from adafruit_blinka.microcontroller.snapdragon.apq8016 import *
-elif chip_id == ap_chip.A64:
-    from adafruit_blinka.microcontroller.allwinner.a64 import *
-elif chip_id == ap_chip.A33:
-    from adafruit_blinka.microcontroller.allwinner.a33 import *
-elif chip_id == ap_chip.RK3308:
-    from adafruit_blinka.microcontroller.rockchip.rk3308 import *
-elif chip_id == ap_chip.RK3399:
-    from adafruit_blinka.microcontroller.rockchip.rk3399 import *
-elif chip_id == ap_chip.RK3588:
-    from adafruit_blinka.microcontroller.rockchip.rk3588 import *
-elif chip_id == ap_chip.RK3328:
-    from adafruit_blinka.microcontroller.rockchip.rk3328 import *
-elif chip_id == ap_chip.RK3566:
-    from adafruit_blinka.microcontroller.rockchip.rk3566 import *
-elif chip_id == ap_chip.RK3568:
-    from adafruit_blinka.microcontroller.rockchip.rk3568 import *
-elif chip_id == ap_chip.H3:
-    from adafruit_blinka.microcontroller.allwinner.h3 import *
-elif chip_id == ap_chip.H5:
-    from adafruit_blinka.microcontroller.allwinner.h5 import *
-elif chip_id == ap_chip.IMX8MX:
-    from adafruit_blinka.microcontroller.nxp_imx8m import *
-elif chip_id == ap_chip.IMX6ULL:
-    from adafruit_blinka.microcontroller.nxp_imx6ull import *
-elif chip_id == ap_chip.HFU540:
-    from adafruit_blinka.microcontroller.hfu540 import *
-elif chip_id == ap_chip.BINHO:
-    from adafruit_blinka.microcontroller.nova import *
-elif chip_id == ap_chip.LPC4330:
-    from adafruit_blinka.microcontroller.nxp_lpc4330 import *
-elif chip_id == ap_chip.MCP2221:
-    from adafruit_blinka.microcontroller.mcp2221 import *
-elif chip_id == ap_chip.MIPS24KC:
-    from adafruit_blinka.microcontroller.atheros.ar9331 import *
-elif chip_id == ap_chip.MIPS24KEC:
-    from adafruit_blinka.microcontroller.mips24kec import *
-elif chip_id == ap_chip.FT232H:
-    from adafruit_blinka.microcontroller.ftdi_mpsse.ft232h import *
-elif chip_id == ap_chip.FT2232H:
-    from adafruit_blinka.microcontroller.ftdi_mpsse.ft2232h import *
-elif chip_id == ap_chip.PENTIUM_N3710:
-    from adafruit_blinka.microcontroller.pentium.n3710 import *
-elif chip_id == ap_chip.ATOM_J4105:
-    from adafruit_blinka.microcontroller.pentium.j4105 import *
-elif chip_id == ap_chip.STM32MP157:
-    from adafruit_blinka.microcontroller.stm32.stm32mp157 import *
-elif chip_id == ap_chip.MT8167:
-    from adafruit_blinka.microcontroller.mt8167 import *
-elif chip_id == ap_chip.RP2040_U2IF:
-    from adafruit_blinka.microcontroller.rp2040_u2if import *
-elif chip_id == ap_chip.D1_RISCV:
-    from adafruit_blinka.microcontroller.allwinner.D1 import *
+    """Sleep for delay usecs.
+
+    Sleeps with `time.sleep` until the time left is within the timer slack of
+    the host, then spins on `time.perf_counter_ns` for the rest, as
+    `time.sleep` alone returns 50-100 usecs late or more on Linux.
+    """
+    global _sleep_slack_ns  # pylint: disable=global-statement
+    if _sleep_slack_ns is None:
+        _sleep_slack_ns = _calibrate_sleep()
+    start = time.perf_counter_ns()
+    end = start + int(delay * 1000)
+    coarse = end - start - _sleep_slack_ns
+    if coarse > 0:
+        time.sleep(coarse / 1e9)
+        # longer sleeps can overshoot more, follow what is seen. Increases are
+        # limited, so a single preemption does not make later calls spin long.
+        overshoot = time.perf_counter_ns() - start - coarse
+        if overshoot > _sleep_slack_ns:
+            overshoot = min(overshoot, 2 * _sleep_slack_ns)
+            _sleep_slack_ns += (overshoot - _sleep_slack_ns) // 8
+        else:
+            _sleep_slack_ns -= (_sleep_slack_ns - overshoot) // 64
+    while time.perf_counter_ns() < end:
+        pass
+
+
+_package = chip_package(chip_id, board_id)
+
+if _package is not None:
+    pass
 elif chip_id == ap_chip.GENERIC_X86:
     print("WARNING: GENERIC_X86 is not fully supported. Some features may not work.")
 elif chip_id is None:
@@ -144,3 +74,12 @@ elif "sphinx" in sys.modules:
     pass
 else:
     raise NotImplementedError("Microcontroller not supported:", chip_id)
+
+
+def _add_pin(names):
+    """Provide the Pin class of the chip, unless the chip package has its own"""
+    names.setdefault("Pin", pin.Pin)
+
+
+# The chip package is only imported when one of its names is first used
+__getattr__, __dir__ = LazyNamespace(globals(), _package, _add_pin).functions()
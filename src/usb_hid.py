@@ -15,7 +15,11 @@ from typing import Sequence
 from pathlib import Path
 import os
 import atexit
+import select
 import sys
+import threading
+import time
+import warnings
 
 for module in ["dwc2", "libcomposite"]:
     if Path("/proc/modules").read_text(encoding="utf-8").find(module) == -1:
@@ -27,6 +31,8 @@ this = sys.modules[__name__]
 this.gadget_root = "/sys/kernel/config/usb_gadget/adafruit-blinka"
 this.boot_device = 0
 this.devices = []
+this.persist = False
+this.setup_time = 0.0
 
 
 class Device:
@@ -52,6 +58,7 @@ class Device:
         self.usage_page = usage_page
         self.descriptor = descriptor
         self._last_received_report = None
+        self._report_reader = None
 
     def send_report(self, report: bytearray, report_id: int = None):
         """Send an HID report. If the device descriptor specifies zero or one report id's,
@@ -81,6 +88,8 @@ class Device:
         The report ID may be omitted if there is no report ID, or only one report ID.
         Return `None` if nothing received.
         """
+        if self._report_reader is not None:
+            return self._last_received_report
         device_path = self.get_device_path(report_id or self.report_ids[0])
         with open(device_path, "rb+") as fd:
             os.set_blocking(fd.fileno(), False)
@@ -89,6 +98,25 @@ class Device:
                 self._last_received_report = report
         return self._last_received_report
 
+    def add_report_listener(self, callback=None) -> None:
+        """Blinka only: keep the hidg device open and receive HID OUT reports in a
+        background thread that sleeps in ``poll()`` until the host sends one.
+        ``get_last_received_report()`` then returns the cached report without any I/O.
+        If given, ``callback(report)`` is called from that thread whenever a report
+        differs from the previous one.
+        """
+        if self._report_reader is None:
+            self._report_reader = _ReportReader(self)
+        if callback is not None:
+            self._report_reader.callbacks.append(callback)
+
+    def remove_report_listener(self) -> None:
+        """Blinka only: stop the background reader started by
+        ``add_report_listener()``"""
+        if self._report_reader is not None:
+            self._report_reader.stop()
+            self._report_reader = None
+
     def get_device_path(self, report_id):
         """
         translates the /dev/hidg device from the report id
@@ -110,6 +138,62 @@ class Device:
     CONSUMER_CONTROL = None
 
 
+class _ReportReader:
+    """
+    reads HID OUT reports of a device in a daemon thread, blocking in poll()
+    on the open hidg fd and a wakeup pipe used to stop it
+    """
+
+    def __init__(self, device: Device) -> None:
+        self.device = device
+        self.callbacks = []
+        self._fd = os.open(
+            device.get_device_path(device.report_ids[0]), os.O_RDWR | os.O_NONBLOCK
+        )
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+        poller.register(self._wakeup_read, select.POLLIN)
+        length = max(self.device.out_report_lengths[0], 1)
+        try:
+            while True:
+                for fd, _ in poller.poll():
+                    if fd == self._wakeup_read:
+                        return
+                    try:
+                        report = os.read(self._fd, length)
+                    except BlockingIOError:
+                        continue
+                    if not report or report == self.device._last_received_report:
+                        continue
+                    self.device._last_received_report = report
+                    for callback in self.callbacks:
+                        # a failing callback must not end the thread, or the
+                        # cached report would go stale
+                        try:
+                            callback(report)
+                        except Exception as error:  # pylint: disable=broad-except
+                            warnings.warn(
+                                "HID report listener {!r} failed: {!r}".format(
+                                    callback, error
+                                ),
+                                RuntimeWarning,
+                            )
+        finally:
+            os.close(self._fd)
+            os.close(self._wakeup_read)
+
+    def stop(self) -> None:
+        """wakes the thread up and waits for it to close the device"""
+        os.write(self._wakeup_write, b"\0")
+        self._thread.join()
+        os.close(self._wakeup_write)
+
+
 Device.KEYBOARD = Device(
     descriptor=bytes(
         (
@@ -456,6 +540,129 @@ Device.BOOT_MOUSE = Device(
 )
 
 
+def _read_attr(path: Path):
+    """
+    reads a configfs attribute, returns None if it does not exist (yet)
+    """
+    try:
+        return path.read_bytes()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _attr_matches(current, value) -> bool:
+    """
+    compares the content of a configfs attribute with the desired value.
+    configfs echoes integers back in its own format (e.g. ``0x1d6b``), so
+    integers are compared numerically and everything else byte by byte
+    """
+    if current is None:
+        return False
+    if isinstance(value, (bytes, bytearray)):
+        return current == bytes(value)
+    if isinstance(value, int):
+        try:
+            return int(current.strip(), 0) == value
+        except ValueError:
+            return False
+    return current.decode("utf-8").strip() == value
+
+
+def _write_attr(path: Path, value) -> bool:
+    """
+    writes a configfs attribute, but only if its value differs from the desired one.
+    Returns True if something was written.
+    """
+    if _attr_matches(_read_attr(path), value):
+        return False
+    if isinstance(value, (bytes, bytearray)):
+        path.write_bytes(bytes(value))
+    else:
+        path.write_text("%s" % value, encoding="utf-8")
+    return True
+
+
+def _gadget_attributes():
+    """
+    the device level attributes of the gadget
+    """
+    return {
+        "bcdDevice": 1,  # Version 1.0.0
+        "bcdUSB": 0x0200,  # USB 2.0
+        "bDeviceClass": 0x00,  # multipurpose i guess?
+        "bDeviceProtocol": 0x00,
+        "bDeviceSubClass": 0x00,
+        "bMaxPacketSize0": 0x08,
+        "idProduct": 0x0104,  # Multifunction Composite Gadget
+        "idVendor": 0x1D6B,  # Linux Foundation
+    }
+
+
+def _config_attributes():
+    """
+    the attributes of the (single) configuration
+    """
+    return {
+        "strings/0x409/configuration": "my configuration",
+        "MaxPower": 150,
+        "bmAttributes": 0x080,
+    }
+
+
+def _function_attributes(requested_devices: Sequence[Device]):
+    """
+    the functions (one per report id) with their attributes, keyed by function name
+    """
+    functions = {}
+    for device in requested_devices:
+        for report_index, report_id in enumerate(device.report_ids):
+            name = "hid.usb%s" % report_id
+            if name in functions:
+                continue
+            functions[name] = {
+                "protocol": report_id,
+                "report_length": device.in_report_lengths[report_index],
+                "subclass": 1,
+                "report_desc": device.descriptor,
+            }
+    return functions
+
+
+def _gadget_is_current(functions, udc_name: str) -> bool:
+    """
+    checks whether the gadget in configfs already matches the requested
+    configuration and is bound to the UDC, without touching anything
+    """
+    gadget_root = Path(this.gadget_root)
+    config_root = gadget_root / "configs/device.1"
+    if not _attr_matches(_read_attr(gadget_root / "UDC"), udc_name):
+        return False
+    for attr, value in _gadget_attributes().items():
+        if not _attr_matches(_read_attr(gadget_root / attr), value):
+            return False
+    for attr, value in _config_attributes().items():
+        if not _attr_matches(_read_attr(config_root / attr), value):
+            return False
+    existing = {path.name for path in gadget_root.glob("functions/hid.usb*")}
+    linked = {path.name for path in config_root.glob("hid.usb*")}
+    if existing != set(functions) or linked != set(functions):
+        return False
+    return all(
+        _function_is_current(gadget_root / "functions" / name, attributes)
+        for name, attributes in functions.items()
+    )
+
+
+def _function_is_current(function_root: Path, attributes) -> bool:
+    """
+    checks whether all attributes of a function already have the requested values
+    """
+    return all(
+        _attr_matches(_read_attr(function_root / attr), value)
+        for attr, value in attributes.items()
+    )
+
+
 def disable() -> None:
     """Do not present any USB HID devices to the host computer.
     Can be called in ``boot.py``, before USB is connected.
@@ -464,37 +671,44 @@ def disable() -> None:
     it is disabled by default. You must turn off another USB device such
     as `usb_cdc` or `storage` to free up endpoints for use by `usb_hid`.
     """
+    for device in this.devices:
+        device.remove_report_listener()
+    gadget_root = Path(this.gadget_root)
     try:
-        Path("%s/UDC" % this.gadget_root).write_text("", encoding="utf-8")
+        (gadget_root / "UDC").write_text("", encoding="utf-8")
     except FileNotFoundError:
         pass
-    for symlink in Path(this.gadget_root).glob("configs/**/hid.usb*"):
-        symlink.unlink()
-
-    for strings_file in Path(this.gadget_root).rglob("configs/*/strings/*/*"):
-        if strings_file.is_dir():
-            strings_file.rmdir()
-
-    for strings_file in Path(this.gadget_root).rglob("configs/*/strings/*"):
-        if strings_file.is_dir():
-            strings_file.rmdir()
-    for config_dir in Path(this.gadget_root).rglob("configs/*"):
-        if config_dir.is_dir():
-            config_dir.rmdir()
-    for function_dir in Path(this.gadget_root).rglob("functions/*"):
-        if function_dir.is_dir():
-            function_dir.rmdir()
+    # the layout is fixed (see enable()), so it can be removed leaves first
+    # without walking the whole tree
+    for config_dir in gadget_root.glob("configs/*"):
+        for symlink in config_dir.glob("hid.usb*"):
+            symlink.unlink()
+        for strings_dir in config_dir.glob("strings/*"):
+            strings_dir.rmdir()
+        config_dir.rmdir()
+    for function_dir in gadget_root.glob("functions/*"):
+        function_dir.rmdir()
     try:
-        Path(this.gadget_root).rmdir()
+        gadget_root.rmdir()
     except FileNotFoundError:
         pass
     this.devices = []
 
 
-atexit.register(disable)
+def _disable_at_exit() -> None:
+    """
+    tears the gadget down on interpreter exit, unless it was enabled with ``persist=True``
+    """
+    if not this.persist:
+        disable()
+
 
+atexit.register(_disable_at_exit)
 
-def enable(requested_devices: Sequence[Device], boot_device: int = 0) -> None:
+
+def enable(
+    requested_devices: Sequence[Device], boot_device: int = 0, *, persist: bool = False
+) -> None:
     """Specify which USB HID devices that will be available.
     Can be called in ``boot.py``, before USB is connected.
 
@@ -507,6 +721,9 @@ def enable(requested_devices: Sequence[Device], boot_device: int = 0) -> None:
       If ``boot_device=1``, a boot keyboard is available.
       If ``boot_device=2``, a boot mouse is available. No other values are allowed.
       See below.
+    :param bool persist: Blinka only. If True, the gadget is left in place when the
+      interpreter exits, so the next ``enable()`` with the same devices finds it
+      already configured and bound, and the host does not re-enumerate.
 
     If you enable too many devices at once, you will run out of USB endpoints.
     The number of available endpoints varies by microcontroller.
@@ -536,11 +753,19 @@ def enable(requested_devices: Sequence[Device], boot_device: int = 0) -> None:
     (CIRCUITPY).
     If you specify a non-zero ``boot_device``, and it is not the first device, CircuitPython
     will enter safe mode to report this error.
+
+    On Blinka the configfs tree is compared with the requested configuration first,
+    and only the attributes that differ are written. If nothing differs and the gadget
+    is still bound, the UDC is not touched at all. The time spent is stored in
+    ``usb_hid.setup_time`` (seconds).
     """
+    start = time.monotonic()
     this.boot_device = boot_device
+    this.persist = persist
 
     if len(requested_devices) == 0:
         disable()
+        this.setup_time = time.monotonic() - start
         return
 
     if boot_device == 1:
@@ -548,6 +773,27 @@ def enable(requested_devices: Sequence[Device], boot_device: int = 0) -> None:
     if boot_device == 2:
         requested_devices = [Device.BOOT_MOUSE]
 
+    this.devices = list(requested_devices)
+    functions = _function_attributes(requested_devices)
+    udc = next(Path("/sys/class/udc/").glob("*"))
+    if _gadget_is_current(functions, udc.name):
+        this.setup_time = time.monotonic() - start
+        return
+
+    gadget_root = Path(this.gadget_root)
+    config_root = gadget_root / "configs/device.1"
+    # function attributes can not be changed while the gadget is bound, nor
+    # while the function is linked into a configuration (f_hid answers EBUSY),
+    # so unbind first and unlink the functions that are removed or changed
+    bound_udc = _read_attr(gadget_root / "UDC")
+    if bound_udc and bound_udc.strip():
+        (gadget_root / "UDC").write_text("", encoding="utf-8")
+    for symlink in config_root.glob("hid.usb*"):
+        if symlink.name not in functions or not _function_is_current(
+            gadget_root / "functions" / symlink.name, functions[symlink.name]
+        ):
+            symlink.unlink()
+
     # """
     # 1. Creating the gadgets
     # -----------------------
@@ -583,32 +829,10 @@ def enable(requested_devices: Sequence[Device], boot_device: int = 0) -> None:
     #     $ echo <manufacturer> > strings/0x409/manufacturer
     #     $ echo <product> > strings/0x409/product
     # """
-    Path("%s/functions" % this.gadget_root).mkdir(parents=True, exist_ok=True)
-    Path("%s/configs" % this.gadget_root).mkdir(parents=True, exist_ok=True)
-    Path("%s/bcdDevice" % this.gadget_root).write_text(
-        "%s" % 1, encoding="utf-8"
-    )  # Version 1.0.0
-    Path("%s/bcdUSB" % this.gadget_root).write_text(
-        "%s" % 0x0200, encoding="utf-8"
-    )  # USB 2.0
-    Path("%s/bDeviceClass" % this.gadget_root).write_text(
-        "%s" % 0x00, encoding="utf-8"
-    )  # multipurpose i guess?
-    Path("%s/bDeviceProtocol" % this.gadget_root).write_text(
-        "%s" % 0x00, encoding="utf-8"
-    )
-    Path("%s/bDeviceSubClass" % this.gadget_root).write_text(
-        "%s" % 0x00, encoding="utf-8"
-    )
-    Path("%s/bMaxPacketSize0" % this.gadget_root).write_text(
-        "%s" % 0x08, encoding="utf-8"
-    )
-    Path("%s/idProduct" % this.gadget_root).write_text(
-        "%s" % 0x0104, encoding="utf-8"
-    )  # Multifunction Composite Gadget
-    Path("%s/idVendor" % this.gadget_root).write_text(
-        "%s" % 0x1D6B, encoding="utf-8"
-    )  # Linux Foundation
+    (gadget_root / "functions").mkdir(parents=True, exist_ok=True)
+    (gadget_root / "configs").mkdir(parents=True, exist_ok=True)
+    for attr, value in _gadget_attributes().items():
+        _write_attr(gadget_root / attr, value)
     # """
     # 2. Creating the configurations
     # ------------------------------
@@ -640,17 +864,16 @@ def enable(requested_devices: Sequence[Device], boot_device: int = 0) -> None:
     #
     #     $ echo 120 > configs/c.1/MaxPower
     #     """
+    (config_root / "strings/0x409").mkdir(parents=True, exist_ok=True)
+    for attr, value in _config_attributes().items():
+        _write_attr(config_root / attr, value)
 
-    for device in requested_devices:
-        config_root = "%s/configs/device.1" % this.gadget_root
-        Path("%s/" % config_root).mkdir(parents=True, exist_ok=True)
-        Path("%s/strings/0x409" % config_root).mkdir(parents=True, exist_ok=True)
-        Path("%s/strings/0x409/configuration" % config_root).write_text(
-            "my configuration", encoding="utf-8"
-        )
-        Path("%s/MaxPower" % config_root).write_text("150", encoding="utf-8")
-        Path("%s/bmAttributes" % config_root).write_text("%s" % 0x080, encoding="utf-8")
-        this.devices.append(device)
+    # functions that are no longer requested are removed, they are unlinked above
+    for function_dir in gadget_root.glob("functions/hid.usb*"):
+        if function_dir.name not in functions:
+            function_dir.rmdir()
+
+    for name, attributes in functions.items():
         # """
         # 3. Creating the functions
         # -------------------------
@@ -673,41 +896,29 @@ def enable(requested_devices: Sequence[Device], boot_device: int = 0) -> None:
         # or read-write access. Where applicable they need to be written to as
         # appropriate.
         # Please refer to Documentation/ABI/*/configfs-usb-gadget* for more information.  """
-        for report_index, report_id in enumerate(device.report_ids):
-            function_root = "%s/functions/hid.usb%s" % (this.gadget_root, report_id)
-            try:
-                Path("%s/" % function_root).mkdir(parents=True)
-            except FileExistsError:
-                continue
-            Path("%s/protocol" % function_root).write_text(
-                "%s" % report_id, encoding="utf-8"
-            )
-            Path("%s/report_length" % function_root).write_text(
-                "%s" % device.in_report_lengths[report_index], encoding="utf-8"
-            )
-            Path("%s/subclass" % function_root).write_text("%s" % 1, encoding="utf-8")
-            Path("%s/report_desc" % function_root).write_bytes(device.descriptor)
-            # """
-            # 4. Associating the functions with their configurations
-            # ------------------------------------------------------
-            #
-            # At this moment a number of gadgets is created, each of which has a number of
-            # configurations specified and a number of functions available. What remains
-            # is specifying which function is available in which configuration (the same
-            # function can be used in multiple configurations). This is achieved with
-            # creating symbolic links::
-            #
-            #     $ ln -s functions/<name>.<instance name> configs/<name>.<number>
-            #
-            # e.g.::
-            #
-            #     $ ln -s functions/ncm.usb0 configs/c.1  """
-            try:
-                Path("%s/hid.usb%s" % (config_root, report_id)).symlink_to(
-                    function_root
-                )
-            except FileNotFoundError:
-                pass
+        function_root = gadget_root / "functions" / name
+        function_root.mkdir(parents=True, exist_ok=True)
+        for attr, value in attributes.items():
+            _write_attr(function_root / attr, value)
+        # """
+        # 4. Associating the functions with their configurations
+        # ------------------------------------------------------
+        #
+        # At this moment a number of gadgets is created, each of which has a number of
+        # configurations specified and a number of functions available. What remains
+        # is specifying which function is available in which configuration (the same
+        # function can be used in multiple configurations). This is achieved with
+        # creating symbolic links::
+        #
+        #     $ ln -s functions/<name>.<instance name> configs/<name>.<number>
+        #
+        # e.g.::
+        #
+        #     $ ln -s functions/ncm.usb0 configs/c.1  """
+        try:
+            (config_root / name).symlink_to(function_root)
+        except (FileExistsError, FileNotFoundError):
+            pass
     # """ 5. Enabling the gadget
     # ----------------------
     # Such a gadget must be finally enabled so that the USB host can enumerate it.
@@ -721,5 +932,5 @@ def enable(requested_devices: Sequence[Device], boot_device: int = 0) -> None:
     # e.g.::
     #
     # $ echo s3c-hsotg > UDC  """
-    udc = next(Path("/sys/class/udc/").glob("*"))
-    Path("%s/UDC" % this.gadget_root).write_text("%s" % udc.name, encoding="utf-8")
+    (gadget_root / "UDC").write_text("%s" % udc.name, encoding="utf-8")
+    this.setup_time = time.monotonic() - start